@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""스크립트 분석 디스크 캐시 벤치마크.
+
+합성 스킬 N개(고유 스크립트 M개 + 모든 스킬이 같은 vendored helper 하나)에 대해
+L5/L6 평가를 실행한다. 매 실행은 새 프로세스처럼 메모리 캐시를 비우고 시작한다.
+
+- no cache: 디스크 캐시 없음 (스킬 간 중복 helper는 메모리 캐시로만 1회 분석)
+- cold:     빈 SQLite 캐시 — 분석 + 쓰기 비용
+- warm:     같은 캐시로 재실행 — 파일 변경 없음, 파싱 0회
+
+사용:
+    python benchmarks/perf/bench_analysis_cache.py
+    python benchmarks/perf/bench_analysis_cache.py --skills 200 --scripts 10
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from analysis_cache import AnalysisCache
+from ast_features import FEATURES
+from discovery import parse_skill_md
+from evaluators import l5_execution, l6_validation
+
+_HELPER = '"""vendored helper."""\n\n' + "".join(
+    f"def helper_{k}(x: int) -> int:\n    \"\"\"도움 함수.\"\"\"\n    return x + {k} if x else {k}\n\n"
+    for k in range(200)
+)
+
+
+def _script(s: int, i: int) -> str:
+    return (
+        f'#!/usr/bin/env python3\n"""스킬 {s} 도구 {i}."""\n\nimport argparse\nimport sys\n\n'
+        + "".join(
+            f"def step_{k}(value: int) -> int:\n"
+            "    try:\n"
+            "        return value * 2 if value > 0 and value < 100 else value\n"
+            "    except (ValueError, TypeError):\n"
+            "        sys.exit(1)\n\n"
+            for k in range(30)
+        )
+        + "parser = argparse.ArgumentParser()\nparser.add_argument('--verify')\n"
+    )
+
+
+def _make_skill_dirs(root: Path, n: int, m: int):
+    dirs = []
+    for s in range(n):
+        skill_dir = root / f"skill-{s:04d}"
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{s:04d}\ndescription: generated\n---\n# Body\n", encoding="utf-8"
+        )
+        (skill_dir / "scripts" / "vendored_helper.py").write_text(_HELPER, encoding="utf-8")
+        for i in range(m):
+            (skill_dir / "scripts" / f"tool_{i}.py").write_text(_script(s, i), encoding="utf-8")
+        dirs.append(skill_dir)
+    return dirs
+
+
+def _run(skill_dirs, cache_path):
+    FEATURES.clear()
+    start = time.perf_counter()
+    FEATURES.attach(AnalysisCache(cache_path) if cache_path else None)
+    for skill_dir in skill_dirs:
+        skill = parse_skill_md(skill_dir)
+        l5_execution.evaluate(skill)
+        l6_validation.evaluate(skill)
+        FEATURES.flush()
+    store = FEATURES.store
+    FEATURES.attach(None)
+    elapsed = time.perf_counter() - start
+    return elapsed, FEATURES.misses - (store.hits if store is not None else 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="persistent script analysis cache benchmark")
+    parser.add_argument("--skills", type=int, default=100)
+    parser.add_argument("--scripts", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        skill_dirs = _make_skill_dirs(root / "skills", args.skills, args.scripts)
+        cache_path = root / "analysis_cache.sqlite"
+        rows = [("no cache", None), ("cold", cache_path), ("warm", cache_path)]
+        print(f"skills={args.skills} scripts/skill={args.scripts}+1 shared helper")
+        print(f"{'mode':>9} {'time(s)':>8} {'parsed':>7}")
+        for label, path in rows:
+            elapsed, parsed = _run(skill_dirs, path)
+            print(f"{label:>9} {elapsed:>8.3f} {parsed:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
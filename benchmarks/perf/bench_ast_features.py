@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""스크립트 특징 추출 벤치마크.
+
+합성 스크립트 N개에 대해 L5/L6가 보던 특징(모듈 docstring, 함수 docstring/타입
+힌트, cyclomatic complexity, argparse, try/except, sys.exit)을 구한다. 이전
+방식(정규식/부분 문자열 여러 번 + ast.parse + 함수마다 ast.walk)과
+ast_features의 단일 순회, 같은 내용 재평가 시의 해시 캐시를 비교한다.
+
+사용:
+    python benchmarks/perf/bench_ast_features.py
+    python benchmarks/perf/bench_ast_features.py --scripts 2000 --functions 60
+"""
+
+import argparse
+import ast
+import re
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from ast_features import FeatureCache
+
+
+# ── 이전 구현 (비교용) ──
+
+_FUNC = re.compile(r'^(\s*)def\s+(\w+)\s*\(([^)]*)\)(\s*->\s*\S+)?:', re.MULTILINE)
+
+
+def _legacy_cc(node):
+    complexity = 1
+    for child in ast.walk(node):
+        if isinstance(child, (ast.If, ast.For, ast.While, ast.ExceptHandler, ast.Assert, ast.IfExp)):
+            complexity += 1
+        elif isinstance(child, ast.BoolOp):
+            complexity += len(child.values) - 1
+    return complexity
+
+
+def _legacy(content: str):
+    c = content.lstrip()
+    if c.startswith("#!"):
+        c = c.split("\n", 1)[-1].lstrip()
+    doc = c.startswith('"""') or c.startswith("'''")
+    funcs = 0
+    for match in _FUNC.finditer(content):
+        funcs += 1
+        content[match.end():match.end() + 200].lstrip().startswith('"""')
+    argparse_used = "argparse" in content or "ArgumentParser" in content
+    has_help = "--help" in content or "add_argument" in content
+    has_try = "try:" in content
+    specific = bool(re.search(r'except\s+\w+', content))
+    has_exit = "sys.exit" in content
+    verify = bool(re.search(r'--verify|--check|--validate', content))
+    tree = ast.parse(content)
+    ccs = [_legacy_cc(n) for n in ast.walk(tree) if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    return doc, funcs, argparse_used, has_help, has_try, specific, has_exit, verify, ccs
+
+
+def _make_script(i: int, functions: int) -> str:
+    body = [f'#!/usr/bin/env python3\n"""생성 스크립트 {i}."""\n\nimport argparse\nimport sys\n']
+    for k in range(functions):
+        body.append(
+            f"\n\ndef handler_{i}_{k}(value: int,\n                 flag: bool = False) -> int:\n"
+            f'    """핸들러 {k}."""\n'
+            "    try:\n"
+            "        if value > 0 and flag:\n"
+            "            return value * 2 if value < 100 else value\n"
+            "        for _ in range(value):\n"
+            "            value -= 1\n"
+            "    except (ValueError, TypeError):\n"
+            "        sys.exit(1)\n"
+            "    return value\n"
+        )
+    body.append("\n\nparser = argparse.ArgumentParser()\nparser.add_argument('--verify')\n")
+    return "".join(body)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AST feature extraction benchmark")
+    parser.add_argument("--scripts", type=int, default=500)
+    parser.add_argument("--functions", type=int, default=30)
+    args = parser.parse_args()
+
+    sources = [_make_script(i, args.functions) for i in range(args.scripts)]
+    cache = FeatureCache(maxsize=args.scripts)
+
+    t_legacy = _timed(lambda: [_legacy(s) for s in sources])
+    t_cold = _timed(lambda: [cache.features(s) for s in sources])
+    t_warm = _timed(lambda: [cache.features(s) for s in sources])
+
+    print(f"scripts={args.scripts} functions/script={args.functions}")
+    print(f"{'mode':>14} {'time(s)':>8} {'speedup':>8}")
+    for label, t in (("legacy", t_legacy), ("features", t_cold), ("features+cache", t_warm)):
+        print(f"{label:>14} {t:>8.3f} {t_legacy / t:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
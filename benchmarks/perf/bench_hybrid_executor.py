@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""레이어 자원 분류별 실행 풀 벤치마크 (스레드 + 프로세스 하이브리드).
+
+스킬 N개의 스킬 단위 레이어(L1/L3/L4/L5/L6)를 workers개 프로세스로 평가한다.
+
+- process: 이전 방식 — 모든 레이어를 프로세스 풀에서 (I/O 대기 중에도 프로세스 점유)
+- hybrid:  orchestrator — RESOURCE_IO 레이어는 스레드 풀, RESOURCE_CPU 레이어는 프로세스 풀에서 동시에
+
+기본은 I/O 레이어를 sleep(파일 대기, GIL 해제), CPU 레이어를 바쁜 루프로 대체해
+자원 분류에 따른 배치 효과만 잰다. --real이면 실제 evaluator를 쓴다.
+
+사용:
+    python benchmarks/perf/bench_hybrid_executor.py
+    python benchmarks/perf/bench_hybrid_executor.py --workers 8 --io-threads 32 --skills 400
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import orchestrator
+from discovery import discover_skills
+from evaluators import LAYER_RESOURCES, LAYERS, RESOURCE_IO
+from models import LayerResult
+from scheduler import DEFAULT_IO_WAIT, auto_workers
+
+PER_SKILL_LAYERS = ["L1", "L3", "L4", "L5", "L6"]
+# 시뮬레이션 레이어 비용 (초)
+_SIM_IO_WAIT = 0.01
+_SIM_CPU = 0.004
+
+
+def _simulated(layer_id):
+    def _evaluate(skill, **kwargs):
+        if LAYER_RESOURCES[layer_id] == RESOURCE_IO:
+            time.sleep(_SIM_IO_WAIT)
+        else:
+            deadline = time.thread_time() + _SIM_CPU
+            while time.thread_time() < deadline:
+                pass
+        return LayerResult(layer=layer_id, skill_name=skill.name)
+    return _evaluate
+
+
+def _make_skills(root: Path, n: int):
+    for s in range(n):
+        skill_dir = root / f"skill-{s:04d}"
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "references").mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{s:04d}\ndescription: 생성 스킬\n---\n# Body\n\n## 사용법\n\n1. 실행\n",
+            encoding="utf-8",
+        )
+        body = "".join(f"def f_{i}(x):\n    try:\n        return x + {i}\n    except ValueError:\n        return 0\n"
+                       for i in range(40))
+        (skill_dir / "scripts" / "main.py").write_text(f'"""도구."""\n{body}', encoding="utf-8")
+        (skill_dir / "references" / "guide.md").write_text("# 가이드\n" + "본문\n" * 200, encoding="utf-8")
+
+
+def _timed(skills, workers, io_threads):
+    start = time.perf_counter()
+    orchestrator._collect_results_streaming(
+        iter(skills), PER_SKILL_LAYERS, None, False, workers, io_threads=io_threads,
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="hybrid thread/process executor benchmark")
+    parser.add_argument("--skills", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4, help="process pool size")
+    parser.add_argument("--io-threads", type=int, default=None,
+                        help="thread pool size for I/O layers (default: --workers auto sizing)")
+    parser.add_argument("--real", action="store_true", help="use real evaluators instead of sleep/busy loops")
+    args = parser.parse_args()
+    io_threads = args.io_threads or auto_workers(DEFAULT_IO_WAIT, cpu_count=args.workers)[1]
+
+    if not args.real:
+        # fork로 시작하는 워커는 이 패치를 물려받는다
+        orchestrator.LAYERS = {lid: _simulated(lid) for lid in LAYERS}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _make_skills(root, args.skills)
+        skills = discover_skills(root)
+
+        print(f"skills={len(skills)} workers={args.workers} io_threads={io_threads} "
+              f"mode={'real' if args.real else 'simulated'}")
+        t_old = _timed(skills, args.workers, 1)
+        t_new = _timed(skills, args.workers, io_threads)
+        print(f"{'process':>8} {t_old:>8.3f}s")
+        print(f"{'hybrid':>8} {t_new:>8.3f}s  ({t_old / t_new:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
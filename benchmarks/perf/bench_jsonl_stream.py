@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""--format json vs --format jsonl 출력 벤치마크 (첫 출력까지 시간, 메모리 피크).
+
+합성 스킬 N개를 orchestrator.run으로 평가해 출력 파일에 쓴다.
+
+- json:  전체 결과 dict를 모은 뒤 리포트 문자열을 한 번에 만들어 쓴다
+- jsonl: 스킬 평가 단위가 끝날 때마다 한 줄씩 쓰고 flush, 점수만 보관
+
+tracemalloc 피크와 출력 파일에 첫 바이트가 나타난 시각을 잰다 (출력 파일을
+감시하는 스레드로 측정).
+
+사용:
+    python benchmarks/perf/bench_jsonl_stream.py
+    python benchmarks/perf/bench_jsonl_stream.py --skills 5000 --layers L1,L3,L4
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from argparse import Namespace
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from orchestrator import run
+
+
+def _make_skills(root: Path, n: int):
+    for s in range(n):
+        skill_dir = root / f"skill-{s:05d}"
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{s:05d}\ndescription: 생성 스킬. 트리거: 작업{s}, 공통{s % 50}\n---\n"
+            "# Body\n\n## 사용법\n\n1. 실행\n2. 확인\n",
+            encoding="utf-8",
+        )
+        (skill_dir / "scripts" / "main.py").write_text(
+            '"""도구."""\nimport sys\n\ndef main():\n    try:\n        return 0\n    except ValueError:\n'
+            "        sys.exit(1)\n",
+            encoding="utf-8",
+        )
+
+
+def _args(root: Path, config_path: Path, fmt: str, output: Path, layers: str) -> Namespace:
+    return Namespace(
+        skills_root=root, skill=None, layer=layers, format=fmt, output=output,
+        ci_mode=False, threshold=None, config=config_path, benchmarks=None,
+        ecosystem=False, save_history=False, diff=None, show_history=False,
+        workers=1, io_workers=None, discovery_workers=1, discovery_index=None, max_depth=1,
+        ignore=None, rev=None, max_file_size=16, analysis_cache=None,
+        result_cache=None, changed_since=None, layer_timings=None, layer_timeout=None,
+        skill_timeout=None, fail_fast=False,
+    )
+
+
+def _measure(args):
+    """(전체 초, 첫 출력까지 초, tracemalloc 피크 MB)."""
+    first = []
+    done = threading.Event()
+    start = time.perf_counter()
+
+    def _watch():
+        while not done.is_set():
+            if args.output.exists() and args.output.stat().st_size > 0:
+                first.append(time.perf_counter() - start)
+                return
+            time.sleep(0.005)
+
+    watcher = threading.Thread(target=_watch, daemon=True)
+    watcher.start()
+    tracemalloc.start()
+    run(args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    total = time.perf_counter() - start
+    done.set()
+    watcher.join()
+    return total, first[0] if first else total, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="json vs jsonl report benchmark")
+    parser.add_argument("--skills", type=int, default=2000)
+    parser.add_argument("--layers", default="L1,L3,L4,L5,L6", help="comma-separated layers")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "skills"
+        _make_skills(root, args.skills)
+        config_path = Path(tmp) / "config.json"
+        layer_ids = args.layers.split(",")
+        config_path.write_text(json.dumps({"layer_weights": {lid: 1.0 for lid in layer_ids}}), encoding="utf-8")
+
+        print(f"skills={args.skills} layers={args.layers}")
+        print(f"{'format':>6} {'total(s)':>9} {'first(s)':>9} {'peak(MB)':>9}")
+        for fmt in ("json", "jsonl"):
+            output = Path(tmp) / f"report.{fmt}"
+            total, first, peak = _measure(_args(root, config_path, fmt, output, args.layers))
+            print(f"{fmt:>6} {total:>9.2f} {first:>9.2f} {peak:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
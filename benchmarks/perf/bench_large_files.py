@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""큰 스크립트 파일 스캔 벤치마크.
+
+합성 스킬 하나에 생성 코드 같은 큰 scripts/*.py 파일을 두고 L1/L5/L6의 정규식
+검사(resource_independence, shebang, cli_interface, docstrings,
+verification_infra, error_handling)를 실행한다. 전체 read_text() 방식
+(MMAP_THRESHOLD를 무한대로)과 mmap 버퍼 방식, 크기 제한 적용을 비교한다.
+메모리는 tracemalloc 최대치(파이썬 할당만, mmap 페이지 제외)다.
+
+사용:
+    python benchmarks/perf/bench_large_files.py
+    python benchmarks/perf/bench_large_files.py --files 4 --size-mb 32 --cap-mb 16
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import file_access
+from discovery import parse_skill_md
+from evaluators.l1_structural import check_resource_independence
+from evaluators.l5_execution import check_cli_interface, check_docstrings, check_shebang
+from evaluators.l6_validation import check_error_handling, check_verification_infra
+
+CHECKS = (
+    check_resource_independence, check_shebang, check_cli_interface,
+    check_docstrings, check_verification_infra, check_error_handling,
+)
+
+
+def _make_skill(root: Path, files: int, size_mb: int) -> Path:
+    skill_dir = root / "big-skill"
+    scripts = skill_dir / "scripts"
+    scripts.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: big-skill\ndescription: generated\n---\n# Body\n", encoding="utf-8"
+    )
+    line = "TABLE_ENTRY = {'key': 'value', 'n': 12345}  # generated\n"
+    body = line * (size_mb * 1024 * 1024 // len(line))
+    for i in range(files):
+        (scripts / f"generated_{i}.py").write_text(
+            f'#!/usr/bin/env python3\n"""생성 파일 {i}."""\n{body}', encoding="utf-8"
+        )
+    return skill_dir
+
+
+def _run(skill_dir: Path, threshold: int, cap: int):
+    file_access.MMAP_THRESHOLD = threshold
+    file_access.set_max_file_size(cap)
+    skill = parse_skill_md(skill_dir)
+    tracemalloc.start()
+    start = time.perf_counter()
+    for check in CHECKS:
+        check(skill)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="large script file scan benchmark")
+    parser.add_argument("--files", type=int, default=3)
+    parser.add_argument("--size-mb", type=int, default=8)
+    parser.add_argument("--cap-mb", type=int, default=4, help="size cap for the mmap+cap row")
+    args = parser.parse_args()
+
+    default_threshold = file_access.MMAP_THRESHOLD
+    with tempfile.TemporaryDirectory() as tmp:
+        skill_dir = _make_skill(Path(tmp), args.files, args.size_mb)
+        rows = [
+            ("read_text", float("inf"), 0),
+            ("mmap", default_threshold, 0),
+            ("mmap+cap", default_threshold, args.cap_mb * 1024 * 1024),
+        ]
+        print(f"files={args.files} size={args.size_mb}MB")
+        print(f"{'mode':>10} {'time(s)':>8} {'peak(MB)':>9}")
+        for label, threshold, cap in rows:
+            elapsed, peak = _run(skill_dir, threshold, cap)
+            print(f"{label:>10} {elapsed:>8.3f} {peak / (1024 * 1024):>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""SKILL.md 파싱 최악 케이스 벤치마크 (50k줄).
+
+이전 파서(줄 split 여러 번 + DOTALL 코드 블록 regex + 백트래킹하는 트리거
+regex)와 markdown_scan.scan_markdown을 같은 문서에서 비교한다. scan은
+오프셋만 만드는 시간, scan+slice는 섹션/코드 블록 문자열까지 잘라내 이전
+파서와 같은 결과를 만드는 시간이다 (결과 일치도 검사).
+
+시나리오:
+  - typical: 섹션/코드 블록/체크리스트가 섞인 평범한 문서
+  - trigger_headers: 목록 없는 "## 트리거" 헤더 반복 (이전 regex가 헤더마다
+    문서 끝까지 훑고 되돌아와 O(n²))
+  - unclosed_fences: 닫히지 않는 ``` 반복
+
+사용:
+    python benchmarks/perf/bench_markdown_scan.py
+    python benchmarks/perf/bench_markdown_scan.py --lines 10000 --skip-legacy
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from discovery import _triggers_from_list
+from markdown_scan import scan_markdown
+
+
+# ── 이전 구현 (비교용) ──
+
+def _legacy_parse(text: str):
+    lines = text.split("\n")
+    body_start = 0
+    if lines and lines[0].strip() == "---":
+        for i, line in enumerate(lines[1:], 1):
+            if line.strip() == "---":
+                body_start = i + 1
+                break
+    body = "\n".join(lines[body_start:])
+
+    sections = {}
+    header, current = None, []
+    for line in body.split("\n"):
+        if line.startswith("## "):
+            if header is not None:
+                sections[header] = "\n".join(current)
+            header, current = line[3:].strip(), []
+        elif header is not None:
+            current.append(line)
+    if header is not None:
+        sections[header] = "\n".join(current)
+
+    blocks = re.compile(r'```(\w*)\n(.*?)```', re.DOTALL).findall(body)
+    checklist = re.findall(r'- \[[ x]\]', text)
+    match = re.search(r'##\s*트리거\s*\n(?:(?![-*]\s).*\n)*((?:[-*]\s*.+\n?)+)', body, re.MULTILINE)
+    triggers = _triggers_from_list(match.group(1)) if match else []
+    return sections, blocks, len(checklist), triggers
+
+
+def _new_parse(text: str):
+    scan = scan_markdown(text)
+    sections = {h: text[s:e] for h, s, e in scan.sections}
+    blocks = [(lang, text[s:e]) for lang, s, e in scan.code_blocks]
+    triggers = _triggers_from_list(text[slice(*scan.trigger_span)]) if scan.trigger_span else []
+    return sections, blocks, len(scan.checklist), triggers
+
+
+def _make_doc(kind: str, lines: int) -> str:
+    head = "---\nname: big\ndescription: 큰 문서\n---\n"
+    if kind == "typical":
+        chunk = [
+            "## Section", "설명 문장입니다. Run the tool.", "- [ ] 점검 항목", "- [x] 완료 항목",
+            "```python", "print('x')", "```", "",
+        ]
+    elif kind == "trigger_headers":
+        chunk = ["## 트리거", "목록이 아닌 설명 줄"]
+    else:
+        chunk = ["```python", "code line"]
+    body = (chunk * (lines // len(chunk) + 1))[:lines]
+    return head + "\n".join(body) + "\n"
+
+
+def _timed(fn, text):
+    start = time.perf_counter()
+    value = fn(text)
+    return time.perf_counter() - start, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SKILL.md markdown scan benchmark")
+    parser.add_argument("--lines", type=int, default=50000)
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the single-pass scanner")
+    args = parser.parse_args()
+
+    print(f"lines={args.lines}")
+    print(f"{'scenario':>16} {'legacy(s)':>10} {'scan(s)':>9} {'scan+slice(s)':>14} {'speedup':>8}")
+    for kind in ("typical", "trigger_headers", "unclosed_fences"):
+        text = _make_doc(kind, args.lines)
+        t_scan, _ = _timed(scan_markdown, text)
+        t_new, new = _timed(_new_parse, text)
+        if args.skip_legacy:
+            print(f"{kind:>16} {'skipped':>10} {t_scan:>9.3f} {t_new:>14.3f} {'-':>8}")
+            continue
+        t_old, old = _timed(_legacy_parse, text)
+        if old != new:
+            print(f"mismatch in scenario {kind}", file=sys.stderr)
+            return 1
+        print(f"{kind:>16} {t_old:>10.3f} {t_scan:>9.3f} {t_new:>14.3f} {t_old / t_scan:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
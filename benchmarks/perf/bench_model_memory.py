@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""결과 모델 메모리/피클 크기 벤치마크.
+
+스킬 N개 × 6 레이어 × 메트릭 6개의 결과 그래프를 만들어, 이전 모델 레이아웃
+(인스턴스 dict를 갖는 일반 dataclass, list 파일 목록, intern하지 않은 문자열)과
+현재 models.py(slots/frozen, intern, tuple 파일 목록)의 tracemalloc 피크와
+pickle 크기를 비교한다.
+
+사용:
+    python benchmarks/perf/bench_model_memory.py
+    python benchmarks/perf/bench_model_memory.py --skills 1000
+"""
+
+import argparse
+import gc
+import pickle
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from models import LayerResult, MetricResult, SkillMetadata, TriggerInfo
+
+
+# ── 이전 레이아웃 (비교용) ──
+
+@dataclass
+class LegacyTriggerInfo:
+    keywords: List[str]
+    source: str
+
+
+@dataclass
+class LegacySkillMetadata:
+    name: str
+    description: str
+    skill_path: Path
+    triggers: LegacyTriggerInfo
+    script_files: List[str] = field(default_factory=list)
+    reference_files: List[str] = field(default_factory=list)
+
+
+@dataclass
+class LegacyMetricResult:
+    name: str
+    score: float
+    max_score: float
+    details: str
+    passed: bool = True
+
+
+@dataclass
+class LegacyLayerResult:
+    layer: str
+    skill_name: str
+    metrics: List[LegacyMetricResult] = field(default_factory=list)
+    overall_score: float = 0.0
+    recommendations: List[str] = field(default_factory=list)
+
+
+LAYERS = ("L1", "L2", "L3", "L4", "L5", "L6")
+METRICS = ("yaml_validity", "directory_structure", "resource_independence",
+           "trigger_count", "trigger_specificity", "trigger_overlap")
+DETAILS = ("references/ 없음", "벤치마크 없음 (benchmarks/L5_execution/script_tests.json)",
+           "다른 스킬과 중복 없음", "SKILL.md 존재")
+
+
+def _s(value: str) -> str:
+    """파싱/포맷 결과처럼 매번 새로 만들어지는 문자열."""
+    return "".join(list(value))
+
+
+def _build(n: int, legacy: bool):
+    trig, meta, metric, layer = (
+        (LegacyTriggerInfo, LegacySkillMetadata, LegacyMetricResult, LegacyLayerResult)
+        if legacy else (TriggerInfo, SkillMetadata, MetricResult, LayerResult)
+    )
+    skills, results = [], {}
+    for i in range(n):
+        name = f"skill-{i:05d}"
+        skills.append(meta(
+            name=name, description=f"Skill {i} 트리거: a{i}, b{i}.",
+            skill_path=Path("/skills") / name,
+            triggers=trig(keywords=[f"a{i}", f"b{i}"], source="yaml_description"),
+            script_files=[_s("main.py"), _s("helper.py")],
+            reference_files=[_s("guide.md")],
+        ))
+        per_layer = {}
+        for lid in LAYERS:
+            lr = layer(layer=_s(lid), skill_name=_s(name))
+            lr.metrics = [
+                metric(
+                    name=_s(m), score=5.0, max_score=10.0,
+                    details=_s(DETAILS[(i + j) % len(DETAILS)]) if j % 2 else f"{j}/{i} 항목 확인",
+                )
+                for j, m in enumerate(METRICS)
+            ]
+            per_layer[lid] = lr
+        results[name] = per_layer
+    return skills, results
+
+
+def _measure(n: int, legacy: bool):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph = _build(n, legacy)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = len(pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL))
+    del graph
+    return current, size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="result model memory benchmark")
+    parser.add_argument("--skills", type=int, default=20000)
+    args = parser.parse_args()
+
+    mb = 1024 * 1024
+    print(f"skills={args.skills} layers={len(LAYERS)} metrics/layer={len(METRICS)}")
+    print(f"{'layout':>8} {'heap(MB)':>10} {'pickle(MB)':>11} {'build(s)':>9}")
+    rows = {}
+    for label, legacy in (("legacy", True), ("slotted", False)):
+        heap, size, elapsed = _measure(args.skills, legacy)
+        rows[label] = (heap, size)
+        print(f"{label:>8} {heap / mb:>10.1f} {size / mb:>11.1f} {elapsed:>9.2f}")
+    (h0, p0), (h1, p1) = rows["legacy"], rows["slotted"]
+    print(f"reduction: heap {1 - h1 / h0:.0%}, pickle {1 - p1 / p0:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""pipeline_targets 탐지 스케일링 벤치마크.
+
+합성 스킬 N개(100 → 20,000)에 대해 기존 방식(스킬명마다 `in` 부분 문자열
+스캔, O(N² × 본문))과 Aho-Corasick 오토마톤 1회 빌드 + 본문당 1회 선형 스캔을
+비교한다. 파일시스템은 사용하지 않는다.
+
+사용:
+    python benchmarks/perf/bench_pipeline_targets.py
+    python benchmarks/perf/bench_pipeline_targets.py --sizes 100,1000 --max-naive 1000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from discovery import _build_name_matcher, _detect_pipeline_targets
+
+
+DEFAULT_SIZES = [100, 500, 1000, 2000, 5000, 10000, 20000]
+FILLER = "이 스킬은 입력을 분석하고 결과를 정리합니다. Run the analyzer and review the output. "
+
+
+def _make_corpus(n: int, seed: int = 0):
+    """합성 스킬명 n개 + 다른 스킬 몇 개를 언급하는 ~2KB 본문."""
+    rng = random.Random(seed)
+    names = [f"skill-{i:05d}-{rng.choice(['lint', 'deps', 'cot', 'docs'])}" for i in range(n)]
+    bodies = []
+    for i in range(n):
+        refs = rng.sample(names, k=min(3, n))
+        bodies.append(FILLER * 20 + " ".join(f"Pipeline: {r} 연동" for r in refs))
+    return names, bodies
+
+
+def _naive(names, bodies):
+    total = 0
+    for own, body in zip(names, bodies):
+        body_lower = body.lower()
+        total += sum(1 for n in names if n != own and n.lower() in body_lower)
+    return total
+
+
+def _automaton(names, bodies):
+    matcher = _build_name_matcher(names)
+    total = 0
+    for own, body in zip(names, bodies):
+        total += sum(1 for n in _detect_pipeline_targets(body, names, matcher) if n != own)
+    return total
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    value = fn(*args)
+    return time.perf_counter() - start, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pipeline_targets scaling benchmark")
+    parser.add_argument("--sizes", type=str, default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument(
+        "--max-naive", type=int, default=2000,
+        help="Skip the quadratic baseline above this many skills (default: 2000)",
+    )
+    args = parser.parse_args()
+
+    sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+    print(f"{'skills':>8} {'naive(s)':>10} {'automaton(s)':>13} {'speedup':>8}")
+    for n in sizes:
+        names, bodies = _make_corpus(n)
+        t_auto, hits_auto = _timed(_automaton, names, bodies)
+        if n <= args.max_naive:
+            t_naive, hits_naive = _timed(_naive, names, bodies)
+            if hits_naive != hits_auto:
+                print(f"mismatch at n={n}: naive={hits_naive} automaton={hits_auto}", file=sys.stderr)
+                return 1
+            print(f"{n:>8} {t_naive:>10.3f} {t_auto:>13.3f} {t_naive / t_auto:>7.1f}x")
+        else:
+            print(f"{n:>8} {'skipped':>10} {t_auto:>13.3f} {'-':>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
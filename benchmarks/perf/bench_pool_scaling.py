@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""교차 스킬 단계(L2) 프로세스 풀 확장성 벤치마크.
+
+합성 스킬 N개에 대해 L2(전체 스킬 목록이 필요한 trigger_overlap 포함)를
+workers 1→32로 평가한다.
+
+- per-task: 이전 방식 — 작업마다 (skill, layers, all_skills, ...)를 피클링 (O(N²))
+- shared:   orchestrator — 전체 목록은 풀 initializer로 워커당 1회, 작업은 스킬 인덱스만
+
+사용:
+    python benchmarks/perf/bench_pool_scaling.py
+    python benchmarks/perf/bench_pool_scaling.py --skills 5000 --workers 1,4,16 --skip-legacy
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from discovery import discover_skills
+from orchestrator import _collect_results_streaming, _evaluate_one_skill
+
+
+def _make_skills(root: Path, n: int):
+    for s in range(n):
+        skill_dir = root / f"skill-{s:05d}"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{s:05d}\ndescription: 생성 스킬. 트리거: 작업{s}, 공통{s % 50}, 분류{s % 7}\n---\n"
+            "# Body\n\n## 사용법\n\n1. 실행\n2. 확인\n",
+            encoding="utf-8",
+        )
+
+
+def _per_task(skills, workers):
+    tasks = [(skill, ["L2"], skills, None, False, None) for skill in skills]
+    if workers == 1:
+        return [_evaluate_one_skill(t) for t in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_evaluate_one_skill, tasks))
+
+
+def _shared(skills, workers):
+    return _collect_results_streaming(iter(skills), ["L2"], None, False, workers)
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cross-skill pool scaling benchmark")
+    parser.add_argument("--skills", type=int, default=500)
+    parser.add_argument("--workers", default="1,2,4,8,16,32", help="comma-separated worker counts")
+    parser.add_argument("--skip-legacy", action="store_true", help="skip the O(N^2) per-task mode")
+    args = parser.parse_args()
+    worker_counts = [int(w) for w in args.workers.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _make_skills(root, args.skills)
+        skills = discover_skills(root)
+
+        print(f"skills={len(skills)} layer=L2")
+        print(f"{'workers':>7} {'per-task(s)':>12} {'shared(s)':>10}")
+        for workers in worker_counts:
+            legacy = "-" if args.skip_legacy else f"{_timed(_per_task, skills, workers):.3f}"
+            shared = _timed(_shared, skills, workers)
+            print(f"{workers:>7} {legacy:>12} {shared:>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""레이어 결과 캐시 벤치마크.
+
+합성 스킬 N개에 대해 전체 레이어(L1-L6) 평가를 orchestrator.run()으로 실행한다.
+
+- no cache: 결과 캐시 없음
+- cold:     빈 결과 캐시 — 평가 + 키 계산 + 저장 비용
+- warm:     같은 캐시로 재실행 (변경 없는 트리의 CI 재실행) — 평가 0회
+- touched:  스킬 하나의 스크립트만 바꾼 뒤 재실행 — 그 스킬의 레이어만 재평가
+            (트리거 키워드가 그대로면 다른 스킬의 L2도 재사용)
+
+사용:
+    python benchmarks/perf/bench_result_cache.py
+    python benchmarks/perf/bench_result_cache.py --skills 300 --scripts 10
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from argparse import Namespace
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import orchestrator
+from ast_features import FEATURES
+from evaluators import LAYERS
+
+
+def _script(s: int, i: int) -> str:
+    return (
+        f'#!/usr/bin/env python3\n"""스킬 {s} 도구 {i}."""\n\nimport argparse\nimport sys\n\n'
+        + "".join(
+            f"def step_{k}(value: int) -> int:\n"
+            "    try:\n"
+            "        return value * 2 if value > 0 and value < 100 else value\n"
+            "    except (ValueError, TypeError):\n"
+            "        sys.exit(1)\n\n"
+            for k in range(30)
+        )
+        + "parser = argparse.ArgumentParser()\nparser.add_argument('--verify')\n"
+    )
+
+
+def _make_skills(root: Path, n: int, m: int):
+    for s in range(n):
+        skill_dir = root / f"skill-{s:04d}"
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "references").mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{s:04d}\ndescription: 생성 스킬. 트리거: 작업{s}, 공통 키워드{s % 7}\n---\n"
+            "# Body\n\n## 사용법\n\n1. `scripts/tool_0.py` 실행\n\n참고: references/guide.md\n",
+            encoding="utf-8",
+        )
+        (skill_dir / "references" / "guide.md").write_text("# Guide\n", encoding="utf-8")
+        for i in range(m):
+            (skill_dir / "scripts" / f"tool_{i}.py").write_text(_script(s, i), encoding="utf-8")
+
+
+def _args(root: Path, config_path: Path, cache_path) -> Namespace:
+    return Namespace(
+        skills_root=root, skill=None, layer=None, format="json", output=None,
+        ci_mode=False, threshold=None, config=config_path, benchmarks=None,
+        ecosystem=False, save_history=False, diff=None, show_history=False,
+        workers=1, io_workers=None, discovery_workers=1, discovery_index=None, max_depth=1,
+        ignore=None, rev=None, max_file_size=16, analysis_cache=None,
+        result_cache=cache_path, changed_since=None, layer_timings=None, layer_timeout=None,
+        skill_timeout=None, fail_fast=False,
+    )
+
+
+def _run(args):
+    """run() 1회 — 출력은 버리고 (시간, 평가한 (스킬, 레이어) 수) 반환."""
+    calls = [0]
+
+    def _counting(fn):
+        def _evaluate(skill, **kwargs):
+            calls[0] += 1
+            return fn(skill, **kwargs)
+        return _evaluate
+
+    orchestrator.LAYERS = {lid: _counting(fn) for lid, fn in LAYERS.items()}
+    FEATURES.clear()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        code = orchestrator.run(args)
+    elapsed = time.perf_counter() - start
+    orchestrator.LAYERS = LAYERS
+    assert code == 0
+    return elapsed, calls[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="layer result cache benchmark")
+    parser.add_argument("--skills", type=int, default=100)
+    parser.add_argument("--scripts", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        root = tmp / "skills"
+        _make_skills(root, args.skills, args.scripts)
+        config_path = tmp / "config.json"
+        config_path.write_text(json.dumps({}), encoding="utf-8")
+        cache_path = tmp / "result_cache.json"
+
+        print(f"skills={args.skills} scripts/skill={args.scripts} layers={len(LAYERS)}")
+        print(f"{'mode':>9} {'time(s)':>8} {'evaluated':>10}")
+        for label, path in (("no cache", None), ("cold", cache_path), ("warm", cache_path)):
+            elapsed, evaluated = _run(_args(root, config_path, path))
+            print(f"{label:>9} {elapsed:>8.3f} {evaluated:>10}")
+
+        (root / "skill-0000" / "scripts" / "tool_0.py").write_text(_script(0, 0) + "# 변경\n", encoding="utf-8")
+        elapsed, evaluated = _run(_args(root, config_path, cache_path))
+        print(f"{'touched':>9} {elapsed:>8.3f} {evaluated:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
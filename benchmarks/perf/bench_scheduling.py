@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""치우친 스킬 트리의 작업 배치 벤치마크 (tail latency).
+
+스킬 N개 중 하나만 scripts/가 매우 큰 트리를 workers개 프로세스로 평가한다.
+
+- per-skill: 이전 방식 — 스킬 단위 작업을 discovery 순서로 map
+- units:     orchestrator — (스킬, 레이어) 단위 분할 + 예상 비용 내림차순 제출 + as_completed
+
+기본은 레이어 평가를 "입력 바이트에 비례해 sleep"으로 대체해 CPU 수와 무관하게
+배치 효과(makespan)만 잰다. --real이면 실제 evaluator를 쓴다.
+
+사용:
+    python benchmarks/perf/bench_scheduling.py
+    python benchmarks/perf/bench_scheduling.py --workers 8 --skills 200 --real
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import orchestrator
+from discovery import discover_skills
+from evaluators import LAYERS
+from models import LayerResult
+from scheduler import _input_bytes
+
+PER_SKILL_LAYERS = ["L1", "L3", "L4", "L5", "L6"]
+# 시뮬레이션 처리 속도 (scheduler의 근사와 같은 형태: 고정 비용 + 바이트 / 속도)
+_SIM_FIXED = 0.005
+_SIM_BYTES_PER_SECOND = 2_000_000
+
+
+def _simulated(layer_id):
+    def _evaluate(skill, **kwargs):
+        time.sleep(_SIM_FIXED + _input_bytes(skill, layer_id) / _SIM_BYTES_PER_SECOND)
+        return LayerResult(layer=layer_id, skill_name=skill.name)
+    return _evaluate
+
+
+def _make_skills(root: Path, n: int, huge_mb: int):
+    for s in range(n):
+        skill_dir = root / f"skill-{s:04d}"
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{s:04d}\ndescription: 생성 스킬\n---\n# Body\n", encoding="utf-8"
+        )
+        lines = (huge_mb * 1024 * 1024 // 40) if s == n // 2 else 50
+        body = "".join(f"def f_{i}(x):\n    return x + {i}  # pad\n" for i in range(lines // 2))
+        (skill_dir / "scripts" / "main.py").write_text(f'"""도구."""\n{body}', encoding="utf-8")
+
+
+def _per_skill(skills, workers):
+    tasks = [(skill, PER_SKILL_LAYERS, None, None, False, None) for skill in skills]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(orchestrator._evaluate_one_skill, tasks))
+
+
+def _units(skills, workers):
+    return orchestrator._collect_results_streaming(iter(skills), PER_SKILL_LAYERS, None, False, workers)
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="skewed-tree scheduling benchmark")
+    parser.add_argument("--skills", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--huge-mb", type=int, default=2, help="scripts/ size of the single huge skill")
+    parser.add_argument("--real", action="store_true", help="use real evaluators instead of sleep")
+    args = parser.parse_args()
+
+    if not args.real:
+        # fork로 시작하는 워커는 이 패치를 물려받는다
+        orchestrator.LAYERS = {lid: _simulated(lid) for lid in LAYERS}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _make_skills(root, args.skills, args.huge_mb)
+        skills = discover_skills(root)
+
+        print(f"skills={len(skills)} workers={args.workers} huge={args.huge_mb}MB "
+              f"mode={'real' if args.real else 'simulated'}")
+        t_old = _timed(_per_skill, skills, args.workers)
+        t_new = _timed(_units, skills, args.workers)
+        print(f"{'per-skill':>10} {t_old:>8.3f}s")
+        print(f"{'units':>10} {t_new:>8.3f}s  ({t_old / t_new:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""스크립트 코퍼스 공유 벤치마크.
+
+합성 스킬 N개(스크립트 M개씩)에 대해 L1/L5/L6 평가와 ecosystem cli_consistency를
+실행한다. 이전 방식(검사마다 scripts/**/*.py를 다시 읽기 — get_corpus가 매번 새
+코퍼스를 만들게 해 재현)과 스킬당 ScriptCorpus 하나를 공유하는 방식을 비교한다.
+시간은 best-of-N이고 페이지 캐시가 데워진 상태라 차이는 주로 reads(파일 읽기
+횟수)에 나타난다. 시간은 대부분 L5 code_complexity의 AST 순회다.
+
+사용:
+    python benchmarks/perf/bench_script_corpus.py
+    python benchmarks/perf/bench_script_corpus.py --skills 100 --scripts 20
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import evaluators.base as base
+from discovery import parse_skill_md
+from evaluators import ecosystem, l1_structural, l5_execution, l6_validation
+from inventory import SkillInventory
+from script_corpus import ScriptCorpus
+
+_SCRIPT = '''#!/usr/bin/env python3
+"""생성 스크립트 {i}."""
+
+import argparse
+import gc
+import sys
+from pathlib import Path
+
+
+def handler_{i}(value: int) -> int:
+    """값 처리."""
+    try:
+        return value * 2 if value > 0 else -value
+    except TypeError:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--format", default="text")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    print(Path(__file__).parent, args)
+''' + "".join(f"\n\ndef helper_{{i}}_{k}(x):\n    return x + {k}\n" for k in range(40))
+
+
+def _make_skills(root: Path, n: int, m: int):
+    skills = []
+    for s in range(n):
+        skill_dir = root / f"skill-{s:04d}"
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{s:04d}\ndescription: generated\n---\n# Body\n", encoding="utf-8"
+        )
+        for i in range(m):
+            (skill_dir / "scripts" / f"tool_{i}.py").write_text(_SCRIPT.format(i=i), encoding="utf-8")
+        skills.append(parse_skill_md(skill_dir))
+    return skills
+
+
+def _fresh_corpus(skill):
+    """이전 방식 재현 — 호출마다 코퍼스를 새로 만든다."""
+    skill.corpus = ScriptCorpus(base.get_inventory(skill))
+    return skill.corpus
+
+
+def _run(skills, shared: bool):
+    reads = 0
+    read_bytes = SkillInventory.read_bytes
+
+    def counting(self, entry):
+        nonlocal reads
+        reads += 1
+        return read_bytes(self, entry)
+
+    modules = [m for m in (base, l5_execution, ecosystem) if hasattr(m, "get_corpus")]
+    saved = [m.get_corpus for m in modules]
+    SkillInventory.read_bytes = counting
+    if not shared:
+        for m in modules:
+            m.get_corpus = _fresh_corpus
+    try:
+        for skill in skills:
+            skill.corpus = None
+        start = time.perf_counter()
+        for skill in skills:
+            l1_structural.evaluate(skill)
+            l5_execution.evaluate(skill)
+            l6_validation.evaluate(skill)
+            skill.corpus.release()  # orchestrator._evaluate_one_skill과 동일
+        ecosystem.check_cli_consistency(skills)
+        elapsed = time.perf_counter() - start
+    finally:
+        SkillInventory.read_bytes = read_bytes
+        for m, fn in zip(modules, saved):
+            m.get_corpus = fn
+    return elapsed, reads
+
+
+def main():
+    parser = argparse.ArgumentParser(description="shared script corpus benchmark")
+    parser.add_argument("--skills", type=int, default=50)
+    parser.add_argument("--scripts", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3, help="best-of-N timing")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        skills = _make_skills(Path(tmp), args.skills, args.scripts)
+        print(f"skills={args.skills} scripts/skill={args.scripts}")
+        print(f"{'mode':>10} {'time(s)':>8} {'reads':>7}")
+        for label, shared in (("per-check", False), ("corpus", True)):
+            runs = []
+            for _ in range(args.repeat):
+                gc.collect()
+                runs.append(_run(skills, shared))
+            elapsed, reads = min(runs)
+            print(f"{label:>10} {elapsed:>8.3f} {reads:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""--skill 단일 스킬 선택 discovery 벤치마크.
+
+합성 스킬 트리(기본 10,000개, SKILL.md ~20KB + scripts/ + references/)에서
+스킬 하나를 고르는 비용을 비교한다.
+  - full: 모든 스킬을 parse_skill_md(본문 스캔 + 인벤토리)한 뒤 이름으로 필터
+  - metadata_only: frontmatter만 읽고, 고른 스킬 하나만 필드 접근으로 전체 로드
+
+사용:
+    python benchmarks/perf/bench_skill_filter.py
+    python benchmarks/perf/bench_skill_filter.py --skills 2000 --root /tmp/skills
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from discovery import iter_skills
+
+
+BODY = (
+    "## When to Use\n- 분석이 필요할 때\n\n## 트리거\n- 분석\n- 정리\n\n"
+    + "## 사용법\n설명 문장입니다. Run the analyzer.\n```python\nprint('x')\n```\n" * 250
+)
+
+
+def _make_tree(root: Path, n: int):
+    for i in range(n):
+        d = root / f"skill-{i:05d}"
+        (d / "scripts").mkdir(parents=True)
+        (d / "references").mkdir()
+        (d / "SKILL.md").write_text(
+            f"---\nname: skill-{i:05d}\ndescription: Skill {i} 트리거: a{i}, b{i}.\n---\n" + BODY,
+            encoding="utf-8",
+        )
+        (d / "scripts" / "run.py").write_text("print('x')\n", encoding="utf-8")
+        (d / "references" / "guide.md").write_text("# Guide\n", encoding="utf-8")
+
+
+def _select(root: Path, target: str, metadata_only: bool):
+    start = time.perf_counter()
+    selected = [s for s in iter_skills(root, metadata_only=metadata_only) if s.name == target]
+    # 평가기가 필드에 접근하는 시점 (metadata_only면 여기서 한 스킬만 로드)
+    assert selected and selected[0].script_files == ("run.py",)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="--skill discovery benchmark")
+    parser.add_argument("--skills", type=int, default=10000)
+    parser.add_argument("--root", type=Path, default=None, help="Reuse/create tree here instead of a temp dir")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.root or Path(tmp)
+        if not any(root.glob("skill-*")):
+            print(f"creating {args.skills} skills under {root} ...")
+            _make_tree(root, args.skills)
+        target = f"skill-{args.skills // 2:05d}"
+        # 페이지 캐시 워밍업
+        _select(root, target, metadata_only=True)
+
+        t_full = _select(root, target, metadata_only=False)
+        t_lazy = _select(root, target, metadata_only=True)
+        print(f"{'mode':>14} {'time(s)':>8}")
+        print(f"{'full':>14} {t_full:>8.2f}")
+        print(f"{'metadata_only':>14} {t_lazy:>8.2f}")
+        print(f"speedup: {t_full / t_lazy:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""트리거 키워드 중복 검사 벤치마크.
+
+합성 스킬 N개(키워드 12개, 일부 공유)에 대해 모든 스킬의 L2 trigger_overlap과
+ecosystem trigger_ecosystem_health를 실행한다. 이전 방식(매번 kw.lower()로
+문자열 set 생성)과 keywords.KEYWORDS 정수 id 집합 방식을 비교한다.
+
+사용:
+    python benchmarks/perf/bench_trigger_overlap.py
+    python benchmarks/perf/bench_trigger_overlap.py --skills 500
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from evaluators.ecosystem import check_trigger_ecosystem_health
+from evaluators.l2_activation import GENERIC_KEYWORDS, check_trigger_overlap
+from models import SkillMetadata, TriggerInfo
+
+
+# ── 이전 구현 (비교용) ──
+
+def _legacy_overlap(skill, all_skills):
+    my_kws = set(kw.lower() for kw in skill.triggers.keywords)
+    total_shared = set()
+    for other in all_skills:
+        if other.name == skill.name:
+            continue
+        total_shared |= my_kws & set(kw.lower() for kw in other.triggers.keywords)
+    return len(total_shared)
+
+
+def _legacy_health(skills):
+    all_keywords = {}
+    generic = 0
+    for skill in skills:
+        for kw in skill.triggers.keywords:
+            kw_lower = kw.lower()
+            all_keywords.setdefault(kw_lower, []).append(skill.name)
+            generic += kw_lower in GENERIC_KEYWORDS
+    return sum(1 for v in all_keywords.values() if len(v) >= 2), generic
+
+
+def _make_skills(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    shared = [f"Shared-Keyword-{i}" for i in range(200)] + sorted(GENERIC_KEYWORDS)
+    skills = []
+    for i in range(n):
+        keywords = [f"Skill{i}-Keyword-{j}" for j in range(9)] + rng.sample(shared, 3)
+        skills.append(SkillMetadata(
+            name=f"skill-{i:05d}", description="", skill_path=Path(f"/skills/skill-{i:05d}"),
+            triggers=TriggerInfo(keywords=keywords, source="yaml_description"),
+        ))
+    return skills
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="trigger keyword overlap benchmark")
+    parser.add_argument("--skills", type=int, default=2000)
+    args = parser.parse_args()
+
+    skills = _make_skills(args.skills)
+    rows = [
+        ("overlap", lambda: [_legacy_overlap(s, skills) for s in skills],
+         lambda: [check_trigger_overlap(s, skills) for s in skills]),
+        ("ecosystem", lambda: _legacy_health(skills), lambda: check_trigger_ecosystem_health(skills)),
+    ]
+    print(f"skills={args.skills}")
+    print(f"{'check':>10} {'legacy(s)':>10} {'ids(s)':>8} {'speedup':>8}")
+    for label, legacy, current in rows:
+        t_old, t_new = _timed(legacy), _timed(current)
+        print(f"{label:>10} {t_old:>10.3f} {t_new:>8.3f} {t_old / t_new:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""Analysis Cache — 스크립트 내용 sha256 → ScriptFeatures SQLite 디스크 캐시 (크기 제한 LRU)."""
+
+import hashlib
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+import ast_features
+from ast_features import FunctionFeatures, ScriptFeatures
+
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / "reports" / "analysis_cache.sqlite"
+# 이 수를 넘으면 가장 오래 쓰지 않은 항목부터 지운다
+DEFAULT_MAX_ENTRIES = 100_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS features (
+    sha256 BLOB NOT NULL,
+    analyzer_version TEXT NOT NULL,
+    data TEXT NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (sha256, analyzer_version)
+);
+CREATE INDEX IF NOT EXISTS features_last_used ON features (last_used);
+"""
+
+
+def analyzer_version() -> str:
+    """특징 추출기 버전 — ast_features.py 소스 + 파이썬 버전(AST 형태가 다름) 해시."""
+    hasher = hashlib.sha256(Path(ast_features.__file__).read_bytes())
+    hasher.update(f"\0{sys.version_info[0]}.{sys.version_info[1]}".encode("ascii"))
+    return hasher.hexdigest()[:12]
+
+
+def features_to_json(features: Optional[ScriptFeatures]) -> str:
+    """ScriptFeatures → JSON (파싱 실패 None은 null)."""
+    if features is None:
+        return "null"
+    return json.dumps([
+        features.module_docstring,
+        [[f.name, f.lineno, f.has_docstring, f.annotated, f.complexity] for f in features.functions],
+        features.imports_argparse,
+        features.argument_parsers,
+        features.add_arguments,
+        features.try_blocks,
+        features.except_types,
+        features.bare_excepts,
+        features.sys_exit_calls,
+        features.argv_flags,
+    ], ensure_ascii=False)
+
+
+def features_from_json(text: str) -> Optional[ScriptFeatures]:
+    """features_to_json 역변환."""
+    data = json.loads(text)
+    if data is None:
+        return None
+    (module_docstring, functions, imports_argparse, argument_parsers, add_arguments,
+     try_blocks, except_types, bare_excepts, sys_exit_calls, argv_flags) = data
+    return ScriptFeatures(
+        module_docstring=module_docstring,
+        functions=tuple(FunctionFeatures(*f) for f in functions),
+        imports_argparse=imports_argparse,
+        argument_parsers=argument_parsers,
+        add_arguments=tuple(tuple(args) for args in add_arguments),
+        try_blocks=try_blocks,
+        except_types=tuple(except_types),
+        bare_excepts=bare_excepts,
+        sys_exit_calls=sys_exit_calls,
+        argv_flags=tuple(argv_flags),
+    )
+
+
+class AnalysisCache:
+    """(내용 sha256, analyzer_version) → ScriptFeatures 저장소.
+
+    ast_features.FEATURES.attach()로 붙이면 메모리 캐시 미스 때 조회하고, 새로 분석한
+    결과는 모아 두었다가 flush()에서 한 트랜잭션으로 쓴다. 연결은 처음 사용할 때
+    열므로 fork 전에 만든 인스턴스를 자식이 물려받아도 연결을 공유하지 않는다.
+    SQLite 오류가 나면 경고 후 이번 실행 동안 캐시를 끈다.
+    """
+
+    def __init__(self, path: Path, max_entries: int = DEFAULT_MAX_ENTRIES, version: str = None):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.version = version or analyzer_version()
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._disabled = False
+        self._pending = {}
+        self._touched = set()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # 프로세스 안의 접근은 FeatureCache lock이 직렬화하므로 I/O 스레드에서의 flush도 허용
+                conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")  # 캐시라 전원 장애 시 유실은 허용
+                conn.executescript(_SCHEMA)
+                self._conn = conn
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
+        return self._conn
+
+    def _disable(self, exc: Exception):
+        print(f"[WARN] analysis cache disabled ({self.path}): {exc}", file=sys.stderr)
+        self._disabled = True
+        self._pending.clear()
+        self._touched.clear()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def lookup(self, key: bytes) -> Tuple[bool, Optional[ScriptFeatures]]:
+        """(찾았는지, 특징). 파싱 실패로 저장된 항목은 (True, None)."""
+        if key in self._pending:
+            return True, features_from_json(self._pending[key])
+        conn = self._connect()
+        if conn is None:
+            return False, None
+        try:
+            row = conn.execute(
+                "SELECT data FROM features WHERE sha256 = ? AND analyzer_version = ?",
+                (key, self.version),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._disable(e)
+            return False, None
+        if row is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        self._touched.add(key)
+        return True, features_from_json(row[0])
+
+    def store(self, key: bytes, features: Optional[ScriptFeatures]):
+        if not self._disabled:
+            self._pending[key] = features_to_json(features)
+
+    def flush(self):
+        """새 항목 쓰기 + 조회한 항목 last_used 갱신 + 상한 초과분 제거."""
+        if not self._pending and not self._touched:
+            return
+        conn = self._connect()
+        if conn is None:
+            return
+        now = time.time_ns()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO features VALUES (?, ?, ?, ?)",
+                    [(k, self.version, data, now) for k, data in self._pending.items()],
+                )
+                conn.executemany(
+                    "UPDATE features SET last_used = ? WHERE sha256 = ? AND analyzer_version = ?",
+                    [(now, k, self.version) for k in self._touched],
+                )
+                if self._pending:
+                    excess = conn.execute("SELECT COUNT(*) FROM features").fetchone()[0] - self.max_entries
+                    if excess > 0:
+                        conn.execute(
+                            "DELETE FROM features WHERE rowid IN "
+                            "(SELECT rowid FROM features ORDER BY last_used LIMIT ?)",
+                            (excess,),
+                        )
+        except sqlite3.Error as e:
+            self._disable(e)
+            return
+        self._pending.clear()
+        self._touched.clear()
+
+    def close(self):
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __len__(self) -> int:
+        conn = self._connect()
+        return conn.execute("SELECT COUNT(*) FROM features").fetchone()[0] if conn else 0
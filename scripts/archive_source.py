@@ -0,0 +1,192 @@
+"""아카이브(zip/tar) 스킬 소스 — 압축 해제 없이 멤버 단위 랜덤 액세스."""
+
+import os
+import tarfile
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+# 동시에 열어두는 아카이브 핸들 수 상한 (아카이브 수천 개 디렉토리 대비)
+MAX_OPEN_ARCHIVES = 64
+
+_handles: "OrderedDict[Tuple[str, str], object]" = OrderedDict()
+_handles_lock = threading.Lock()
+# 프로세스별 소스 ((kind, 경로) → ZipSource/TarSource). 피클링된 소스는 받는 프로세스의
+# 이 항목으로 풀리므로 멤버 색인은 워커마다 한 번만 만들고 작업에는 실리지 않는다
+_sources: Dict[Tuple[str, str], object] = {}
+_sources_lock = threading.Lock()
+
+
+def _shared_source(kind: str, path: str):
+    """이 프로세스의 (kind, path) 아카이브 소스 — 없으면 만들고 색인은 처음 읽을 때."""
+    key = (kind, path)
+    with _sources_lock:
+        source = _sources.get(key)
+        if source is None:
+            source = _sources[key] = (ZipSource if kind == ZipSource.kind else TarSource)(Path(path))
+        return source
+
+
+def _reset_after_fork():
+    """fork된 자식은 부모와 파일 오프셋을 공유하는 핸들과 (잡혀 있었을 수 있는) 락을 쓰지 않는다."""
+    global _handles_lock, _sources_lock
+    _handles.clear()
+    _handles_lock = threading.Lock()
+    _sources_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def is_archive(path) -> bool:
+    """지원하는 아카이브 확장자인지 (파일 존재 여부는 보지 않음)."""
+    return str(path).lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def archive_stem(path: Path) -> str:
+    """확장자를 뗀 아카이브 이름 (my-skill.tar.gz → my-skill)."""
+    name = path.name
+    for suffix in sorted(ARCHIVE_SUFFIXES, key=len, reverse=True):
+        if name.lower().endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def _normalize_member(name: str) -> str:
+    """'./a/b' → 'a/b'. 상위 경로(..) 멤버는 빈 문자열로 거른다."""
+    while name.startswith("./"):
+        name = name[2:]
+    name = name.lstrip("/")
+    if ".." in name.split("/"):
+        return ""
+    return name
+
+
+def _with_handle(kind: str, path: Path, opener, fn):
+    """LRU로 관리되는 공유 핸들로 fn(handle) 실행 (전역 락 하에서)."""
+    key = (kind, str(path))
+    with _handles_lock:
+        handle = _handles.get(key)
+        if handle is None:
+            handle = opener()
+            _handles[key] = handle
+            while len(_handles) > MAX_OPEN_ARCHIVES:
+                _, old = _handles.popitem(last=False)
+                old.close()
+        else:
+            _handles.move_to_end(key)
+        return fn(handle)
+
+
+def close_all():
+    """열린 아카이브 핸들을 모두 닫는다."""
+    with _handles_lock:
+        while _handles:
+            _, handle = _handles.popitem()
+            handle.close()
+
+
+class ZipSource:
+    """zip 아카이브 — central directory로 멤버 목록/오프셋을 얻고 멤버만 읽는다."""
+
+    kind = "zip"
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._names: Dict[str, str] = {}
+        self._indexed = False
+
+    def __reduce__(self):
+        return _shared_source, (self.kind, str(self.path))
+
+    def _open(self):
+        return zipfile.ZipFile(self.path)
+
+    def listing(self) -> List[Tuple[str, int, int]]:
+        """[(정규화된 경로, 크기, mtime_ns)]. 디렉토리 항목은 "dir/" 형태 (빈 디렉토리 보존)."""
+        def _list(zf):
+            out = []
+            for info in zf.infolist():
+                name = _normalize_member(info.filename)
+                if not name:
+                    continue
+                mtime = int(time.mktime(info.date_time + (0, 0, -1)) * 1_000_000_000)
+                if info.is_dir():
+                    out.append((name.rstrip("/") + "/", 0, mtime))
+                    continue
+                self._names[name] = info.filename
+                out.append((name, info.file_size, mtime))
+            self._indexed = True
+            return out
+        return _with_handle(self.kind, self.path, self._open, _list)
+
+    def read_bytes(self, name: str) -> bytes:
+        if not self._indexed:
+            self.listing()
+        if name not in self._names:
+            raise FileNotFoundError(f"{self.path}:{name}")
+        member = self._names[name]
+        return _with_handle(self.kind, self.path, self._open, lambda zf: zf.read(member))
+
+
+class TarSource:
+    """tar(.gz/.bz2/.xz) 아카이브 — 한 번 순회해 멤버 색인(TarInfo)을 만들고
+    이후에는 색인의 데이터 오프셋으로 멤버만 읽는다."""
+
+    kind = "tar"
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._members: Dict[str, tarfile.TarInfo] = {}
+        self._indexed = False
+
+    def __reduce__(self):
+        return _shared_source, (self.kind, str(self.path))
+
+    def _open(self):
+        return tarfile.open(self.path)
+
+    def listing(self) -> List[Tuple[str, int, int]]:
+        def _list(tf):
+            out = []
+            for info in tf.getmembers():
+                name = _normalize_member(info.name)
+                if not name or name == ".":
+                    continue
+                if info.isdir():
+                    out.append((name.rstrip("/") + "/", 0, int(info.mtime) * 1_000_000_000))
+                    continue
+                if not info.isfile():
+                    continue
+                self._members[name] = info
+                out.append((name, info.size, int(info.mtime) * 1_000_000_000))
+            self._indexed = True
+            return out
+        return _with_handle(self.kind, self.path, self._open, _list)
+
+    def read_bytes(self, name: str) -> bytes:
+        if not self._indexed:
+            self.listing()
+        info = self._members.get(name)
+        if info is None:
+            raise FileNotFoundError(f"{self.path}:{name}")
+
+        def _read(tf):
+            f = tf.extractfile(info)
+            return f.read() if f is not None else b""
+        return _with_handle(self.kind, self.path, self._open, _read)
+
+
+def open_archive(path: Path):
+    """확장자에 맞는 아카이브 소스 (이 프로세스의 공유 소스로 등록)."""
+    source = ZipSource(path) if str(path).lower().endswith(".zip") else TarSource(path)
+    with _sources_lock:
+        _sources[(source.kind, str(path))] = source
+    return source
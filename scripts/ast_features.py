@@ -0,0 +1,315 @@
+"""Python 스크립트 AST 특징 추출 — 파일당 트리 1회 순회, 내용 해시로 캐시.
+
+L5(docstring, 함수 품질, 복잡도, CLI)와 L6(에러 처리, 검증 플래그), ecosystem
+(CLI 플래그)이 정규식/부분 문자열 대신 같은 ScriptFeatures를 본다.
+실행 간 재사용은 analysis_cache.AnalysisCache를 FEATURES.attach()로 붙인다.
+"""
+
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# cyclomatic complexity를 1씩 올리는 노드 (BoolOp은 피연산자 수 - 1)
+_BRANCH_NODES = frozenset({ast.If, ast.For, ast.While, ast.ExceptHandler, ast.Assert, ast.IfExp})
+_FUNCTION_NODES = frozenset({ast.FunctionDef, ast.AsyncFunctionDef})
+_TRY_NODES = frozenset({ast.Try, getattr(ast, "TryStar", ast.Try)})
+# 순회할 필요 없는 필드 (문자열/숫자 또는 특징과 무관한 노드: ctx, import alias)
+_SKIPPED_FIELDS = frozenset({
+    "ctx", "id", "arg", "attr", "name", "names", "module", "level",
+    "type_comment", "kind", "conversion", "is_async",
+})
+_LEAF_NODES = frozenset({ast.Constant, ast.Name, ast.Pass, ast.Break, ast.Continue})
+
+# 프로세스 전역 캐시 크기 (내용 해시 → ScriptFeatures) — 항목 수와 대략 바이트 양 둘 다 제한
+CACHE_SIZE = 4096
+CACHE_BYTES = 16 * 1024 * 1024
+# approx_size 상수 (CPython 3.11 sys.getsizeof 기준 어림값)
+_ENTRY_BYTES = 320      # 키(sha256 bytes), OrderedDict 링크, ScriptFeatures 본체
+_FUNCTION_BYTES = 140   # FunctionFeatures + 튜플 슬롯 + 이름 str 헤더
+_STRING_BYTES = 57      # str 헤더 + 튜플 슬롯
+
+
+@dataclass(frozen=True, slots=True)
+class FunctionFeatures:
+    """함수/메서드 하나."""
+    name: str
+    lineno: int
+    has_docstring: bool
+    annotated: bool      # 반환 타입 또는 (self/cls 제외) 인자 타입 힌트가 하나라도 있음
+    complexity: int      # cyclomatic complexity (중첩 함수 본문 포함)
+
+
+@dataclass(frozen=True, slots=True)
+class ScriptFeatures:
+    """스크립트 하나의 AST 특징. functions는 ast.walk 순서."""
+    module_docstring: bool = False
+    functions: Tuple[FunctionFeatures, ...] = ()
+    imports_argparse: bool = False
+    argument_parsers: int = 0                       # ArgumentParser(...) 호출 수
+    add_arguments: Tuple[Tuple[str, ...], ...] = ()  # add_argument 호출별 문자열 인자
+    try_blocks: int = 0
+    except_types: Tuple[str, ...] = ()              # 구체적 예외 타입 (정렬, 중복 제거)
+    bare_excepts: int = 0
+    sys_exit_calls: int = 0
+    argv_flags: Tuple[str, ...] = ()                # sys.argv와 비교하는 옵션 문자열 (정렬, 중복 제거)
+
+    @property
+    def uses_argparse(self) -> bool:
+        return self.imports_argparse or self.argument_parsers > 0
+
+    @property
+    def option_strings(self) -> Tuple[str, ...]:
+        """add_argument에 넘긴 '-'로 시작하는 옵션 문자열 전체 + argv_flags."""
+        return tuple(s for args in self.add_arguments for s in args if s.startswith("-")) + self.argv_flags
+
+
+def _dotted(node: ast.AST) -> str:
+    """Name/Attribute 체인 → 'a.b.c' (그 외는 빈 문자열)."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return ""
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+def _is_argv(node: ast.AST) -> bool:
+    """sys.argv / argv 또는 그 인덱싱·슬라이싱."""
+    if type(node) is ast.Subscript:
+        node = node.value
+    return _dotted(node).rpartition(".")[2] == "argv"
+
+
+def _option_constants(node: ast.AST):
+    """비교 피연산자 안의 '-'로 시작하는 문자열 상수 (튜플/리스트/집합 리터럴 포함)."""
+    items = node.elts if type(node) in (ast.Tuple, ast.List, ast.Set) else (node,)
+    for item in items:
+        if type(item) is ast.Constant and isinstance(item.value, str) and item.value.startswith("-"):
+            yield item.value
+
+
+def _is_annotated(node) -> bool:
+    if node.returns is not None:
+        return True
+    args = node.args
+    positional = list(args.posonlyargs) + list(args.args)
+    if positional and positional[0].arg in ("self", "cls"):
+        positional = positional[1:]
+    extra = [a for a in (args.vararg, args.kwarg) if a is not None]
+    return any(a.annotation is not None for a in positional + list(args.kwonlyargs) + extra)
+
+
+_child_fields_cache = {}
+
+
+def _child_fields(node_type) -> Tuple[str, ...]:
+    """노드 타입별로 자식 노드를 담을 수 있는 필드 (역순 — 스택에 넣으면 전위 순서)."""
+    fields = _child_fields_cache.get(node_type)
+    if fields is None:
+        fields = () if node_type in _LEAF_NODES else tuple(
+            f for f in reversed(node_type._fields) if f not in _SKIPPED_FIELDS
+        )
+        _child_fields_cache[node_type] = fields
+    return fields
+
+
+def extract_features(tree: ast.Module) -> ScriptFeatures:
+    """트리를 한 번 순회해 ScriptFeatures 생성.
+
+    복잡도는 L5의 기존 정의(ast.walk(함수) 안의 분기 노드 수 + 1)와 같다. 순회 중에는
+    가장 안쪽 함수에만 분기 수를 더하고, 끝에서 중첩 함수의 합을 바깥 함수로 올린다.
+    """
+    functions = []  # [ast 깊이, 전위 순서, 노드, 자기 분기 수, 바깥 함수 항목]
+    imports_argparse = False
+    argument_parsers = 0
+    add_arguments = []
+    try_blocks = 0
+    except_types = set()
+    bare_excepts = 0
+    sys_exit_calls = 0
+    argv_flags = set()
+
+    AST = ast.AST
+    order = 0
+    stack = [(tree, 0, None)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        node, depth, fn = pop()
+        order += 1
+        t = type(node)
+
+        if t in _BRANCH_NODES:
+            if fn is not None:
+                fn[3] += 1
+            if t is ast.ExceptHandler:
+                if node.type is None:
+                    bare_excepts += 1
+                else:
+                    types = node.type.elts if type(node.type) is ast.Tuple else (node.type,)
+                    except_types.update(filter(None, map(_dotted, types)))
+        elif t is ast.BoolOp:
+            if fn is not None:
+                fn[3] += len(node.values) - 1
+        elif t is ast.Call:
+            name = _dotted(node.func)
+            tail = name.rpartition(".")[2]
+            if tail == "ArgumentParser":
+                argument_parsers += 1
+            elif tail == "add_argument":
+                add_arguments.append(tuple(
+                    a.value for a in node.args
+                    if type(a) is ast.Constant and isinstance(a.value, str)
+                ))
+            elif name == "sys.exit":
+                sys_exit_calls += 1
+        elif t is ast.Compare:
+            # '--verify' in sys.argv, sys.argv[1] == '--help' 처럼 argparse 없이 보는 옵션
+            operands = [node.left, *node.comparators]
+            if any(map(_is_argv, operands)):
+                for operand in operands:
+                    argv_flags.update(_option_constants(operand))
+        elif t in _FUNCTION_NODES:
+            fn = [depth, order, node, 0, fn]
+            functions.append(fn)
+        elif t in _TRY_NODES:
+            try_blocks += 1
+        elif t is ast.Import:
+            imports_argparse |= any(a.name == "argparse" for a in node.names)
+        elif t is ast.ImportFrom:
+            imports_argparse |= node.module == "argparse"
+
+        depth += 1
+        for field in _child_fields(t):
+            value = getattr(node, field, None)
+            if type(value) is list:
+                for item in reversed(value):
+                    if isinstance(item, AST):
+                        push((item, depth, fn))
+            elif isinstance(value, AST):
+                push((value, depth, fn))
+
+    # 안쪽 함수부터 분기 수를 바깥 함수로 누적
+    for fn in sorted(functions, key=lambda f: -f[0]):
+        if fn[4] is not None:
+            fn[4][3] += fn[3]
+    functions.sort(key=lambda f: (f[0], f[1]))
+    return ScriptFeatures(
+        module_docstring=ast.get_docstring(tree, clean=False) is not None,
+        functions=tuple(
+            FunctionFeatures(
+                name=node.name,
+                lineno=node.lineno,
+                has_docstring=ast.get_docstring(node, clean=False) is not None,
+                annotated=_is_annotated(node),
+                complexity=1 + branches,
+            )
+            for _, _, node, branches, _ in functions
+        ),
+        imports_argparse=imports_argparse,
+        argument_parsers=argument_parsers,
+        add_arguments=tuple(add_arguments),
+        try_blocks=try_blocks,
+        except_types=tuple(sorted(except_types)),
+        bare_excepts=bare_excepts,
+        sys_exit_calls=sys_exit_calls,
+        argv_flags=tuple(sorted(argv_flags)),
+    )
+
+
+def approx_size(features: Optional[ScriptFeatures]) -> int:
+    """캐시 항목 하나의 대략 바이트 크기 (FeatureCache 용량 계산용)."""
+    if features is None:
+        return _ENTRY_BYTES
+    size = _ENTRY_BYTES
+    for fn in features.functions:
+        size += _FUNCTION_BYTES + len(fn.name)
+    for args in features.add_arguments:
+        size += _STRING_BYTES + sum(_STRING_BYTES + len(a) for a in args)
+    for name in features.except_types + features.argv_flags:
+        size += _STRING_BYTES + len(name)
+    return size
+
+
+def content_key(content: str) -> bytes:
+    """캐시 키 — 스크립트 내용(UTF-8, 개행 정규화 후) sha256."""
+    return hashlib.sha256(content.encode("utf-8", "surrogatepass")).digest()
+
+
+class FeatureCache:
+    """내용 해시 → ScriptFeatures LRU (파싱 실패는 None으로 캐시).
+
+    항목 수(maxsize)와 approx_size 합(max_bytes) 중 하나라도 넘으면 오래된 것부터 버린다.
+    store(디스크 캐시, lookup/store/flush/close)가 붙어 있으면 메모리 미스 때 먼저
+    조회하고, 새로 분석한 결과를 넘긴다.
+    """
+
+    def __init__(self, maxsize: int = CACHE_SIZE, store=None, max_bytes: int = CACHE_BYTES):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.store = store
+        self._data: "OrderedDict[bytes, Tuple[Optional[ScriptFeatures], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+            self.hits = self.misses = 0
+
+    def attach(self, store):
+        """디스크 캐시 교체 (이전 것은 flush 후 닫음). None이면 떼어낸다."""
+        with self._lock:
+            previous, self.store = self.store, store
+        if previous is not None and previous is not store:
+            previous.close()
+
+    def flush(self):
+        store = self.store
+        if store is not None:
+            with self._lock:
+                store.flush()
+
+    def features(self, content: str, filename: str = "<unknown>") -> Optional[ScriptFeatures]:
+        """content의 ScriptFeatures. SyntaxError(또는 NUL 바이트)면 None."""
+        key = content_key(content)
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key][0]
+            self.misses += 1
+            store = self.store
+            found, result = store.lookup(key) if store is not None else (False, None)
+        if not found:
+            try:
+                result = extract_features(ast.parse(content, filename=filename))
+            except (SyntaxError, ValueError):
+                result = None
+            if store is not None:
+                with self._lock:
+                    store.store(key, result)
+        size = approx_size(result)
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous[1]
+            self._data[key] = (result, size)
+            self.nbytes += size
+            while len(self._data) > 1 and (len(self._data) > self.maxsize or self.nbytes > self.max_bytes):
+                self.nbytes -= self._data.popitem(last=False)[1][1]
+        return result
+
+
+# 프로세스 전역 캐시 (스킬 간 같은 내용의 스크립트도 한 번만 파싱)
+FEATURES = FeatureCache()
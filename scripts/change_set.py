@@ -0,0 +1,106 @@
+"""Change Set — git diff에서 다시 평가할 스킬 계산 (--changed-since)."""
+
+import json
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from discovery import IGNORE_FILE_NAME, iter_source_skills
+from git_source import GitSource
+from models import SkillMetadata
+from result_cache import BENCHMARK_FILES
+from section_taxonomy import SectionTaxonomy
+
+
+def _under(path: str, rel_dir: str) -> bool:
+    """path가 rel_dir 자신/하위이거나, rel_dir이 path(아카이브 파일 등) 하위인지."""
+    return path == rel_dir or path.startswith(rel_dir + "/") or rel_dir.startswith(path + "/")
+
+
+def _changed_bench_entries(source: GitSource, benchmarks_dir: Path, changed: set) -> Optional[set]:
+    """바뀐 벤치마크 파일에서 항목이 달라진 스킬 이름. 파일을 해석할 수 없으면 None."""
+    names = set()
+    repo = source.repo.resolve()
+    for rel in BENCHMARK_FILES.values():
+        bench_file = (benchmarks_dir / rel).resolve()
+        try:
+            repo_path = bench_file.relative_to(repo).as_posix()
+        except ValueError:
+            continue  # 저장소 밖 벤치마크는 비교할 기준이 없다
+        if repo_path not in changed:
+            continue
+        try:
+            old_text = source.show(repo_path)
+            old = json.loads(old_text) if old_text is not None else {}
+            new = json.loads(bench_file.read_text(encoding="utf-8")) if bench_file.exists() else {}
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+            return None
+        if not isinstance(old, dict) or not isinstance(new, dict):
+            return None
+        names.update(k for k in old.keys() | new.keys() if old.get(k) != new.get(k))
+    return names
+
+
+class ChangeSet:
+    """ref 커밋과 작업 트리 사이에 바뀐 스킬.
+
+    paths는 skills_root 기준 바뀐 경로, old_skills는 바뀐 경로를 담은 ref 시점
+    스킬(키워드 비교용), bench_names는 벤치마크 항목이 바뀐 스킬 이름, commit은 ref를
+    고정한 커밋 sha다.
+    full이 참이면 (.skillignore 변경 등) 영향 범위를 좁힐 수 없어 전체를 평가한다.
+    """
+
+    def __init__(self, skills_root: Path, ref: str, paths: List[str], old_skills: List[SkillMetadata] = (),
+                 bench_names: set = (), full: bool = False, commit: str = ""):
+        self.skills_root = skills_root
+        self.ref = ref
+        self.commit = commit
+        self.paths = paths
+        self.old_skills = list(old_skills)
+        self.bench_names = set(bench_names)
+        self.full = full
+
+    @classmethod
+    def from_git(cls, skills_root: Path, ref: str, benchmarks_dir: Path = None, max_depth: int = 1,
+                 ignore_patterns=None, taxonomy: SectionTaxonomy = None) -> "ChangeSet":
+        """skills_root가 속한 저장소에서 ref 대비 변경 계산. ref나 저장소가 유효하지 않으면 ValueError."""
+        source = GitSource.open(skills_root, ref)
+        try:
+            prefix = f"{source.subdir}/" if source.subdir else ""
+            changed = set(source.changed_paths())
+            paths = sorted(p[len(prefix):] for p in changed if p.startswith(prefix))
+            if IGNORE_FILE_NAME in paths:
+                return cls(skills_root, ref, paths, full=True, commit=source.rev)
+            bench_names = _changed_bench_entries(source, benchmarks_dir, changed) if benchmarks_dir else set()
+            if bench_names is None:
+                return cls(skills_root, ref, paths, full=True, commit=source.rev)
+            old_skills = list(iter_source_skills(
+                source, skills_root, max_depth=max_depth, ignore_patterns=ignore_patterns, taxonomy=taxonomy,
+                include=lambda p: any(_under(path, p.rstrip("/")) for path in paths),
+            ))
+        finally:
+            source.close()
+        return cls(skills_root, ref, paths, old_skills, bench_names, commit=source.rev)
+
+    def _rel(self, skill: SkillMetadata) -> Optional[str]:
+        rel = os.path.relpath(skill.skill_path, self.skills_root)
+        return None if rel.startswith("..") else Path(rel).as_posix()
+
+    def is_changed(self, skill: SkillMetadata) -> bool:
+        """스킬 디렉토리 안의 파일이나 스킬의 벤치마크 항목이 바뀌었는지."""
+        if self.full or skill.name in self.bench_names or skill.local_name in self.bench_names:
+            return True
+        rel = self._rel(skill)
+        if rel is None:
+            return True
+        return any(_under(path, rel) for path in self.paths)
+
+    def overlap_partners(self, evaluated: List[SkillMetadata], candidates: List[SkillMetadata]) -> List[SkillMetadata]:
+        """candidates 중 다시 평가한 스킬의 현재 키워드나 바뀐 스킬의 ref 시점 키워드와 겹치는 스킬.
+
+        이들의 L2 trigger_overlap은 바뀐 스킬에 따라 달라지므로 스냅샷을 쓸 수 없다.
+        """
+        words = set()
+        for skill in [*evaluated, *self.old_skills]:
+            words.update(skill.triggers.normalized)
+        return [s for s in candidates if words.intersection(s.triggers.normalized)]
@@ -1,9 +1,11 @@
 """EvalConfig 로더 (IO 전담)."""
 
 import json
+import re
 from pathlib import Path
 
-from eval_config import EvalConfig, DEFAULT_LAYER_WEIGHTS
+from eval_config import EvalConfig, DEFAULT_LAYER_WEIGHTS, DEFAULT_SECTION_TAXONOMY
+from section_taxonomy import SectionTaxonomy
 
 
 def _validate_layer_weights(weights: dict):
@@ -18,6 +20,23 @@ def _validate_layer_weights(weights: dict):
             raise ValueError(f"Layer weight for {lid} must be non-negative")
 
 
+def _validate_section_taxonomy(taxonomy: dict):
+    """section_taxonomy 유효성 검증 (카테고리명은 식별자, 패턴은 정규식)."""
+    if not isinstance(taxonomy, dict):
+        raise ValueError("section_taxonomy must be an object")
+    for name, patterns in taxonomy.items():
+        if not name.isidentifier():
+            raise ValueError(f"Section category name must be an identifier: {name!r}")
+        items = [patterns] if isinstance(patterns, str) else patterns
+        if not isinstance(items, list) or not items or not all(isinstance(p, str) for p in items):
+            raise ValueError(f"Section patterns for {name} must be a string or a list of strings")
+        for pattern in items:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid section pattern for {name}: {pattern!r} ({e})") from e
+
+
 def load_eval_config(config_path: Path) -> EvalConfig:
     """config.json을 로드해 EvalConfig를 반환."""
     if not config_path.exists():
@@ -28,9 +47,18 @@ def load_eval_config(config_path: Path) -> EvalConfig:
     _validate_layer_weights(raw_weights)
     merged_weights = dict(DEFAULT_LAYER_WEIGHTS)
     merged_weights.update(raw_weights)
+    raw_taxonomy = raw.get("section_taxonomy", {})
+    _validate_section_taxonomy(raw_taxonomy)
+    merged_taxonomy = dict(DEFAULT_SECTION_TAXONOMY)
+    merged_taxonomy.update(raw_taxonomy)
+    try:
+        SectionTaxonomy(merged_taxonomy)
+    except re.error as e:  # 패턴 안의 그룹명이 카테고리명과 겹치는 경우 등
+        raise ValueError(f"Cannot combine section patterns: {e}") from e
 
     return EvalConfig(
         skills_root=raw.get("skills_root", ""),
         threshold=raw.get("threshold", 60.0),
         layer_weights=merged_weights,
+        section_taxonomy=merged_taxonomy,
     )
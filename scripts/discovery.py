@@ -1,10 +1,39 @@
 """SKILL.md 파서 + 스킬 자동 탐지."""
 
+import fnmatch
+import os
 import re
+import sys
+import tarfile
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
-
-from models import SkillMetadata, TriggerInfo
+from typing import Iterator, List, Optional
+
+from archive_source import archive_stem, is_archive, open_archive
+from inventory import build_inventory, inventory_from_listing
+from markdown_scan import scan_markdown
+from models import SkillDocument, SkillMetadata, TriggerInfo
+from section_taxonomy import DEFAULT_TAXONOMY, SectionTaxonomy
+from text_search import AhoCorasick
+
+
+# 재귀 탐색 시 기본으로 건너뛰는 디렉토리 (.gitignore 문법)
+DEFAULT_IGNORE_PATTERNS = (
+    ".git/", ".hg/", ".svn/", "node_modules/", ".venv/", "venv/",
+    "__pycache__/", ".tox/", ".nox/", ".mypy_cache/", ".pytest_cache/",
+)
+IGNORE_FILE_NAME = ".skillignore"
+# 지연 로드가 덮어쓰지 않는 필드 (discovery가 한정한 이름, 후처리 결과)
+_DEFERRED_KEPT_FIELDS = {"name", "qualifier", "skill_path", "pipeline_targets", "loader"}
+# section_flags 중 SkillMetadata 필드로도 노출되는 기본 카테고리
+_SECTION_FLAG_FIELDS = frozenset({
+    "has_when_to_use", "has_dont_use", "has_pipeline_integration", "has_llm_judgment_guide",
+    "has_quick_start", "has_cli_options", "has_prerequisites",
+})
 
 
 def _parse_yaml_frontmatter(text: str) -> dict:
@@ -71,126 +100,101 @@ def _extract_triggers_from_description(description: str) -> List[str]:
     return list(dict.fromkeys(triggers))  # 순서 유지 dedupe
 
 
+def _triggers_from_list(section: str) -> List[str]:
+    """트리거 섹션 목록 줄에서 키워드 추출."""
+    triggers = []
+    for line in section.split("\n"):
+        line = line.strip()
+        if line.startswith(("-", "*")):
+            # "phantom", "팬텀", "유령 의존성" 같은 패턴
+            items = re.findall(r'"([^"]+)"', line)
+            if items:
+                triggers.extend(items)
+            else:
+                # 따옴표 없는 경우: - keyword
+                kw = line.lstrip("-*").strip()
+                if kw:
+                    triggers.extend([k.strip() for k in kw.split(",") if k.strip()])
+    return list(dict.fromkeys(triggers))
+
+
 def _extract_triggers_from_markdown(body: str) -> List[str]:
     """markdown 본문에서 ## 트리거 섹션의 키워드 추출 (depsolve-analyzer 대응)."""
-    triggers = []
+    span = scan_markdown(body, frontmatter=False).trigger_span
+    if span is None:
+        return []
+    return _triggers_from_list(body[span[0]:span[1]])
 
-    match = re.search(
-        r'##\s*트리거\s*\n(?:(?![-*]\s).*\n)*((?:[-*]\s*.+\n?)+)',
-        body,
-        re.MULTILINE
-    )
-    if match:
-        section = match.group(1)
-        for line in section.split("\n"):
-            line = line.strip()
-            if line.startswith(("-", "*")):
-                # "phantom", "팬텀", "유령 의존성" 같은 패턴
-                items = re.findall(r'"([^"]+)"', line)
-                if items:
-                    triggers.extend(items)
-                else:
-                    # 따옴표 없는 경우: - keyword
-                    kw = line.lstrip("-*").strip()
-                    if kw:
-                        triggers.extend([k.strip() for k in kw.split(",") if k.strip()])
 
-    return list(dict.fromkeys(triggers))
+def _build_name_matcher(skill_names: List[str]) -> AhoCorasick:
+    """스킬 이름 전체에 대한 대소문자 무시 오토마톤 생성."""
+    return AhoCorasick(name.lower() for name in skill_names)
 
 
-def _extract_sections(body: str) -> dict:
-    """markdown 본문을 ## 헤더 기준으로 분리 → {header_text: content}."""
-    sections = {}
-    current_header = None
-    current_lines = []
-
-    for line in body.split("\n"):
-        if line.startswith("## "):
-            if current_header is not None:
-                sections[current_header] = "\n".join(current_lines)
-            current_header = line[3:].strip()
-            current_lines = []
-        elif current_header is not None:
-            current_lines.append(line)
-
-    if current_header is not None:
-        sections[current_header] = "\n".join(current_lines)
-
-    return sections
-
-
-def _extract_code_blocks(body: str) -> List[tuple]:
-    """fenced code block에서 (언어태그, 내용) 추출."""
-    pattern = re.compile(r'```(\w*)\n(.*?)```', re.DOTALL)
-    return pattern.findall(body)
-
-
-def _detect_pipeline_targets(body: str, skill_names: List[str]) -> List[str]:
-    """본문에서 다른 스킬 이름 참조 탐지."""
-    targets = []
-    body_lower = body.lower()
-    for name in skill_names:
-        if name.lower() in body_lower:
-            targets.append(name)
-    return targets
-
-
-def _detect_section_presence(sections: dict) -> dict:
-    """알려진 섹션 패턴 존재 여부 판별."""
-    result = {
-        "has_when_to_use": False,
-        "has_dont_use": False,
-        "has_pipeline_integration": False,
-        "has_llm_judgment_guide": False,
-        "has_quick_start": False,
-        "has_cli_options": False,
-        "has_prerequisites": False,
-    }
-    for header in sections:
-        h = header.lower()
-        if re.search(r'when to use|사용\s*조건|언제\s*사용', h):
-            result["has_when_to_use"] = True
-        if re.search(r"don'?t use|비목표|non-?goal|비사용", h):
-            result["has_dont_use"] = True
-        if re.search(r'pipeline|파이프라인', h):
-            result["has_pipeline_integration"] = True
-        if re.search(r'llm.*판단|llm.*decision|자가\s*판단', h):
-            result["has_llm_judgment_guide"] = True
-        if re.search(r'quick\s*start|빠른\s*시작', h):
-            result["has_quick_start"] = True
-        if re.search(r'cli.*옵션|cli.*option|command', h):
-            result["has_cli_options"] = True
-        if re.search(r'prerequisit|사전\s*요구|설치|setup|환경', h):
-            result["has_prerequisites"] = True
-    return result
+def _detect_pipeline_targets(
+    body: str,
+    skill_names: List[str],
+    matcher: Optional[AhoCorasick] = None,
+) -> List[str]:
+    """본문에서 다른 스킬 이름 참조 탐지.
+
+    matcher는 skill_names로 만든 오토마톤이며, 여러 본문을 스캔할 때
+    한 번만 빌드해 재사용한다. 결과는 skill_names 순서를 따른다.
+    """
+    if matcher is None:
+        matcher = _build_name_matcher(skill_names)
+    hits = matcher.find_all(body.lower())
+    return [skill_names[i] for i in sorted(hits)]
 
 
-def parse_skill_md(skill_dir: Path) -> Optional[SkillMetadata]:
-    """SKILL.md를 파싱하여 SkillMetadata 생성."""
-    skill_md = skill_dir / "SKILL.md"
-    if not skill_md.exists():
+def _detect_section_presence(sections, taxonomy: SectionTaxonomy = None) -> dict:
+    """섹션 카테고리 존재 여부 {"has_<카테고리>": bool} (sections는 헤더 iterable).
+
+    카테고리는 taxonomy(config의 section_taxonomy)가 정하며, 헤더마다 결합
+    정규식 match 1회로 분류한다.
+    """
+    return (taxonomy or DEFAULT_TAXONOMY).flags(sections)
+
+
+def _apply_section_flags(skill: SkillMetadata, flags: dict):
+    """section_flags와 기본 카테고리 필드(has_when_to_use 등)를 함께 설정."""
+    skill.section_flags = flags
+    for name, value in flags.items():
+        if name in _SECTION_FLAG_FIELDS:
+            setattr(skill, name, value)
+
+
+def build_skill_document(text: str) -> SkillDocument:
+    """SKILL.md 텍스트로 SkillDocument 생성 (scan_markdown 1회)."""
+    return SkillDocument(text=text, scan=scan_markdown(text))
+
+
+def parse_skill_md(skill_dir: Path, inventory=None, taxonomy: SectionTaxonomy = None) -> Optional[SkillMetadata]:
+    """SKILL.md를 파싱하여 SkillMetadata 생성.
+
+    파일시스템은 build_inventory()로 한 번만 순회하고, 디렉토리/파일 존재 여부와
+    스크립트·참조 파일 목록은 모두 그 인벤토리에서 얻는다. 아카이브 등 디렉토리가
+    아닌 소스는 미리 만든 inventory를 넘긴다. taxonomy는 섹션 분류 (기본: DEFAULT_TAXONOMY).
+    """
+    if inventory is None:
+        inventory = build_inventory(skill_dir)
+    if not inventory.has_file("SKILL.md"):
         return None
+    document = build_skill_document(inventory.read_text("SKILL.md"))
 
-    text = skill_md.read_text(encoding="utf-8")
-    lines = text.split("\n")
+    text = document.text
+    scan = document.scan
 
-    # YAML frontmatter 파싱
-    yaml_data = _parse_yaml_frontmatter(text)
+    # YAML frontmatter 파싱 (frontmatter 구간만)
+    yaml_data = _parse_yaml_frontmatter(text[:scan.frontmatter_end])
     name = yaml_data.get("name", skill_dir.name)
     description = yaml_data.get("description", "")
 
-    # body (frontmatter 이후)
-    body_start = 0
-    if lines and lines[0].strip() == "---":
-        for i, line in enumerate(lines[1:], 1):
-            if line.strip() == "---":
-                body_start = i + 1
-                break
-    body = "\n".join(lines[body_start:])
-
     # 트리거 추출 (이중 파싱)
     yaml_triggers = _extract_triggers_from_description(description)
-    md_triggers = _extract_triggers_from_markdown(body)
+    md_triggers = []
+    if scan.trigger_span is not None:
+        md_triggers = _triggers_from_list(text[scan.trigger_span[0]:scan.trigger_span[1]])
 
     if yaml_triggers and md_triggers:
         all_triggers = list(dict.fromkeys(yaml_triggers + md_triggers))
@@ -205,72 +209,503 @@ def parse_skill_md(skill_dir: Path) -> Optional[SkillMetadata]:
         all_triggers = []
         source = "yaml_description"
 
-    # 섹션 분석
-    sections = _extract_sections(body)
-    section_presence = _detect_section_presence(sections)
-    code_blocks = _extract_code_blocks(body)
-    code_languages = list(dict.fromkeys(lang for lang, _ in code_blocks if lang))
-    section_headers = list(sections.keys())
-
-    # 파일시스템 스캔
-    scripts_dir = skill_dir / "scripts"
-    refs_dir = skill_dir / "references"
-    bridges_dir = skill_dir / "bridges"
-    tests_dir = skill_dir / "tests"
+    # 섹션 분석 (헤더/언어태그만 필요하므로 내용은 잘라내지 않는다)
+    section_headers = document.section_headers
+    section_presence = _detect_section_presence(section_headers, taxonomy)
+    code_languages = list(dict.fromkeys(lang for lang, _, _ in scan.code_blocks if lang))
 
-    script_files = []
-    if scripts_dir.is_dir():
-        script_files = [f.name for f in scripts_dir.rglob("*.py")]
+    # 파일시스템 스캔 (인벤토리 조회)
+    script_files = [e.name for e in inventory.files("scripts", ".py")]
+    ref_files = [e.name for e in inventory.files("references", recursive=False)]
 
-    ref_files = []
-    if refs_dir.is_dir():
-        ref_files = [f.name for f in refs_dir.iterdir() if f.is_file()]
-
-    return SkillMetadata(
+    meta = SkillMetadata(
         name=name,
         description=description,
         skill_path=skill_dir,
         triggers=TriggerInfo(keywords=all_triggers, source=source),
-        has_scripts_dir=scripts_dir.is_dir(),
-        has_references_dir=refs_dir.is_dir(),
-        has_bridges_dir=bridges_dir.is_dir(),
-        has_tests_dir=tests_dir.is_dir(),
-        has_design_decision=(skill_dir / "DESIGN_DECISION.md").exists(),
-        has_when_to_use=section_presence["has_when_to_use"],
-        has_dont_use=section_presence["has_dont_use"],
-        has_pipeline_integration=section_presence["has_pipeline_integration"],
-        has_llm_judgment_guide=section_presence["has_llm_judgment_guide"],
-        has_quick_start=section_presence["has_quick_start"],
-        has_cli_options=section_presence["has_cli_options"],
-        has_prerequisites=section_presence["has_prerequisites"],
+        has_scripts_dir=inventory.has_dir("scripts"),
+        has_references_dir=inventory.has_dir("references"),
+        has_bridges_dir=inventory.has_dir("bridges"),
+        has_tests_dir=inventory.has_dir("tests"),
+        has_design_decision=inventory.has_file("DESIGN_DECISION.md"),
         script_files=script_files,
         reference_files=ref_files,
-        skill_md_lines=len(lines),
-        code_block_count=len(code_blocks),
+        skill_md_lines=document.line_count,
+        code_block_count=len(scan.code_blocks),
         code_block_languages=code_languages,
         section_headers=section_headers,
         pipeline_targets=[],  # 다른 스킬명을 알아야 하므로 discover_skills에서 후처리
+        document=document,
+        inventory=inventory,
     )
+    _apply_section_flags(meta, section_presence)
+    return meta
 
 
-def discover_skills(skills_root: Path) -> List[SkillMetadata]:
-    """skills_root 아래에서 SKILL.md가 있는 모든 스킬을 탐지."""
-    skills = []
-    if not skills_root.is_dir():
-        return skills
+def read_frontmatter(skill_md: Path) -> str:
+    """SKILL.md에서 frontmatter 구간(닫는 --- 줄 포함)만 읽는다. 없으면 "".
 
-    for child in sorted(skills_root.iterdir()):
-        if child.is_dir() and (child / "SKILL.md").exists():
-            meta = parse_skill_md(child)
-            if meta:
-                skills.append(meta)
+    read_text()로 파일 전체를 읽지 않고 버퍼 단위로 줄을 읽어 줄마다 디코드하다가
+    닫는 ---에서 멈춘다 (닫히지 않으면 파일 끝까지). 본문은 디코드하지 않는다.
+    \r만 쓰는 줄바꿈은 줄 단위로 나눌 수 없으므로 전체를 읽는다.
+    """
+    with open(skill_md, "rb") as f:
+        first = f.readline()
+        if b"\r" in first.rstrip(b"\r\n"):
+            return (first + f.read()).decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        if first.strip() != b"---":
+            return ""
+        lines = [first]
+        for line in f:
+            lines.append(line)
+            if line.strip() == b"---":
+                break
+    return b"".join(lines).decode("utf-8").replace("\r\n", "\n")
 
-    # pipeline_targets 후처리: 다른 스킬 이름 참조 탐지
-    skill_names = [s.skill_path.name for s in skills]
-    for skill in skills:
-        skill_md = skill.skill_path / "SKILL.md"
-        body = skill_md.read_text(encoding="utf-8")
-        other_names = [n for n in skill_names if n != skill.skill_path.name]
-        skill.pipeline_targets = _detect_pipeline_targets(body, other_names)
 
+def _load_deferred_skill(skill: SkillMetadata, taxonomy: SectionTaxonomy = None):
+    """parse_skill_frontmatter로 만든 스킬의 나머지 필드를 전체 파싱으로 채운다."""
+    full = parse_skill_md(skill.skill_path, inventory=getattr(skill, "inventory", None), taxonomy=taxonomy)
+    if full is None:
+        raise FileNotFoundError(f"SKILL.md disappeared: {skill.skill_path}")
+    for f in fields(full):
+        if f.name not in _DEFERRED_KEPT_FIELDS:
+            setattr(skill, f.name, getattr(full, f.name))
+
+
+def parse_skill_frontmatter(
+    skill_dir: Path, inventory=None, taxonomy: SectionTaxonomy = None,
+) -> Optional[SkillMetadata]:
+    """frontmatter만 파싱한 지연 SkillMetadata (SkillMetadata.deferred). 스킬이 아니면 None.
+
+    본문 스캔·트리거 추출·파일시스템 인벤토리는 평가기가 해당 필드에 처음
+    접근할 때 parse_skill_md로 수행한다. inventory를 넘기면 (아카이브/git 소스)
+    SKILL.md를 그 인벤토리에서 읽는다.
+    """
+    if inventory is None:
+        try:
+            text = read_frontmatter(skill_dir / "SKILL.md")
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+    elif inventory.has_file("SKILL.md"):
+        text = inventory.read_text("SKILL.md")
+    else:
+        return None
+    yaml_data = _parse_yaml_frontmatter(text)
+    return SkillMetadata.deferred(
+        name=yaml_data.get("name", skill_dir.name),
+        description=yaml_data.get("description", ""),
+        skill_path=skill_dir,
+        loader=partial(_load_deferred_skill, taxonomy=taxonomy),
+        inventory=inventory,
+    )
+
+
+def compile_ignore_patterns(patterns) -> List[tuple]:
+    """.gitignore 스타일 패턴 → (negate, anchored, glob) 규칙 목록.
+
+    지원: 빈 줄/# 주석, ! 부정, 끝의 / (디렉토리 전용 — 탐색 대상은 디렉토리뿐),
+    앞의 **/ (모든 깊이), / 가 포함된 패턴은 skills_root 기준 상대경로에,
+    아니면 디렉토리명에 매칭.
+    """
+    rules = []
+    for raw in patterns:
+        pattern = raw.strip()
+        if not pattern or pattern.startswith("#"):
+            continue
+        negate = pattern.startswith("!")
+        if negate:
+            pattern = pattern[1:]
+        pattern = pattern.rstrip("/")
+        if pattern.startswith("**/"):
+            pattern = pattern[3:]
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        if pattern.endswith("/**"):
+            pattern = pattern[:-1]
+        if pattern:
+            rules.append((negate, anchored, pattern))
+    return rules
+
+
+def _is_ignored(rel_path: str, name: str, rules: List[tuple]) -> bool:
+    """마지막으로 매칭된 규칙이 이긴다 (.gitignore와 동일)."""
+    ignored = False
+    for negate, anchored, pattern in rules:
+        if fnmatch.fnmatchcase(rel_path if anchored else name, pattern):
+            ignored = not negate
+    return ignored
+
+
+def load_ignore_rules(skills_root: Path, extra_patterns=None) -> List[tuple]:
+    """기본 패턴 + skills_root/.skillignore + extra_patterns 순으로 규칙 생성."""
+    patterns = list(DEFAULT_IGNORE_PATTERNS)
+    ignore_file = skills_root / IGNORE_FILE_NAME
+    if ignore_file.is_file():
+        patterns.extend(ignore_file.read_text(encoding="utf-8").splitlines())
+    patterns.extend(extra_patterns or [])
+    return compile_ignore_patterns(patterns)
+
+
+def find_skill_candidates(skills_root: Path, max_depth: int = 1, rules: List[tuple] = None) -> Iterator[Path]:
+    """SKILL.md가 있는 디렉토리와 아카이브 파일을 상대경로 정렬 순서(DFS)로 yield.
+
+    - 무시 규칙에 걸린 디렉토리는 하위까지 통째로 건너뛴다 (early pruning).
+    - SKILL.md를 찾은 디렉토리 아래로는 더 내려가지 않는다.
+    - 아카이브(.zip/.tar.gz 등)는 내용을 보지 않고 그대로 yield한다
+      (iter_archive_skills가 같은 규칙으로 멤버를 탐색).
+    - max_depth: skills_root 직속이 1. 0 이하면 무제한.
+    """
+    rules = rules or []
+
+    def _walk(directory: Path, prefix: str, depth: int):
+        try:
+            with os.scandir(directory) as it:
+                # 직속 항목만 심볼릭 링크 디렉토리를 따라간다 (하위 순환 방지)
+                children = sorted(
+                    (
+                        e for e in it
+                        if e.is_dir(follow_symlinks=depth == 1)
+                        or (is_archive(e.name) and e.is_file())
+                    ),
+                    key=lambda e: e.name,
+                )
+        except OSError:
+            return
+        for child in children:
+            rel = f"{prefix}{child.name}"
+            if _is_ignored(rel, child.name, rules):
+                continue
+            child_path = directory / child.name
+            if not child.is_dir(follow_symlinks=depth == 1):
+                yield child_path
+                continue
+            at_limit = 0 < max_depth <= depth
+            if at_limit:
+                if (child_path / "SKILL.md").is_file():
+                    yield child_path
+                continue
+            try:
+                with os.scandir(child_path) as it:
+                    has_skill_md = any(e.name == "SKILL.md" and e.is_file() for e in it)
+            except OSError:
+                continue
+            if has_skill_md:
+                yield child_path
+            else:
+                yield from _walk(child_path, rel + "/", depth + 1)
+
+    yield from _walk(skills_root, "", 1)
+
+
+def find_listing_skill_prefixes(
+    paths,
+    max_depth: int = 1,
+    rules: List[tuple] = None,
+    base: str = "",
+    root_skill: bool = True,
+) -> List[str]:
+    """파일 경로 목록(아카이브 멤버, git 트리 등)에서 스킬 디렉토리 prefix 추출.
+
+    find_skill_candidates와 같은 규칙: 경로 정렬 순서, 무시 규칙에 걸린 디렉토리
+    하위 제외, SKILL.md가 있는 디렉토리 아래로는 내려가지 않음. 반환값은
+    "a/b/" 형태이며, root_skill이 참이고 루트에 SKILL.md가 있으면 [""] 하나다
+    (디렉토리 탐색처럼 root_skill=False면 루트의 SKILL.md는 무시).
+    base는 무시 규칙 매칭 시 앞에 붙는 상대경로 (예: 아카이브의 상위 디렉토리).
+    """
+    rules = rules or []
+    skill_dirs = sorted(
+        {p[: -len("SKILL.md")] for p in paths if p == "SKILL.md" or p.endswith("/SKILL.md")},
+        key=lambda d: d.split("/"),
+    )
+    if "" in skill_dirs:
+        if root_skill:
+            return [""]
+        skill_dirs.remove("")
+    accepted = []
+    accepted_set = set()
+    for prefix in skill_dirs:
+        parts = prefix.rstrip("/").split("/")
+        if 0 < max_depth < len(parts):
+            continue
+        ancestors = ["/".join(parts[:i]) + "/" for i in range(1, len(parts))]
+        if any(a in accepted_set for a in ancestors):
+            continue
+        if any(
+            _is_ignored(base + "/".join(parts[: i + 1]), parts[i], rules)
+            for i in range(len(parts))
+        ):
+            continue
+        accepted.append(prefix)
+        accepted_set.add(prefix)
+    return accepted
+
+
+def _group_listing(listing, prefixes: List[str]) -> dict:
+    """listing을 스킬 prefix별로 분배 (prefix는 서로 중첩되지 않음)."""
+    groups = {prefix: [] for prefix in prefixes}
+    if "" in groups:
+        groups[""] = list(listing)
+        return groups
+    for item in listing:
+        parts = item[0].split("/")
+        for i in range(1, len(parts)):
+            bucket = groups.get("/".join(parts[:i]) + "/")
+            if bucket is not None:
+                bucket.append(item)
+                break
+    return groups
+
+
+def _skill_parser(metadata_only: bool = False, taxonomy: SectionTaxonomy = None):
+    """(skill_dir, inventory) → SkillMetadata 파서 선택."""
+    return partial(parse_skill_frontmatter if metadata_only else parse_skill_md, taxonomy=taxonomy)
+
+
+def _qualify(meta: SkillMetadata, qualifier: str):
+    """중첩 스킬 이름을 상위 상대경로로 한정 (frontmatter 이름은 meta.local_name)."""
+    if qualifier:
+        meta.qualifier = qualifier
+        meta.name = f"{qualifier}/{meta.name}"
+
+
+def _skills_from_listing(source, listing, prefixes: List[str], skill_dir_for, qualifier_base: str = "", parse=None):
+    """prefix별 인벤토리를 만들어 파싱하고 SkillMetadata를 순서대로 yield.
+
+    skill_dir_for(prefix)는 스킬의 (가상) 경로를 돌려준다. 이름은 중첩 디렉토리와
+    마찬가지로 qualifier_base + prefix의 상위 경로로 한정한다. parse는
+    _skill_parser()의 결과 (기본: parse_skill_md).
+    """
+    parse = parse or parse_skill_md
+    groups = _group_listing(listing, prefixes)
+    for prefix in prefixes:
+        skill_dir = skill_dir_for(prefix)
+        inventory = inventory_from_listing(skill_dir, groups[prefix], prefix, reader=source)
+        meta = parse(skill_dir, inventory=inventory)
+        if meta is None:
+            continue
+        _qualify(meta, (qualifier_base + prefix.rstrip("/").rpartition("/")[0]).rstrip("/"))
+        yield meta
+
+
+def iter_archive_skills(
+    archive: Path,
+    max_depth: int = 1,
+    rules: List[tuple] = None,
+    skills_root: Path = None,
+    metadata_only: bool = False,
+    taxonomy: SectionTaxonomy = None,
+) -> List[SkillMetadata]:
+    """아카이브 안의 스킬을 압축 해제 없이 파싱.
+
+    멤버 목록(zip central directory / tar 헤더)을 한 번 읽어 스킬별 인벤토리를
+    만들고, 파일 내용은 평가기가 요청할 때 멤버 단위로 읽는다. 아카이브는
+    자신이 놓인 디렉토리를 대신하는 투명한 컨테이너로 취급한다. 루트에
+    SKILL.md가 있으면 아카이브 자체가 스킬 하나다 (이름 기본값은 확장자를 뗀 파일명).
+    """
+    source = open_archive(archive)
+    try:
+        listing = source.listing()
+    except (OSError, ValueError, EOFError, zipfile.BadZipFile, tarfile.TarError) as exc:
+        print(f"[WARN] Cannot read archive {archive}: {exc}", file=sys.stderr)
+        return []
+
+    parent_rel = ""
+    depth_offset = 0
+    if skills_root is not None and archive != skills_root:
+        parent = archive.parent.relative_to(skills_root).as_posix()
+        if parent != ".":
+            parent_rel = parent + "/"
+            depth_offset = parent.count("/") + 1
+    inner_depth = max_depth - depth_offset if max_depth > 0 else 0
+    if max_depth > 0 and inner_depth <= 0:
+        return []
+
+    prefixes = find_listing_skill_prefixes(
+        (path for path, _, _ in listing), inner_depth, rules, base=parent_rel,
+    )
+
+    def _skill_dir(prefix):
+        if prefix:
+            return archive / prefix.rstrip("/")
+        return archive.parent / archive_stem(archive)
+
+    parse = _skill_parser(metadata_only, taxonomy)
+    return list(_skills_from_listing(source, listing, prefixes, _skill_dir, parent_rel, parse))
+
+
+def iter_source_skills(
+    source,
+    skills_root: Path,
+    max_depth: int = 1,
+    ignore_patterns=None,
+    metadata_only: bool = False,
+    taxonomy: SectionTaxonomy = None,
+    include=None,
+) -> Iterator[SkillMetadata]:
+    """skills_root 기준 경로로 나열되는 소스(git_source.GitSource 등)에서 스킬 탐지.
+
+    디렉토리 탐색과 같은 규칙을 따르며, .skillignore도 소스에서 읽는다.
+    include(prefix)가 주어지면 참인 스킬 디렉토리("a/b/" 형태)만 파싱한다.
+    """
+    listing = source.listing()
+    patterns = list(DEFAULT_IGNORE_PATTERNS)
+    if any(path == IGNORE_FILE_NAME for path, _, _ in listing):
+        patterns.extend(source.read_bytes(IGNORE_FILE_NAME).decode("utf-8").splitlines())
+    patterns.extend(ignore_patterns or [])
+    rules = compile_ignore_patterns(patterns)
+    prefixes = find_listing_skill_prefixes(
+        (path for path, _, _ in listing), max_depth, rules, root_skill=False,
+    )
+    if include is not None:
+        prefixes = [p for p in prefixes if include(p)]
+    yield from _skills_from_listing(
+        source, listing, prefixes, lambda prefix: skills_root / prefix.rstrip("/"),
+        parse=_skill_parser(metadata_only, taxonomy),
+    )
+
+
+def _parse_candidate(
+    child: Path,
+    index=None,
+    skills_root: Path = None,
+    metadata_only: bool = False,
+    taxonomy: SectionTaxonomy = None,
+) -> Optional[SkillMetadata]:
+    """스킬 디렉토리 하나를 파싱. 스킬이 아니면 None.
+
+    index(DiscoveryIndex)가 주어지면 fingerprint가 같은 스킬은 캐시에서 복원한다
+    (섹션 분류는 캐시된 헤더로 현재 taxonomy 기준 재계산). metadata_only면 frontmatter만 읽는다 (index는 쓰지 않음).
+    skills_root 직속이 아닌 중첩 스킬은 이름이 겹치지 않도록 상위 상대경로로
+    한정한다 (예: team-a/my-skill).
+    """
+    if metadata_only:
+        meta = parse_skill_frontmatter(child, taxonomy=taxonomy)
+    else:
+        meta = index.lookup(child) if index is not None else None
+        if meta is not None:
+            _apply_section_flags(meta, _detect_section_presence(meta.section_headers, taxonomy))
+        else:
+            meta = parse_skill_md(child, taxonomy=taxonomy)
+            if meta is not None and index is not None:
+                index.store(child, meta)
+    if meta is not None and skills_root is not None:
+        parent = child.parent.relative_to(skills_root).as_posix()
+        _qualify(meta, "" if parent == "." else parent)
+    return meta
+
+
+def iter_skills(
+    skills_root: Path,
+    workers: int = 1,
+    index=None,
+    max_depth: int = 1,
+    ignore_patterns=None,
+    source=None,
+    metadata_only: bool = False,
+    taxonomy: SectionTaxonomy = None,
+) -> Iterator[SkillMetadata]:
+    """skills_root 아래 스킬을 디렉토리 경로 정렬 순서로 파싱되는 즉시 yield.
+
+    workers > 1이면 스킬 디렉토리 파싱(SKILL.md 읽기 + 파일시스템 스캔)을
+    bounded thread pool에서 (소비 위치보다 workers * 4개까지) 미리 진행해 I/O
+    대기를 겹친다. 소비 순서는 순차 실행과 동일하다.
+
+    index(discovery_index.DiscoveryIndex)를 넘기면 변경되지 않은 스킬은
+    다시 파싱하지 않는다 (아카이브 멤버는 제외). 인덱스 저장은 호출자 책임.
+
+    max_depth > 1 (0은 무제한)이면 팀 폴더 등 중첩 디렉토리까지 재귀 탐색하며,
+    기본 무시 패턴 + .skillignore + ignore_patterns에 걸린 디렉토리는 건너뛴다.
+
+    skills_root가 아카이브 파일이거나 아래에 아카이브가 있으면
+    iter_archive_skills로 멤버를 직접 읽는다. source(git_source.GitSource 등)를
+    넘기면 작업 트리 대신 그 소스의 파일 목록/내용으로 탐지한다.
+
+    metadata_only면 SKILL.md의 frontmatter(name/description)만 읽어 지연
+    SkillMetadata를 yield한다. 본문 파싱과 파일시스템 스캔은 평가기가 필드에
+    처음 접근할 때 스킬별로 수행되므로, 일부 스킬만 평가할 때 (--skill)
+    나머지 스킬은 frontmatter 이상 읽지 않는다.
+
+    taxonomy(section_taxonomy.SectionTaxonomy)는 섹션 분류 기준이며, 카테고리마다
+    SkillMetadata.section_flags["has_<카테고리>"]가 채워진다.
+
+    pipeline_targets는 전체 스킬명이 필요하므로 채우지 않는다
+    (모두 소비한 뒤 resolve_pipeline_targets 호출).
+    """
+    if source is not None:
+        yield from iter_source_skills(source, skills_root, max_depth, ignore_patterns, metadata_only, taxonomy)
+        return
+    if skills_root.is_file() and is_archive(skills_root):
+        rules = compile_ignore_patterns(list(DEFAULT_IGNORE_PATTERNS) + list(ignore_patterns or []))
+        yield from iter_archive_skills(skills_root, max_depth, rules, skills_root, metadata_only, taxonomy)
+        return
+    if not skills_root.is_dir():
+        return
+
+    rules = load_ignore_rules(skills_root, ignore_patterns)
+    candidates = list(find_skill_candidates(skills_root, max_depth=max_depth, rules=rules))
+
+    def _parse(child) -> List[SkillMetadata]:
+        if is_archive(child.name) and child.is_file():
+            return iter_archive_skills(child, max_depth, rules, skills_root, metadata_only, taxonomy)
+        meta = _parse_candidate(child, index, skills_root, metadata_only, taxonomy)
+        return [meta] if meta else []
+
+    if workers > 1 and len(candidates) > 1:
+        # 순서대로 내보내며 제출은 workers * 4개까지만 앞서 간다 (소비가 느리면 파싱도 멈춘다)
+        ahead = deque()
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            try:
+                for child in candidates:
+                    ahead.append(ex.submit(_parse, child))
+                    if len(ahead) >= workers * 4:
+                        yield from ahead.popleft().result()
+                while ahead:
+                    yield from ahead.popleft().result()
+            finally:
+                for fut in ahead:
+                    fut.cancel()
+    else:
+        for child in candidates:
+            yield from _parse(child)
+
+
+def discover_skills(
+    skills_root: Path,
+    workers: int = 1,
+    index=None,
+    max_depth: int = 1,
+    ignore_patterns=None,
+    source=None,
+    taxonomy: SectionTaxonomy = None,
+) -> List[SkillMetadata]:
+    """skills_root 아래에서 SKILL.md가 있는 모든 스킬을 탐지 (iter_skills + pipeline_targets)."""
+    skills = list(iter_skills(
+        skills_root, workers=workers, index=index,
+        max_depth=max_depth, ignore_patterns=ignore_patterns, source=source, taxonomy=taxonomy,
+    ))
+    resolve_pipeline_targets(skills)
     return skills
+
+
+def _skill_md_text(skill: SkillMetadata) -> str:
+    """붙어 있는 SkillDocument의 텍스트. 평가가 끝나 놓은 스킬이면 인벤토리에서 다시 읽는다."""
+    if skill.document is not None:
+        return skill.document.text
+    inventory = skill.inventory or build_inventory(skill.skill_path)
+    return inventory.read_text("SKILL.md") if inventory.has_file("SKILL.md") else ""
+
+
+def resolve_pipeline_targets(skills: List[SkillMetadata], all_skills: List[SkillMetadata] = None):
+    """pipeline_targets 후처리: 다른 스킬 이름 참조 탐지.
+
+    전체 스킬 디렉토리명으로 오토마톤을 한 번 만들고 각 SKILL.md를 한 번씩만
+    스캔한다 (스킬 수 N에 대해 O(N × 본문 길이)). all_skills를 넘기면 이름은
+    all_skills 전체에서 모으고 본문은 skills만 스캔한다 (지연 스킬을 로드하지 않음).
+    """
+    skill_names = [s.skill_path.name for s in (skills if all_skills is None else all_skills)]
+    matcher = _build_name_matcher(skill_names)
+    for skill in skills:
+        own = skill.skill_path.name
+        targets = _detect_pipeline_targets(_skill_md_text(skill), skill_names, matcher)
+        skill.pipeline_targets = [n for n in targets if n != own]
@@ -0,0 +1,152 @@
+"""Discovery Index — 스킬별 SkillMetadata 디스크 캐시 (mtime/size 무효화)."""
+
+import json
+import os
+from dataclasses import fields
+from pathlib import Path
+from typing import Optional
+
+from discovery import build_skill_document
+from history import _compute_evaluator_version
+from models import SkillMetadata, TriggerInfo
+
+
+DEFAULT_INDEX_PATH = Path(__file__).parent.parent / "reports" / "discovery_index.json"
+INDEX_FORMAT_VERSION = 1
+
+# 파싱 결과가 의존하는 스킬 하위 디렉토리 (SKILL.md 외)
+_SCANNED_DIRS = ("scripts", "references")
+# 실행마다 재계산하거나 별도로 직렬화하는 필드
+# (inventory는 파일 크기/mtime을 담아 디렉토리 fingerprint로 검증할 수 없으므로
+#  캐시하지 않고 evaluators.base.get_inventory()가 필요 시 다시 만든다)
+_EXCLUDED_FIELDS = {"skill_path", "triggers", "pipeline_targets", "qualifier", "document", "inventory", "corpus"}
+
+
+def _stat_entry(path: Path, rel: str) -> list:
+    st = path.stat()
+    return [rel, st.st_mtime_ns, st.st_size]
+
+
+def compute_fingerprint(skill_dir: Path) -> list:
+    """SKILL.md + 스킬 디렉토리 + 스캔 대상 하위 디렉토리의 (mtime, size) 목록.
+
+    디렉토리 mtime은 직속 항목 추가/삭제 시 바뀌므로, scripts/는 rglob 대상
+    하위 디렉토리까지 모두 포함한다. 파일 내용은 SkillMetadata에 담기지 않으므로
+    SKILL.md 외 파일 자체는 stat하지 않는다.
+    """
+    entries = [
+        _stat_entry(skill_dir / "SKILL.md", "SKILL.md"),
+        _stat_entry(skill_dir, "."),
+    ]
+    for name in _SCANNED_DIRS:
+        root = skill_dir / name
+        if not root.is_dir():
+            continue
+        entries.append(_stat_entry(root, name))
+        if name == "scripts":
+            for dirpath, dirnames, _ in os.walk(root):
+                dirnames.sort()
+                for d in dirnames:
+                    sub = Path(dirpath) / d
+                    entries.append(_stat_entry(sub, sub.relative_to(skill_dir).as_posix()))
+    return entries
+
+
+def skill_to_dict(skill: SkillMetadata) -> dict:
+    """SkillMetadata → JSON 직렬화 가능한 dict (pipeline_targets 제외)."""
+    data = {f.name: getattr(skill, f.name) for f in fields(skill) if f.name not in _EXCLUDED_FIELDS}
+    data["skill_path"] = str(skill.skill_path)
+    data["triggers"] = {"keywords": skill.triggers.keywords, "source": skill.triggers.source}
+    data["document_text"] = skill.document.text if skill.document is not None else None
+    return data
+
+
+def skill_from_dict(data: dict) -> SkillMetadata:
+    """skill_to_dict 역변환. SkillDocument는 캐시된 텍스트로 재구성."""
+    data = dict(data)
+    text = data.pop("document_text", None)
+    skill = SkillMetadata(
+        skill_path=Path(data.pop("skill_path")),
+        triggers=TriggerInfo(**data.pop("triggers")),
+        **data,
+    )
+    if text is not None:
+        skill.document = build_skill_document(text)
+    return skill
+
+
+class DiscoveryIndex:
+    """스킬 디렉토리별 fingerprint → 직렬화된 SkillMetadata 캐시.
+
+    discover_skills(index=...)가 lookup()/store()를 호출한다. fingerprint는
+    파싱 전에 계산해 두므로, 파싱 도중 파일이 바뀌면 다음 실행에서 다시 파싱된다.
+    evaluator 코드가 바뀌면 (history._compute_evaluator_version) 전체를 무효화한다.
+    """
+
+    def __init__(self, path: Path, entries: dict = None, evaluator_version: str = None):
+        self.path = path
+        self.evaluator_version = evaluator_version or _compute_evaluator_version()
+        self.entries = entries or {}
+        self.hits = 0
+        self.misses = 0
+        self._pending = {}
+        self._seen = set()
+        self._roots = set()
+
+    @classmethod
+    def load(cls, path: Path) -> "DiscoveryIndex":
+        """인덱스 파일 로드. 없거나 형식/버전이 다르면 빈 인덱스."""
+        version = _compute_evaluator_version()
+        if not path.exists():
+            return cls(path, evaluator_version=version)
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+            return cls(path, evaluator_version=version)
+        if raw.get("format") != INDEX_FORMAT_VERSION or raw.get("evaluator_version") != version:
+            return cls(path, evaluator_version=version)
+        return cls(path, entries=raw.get("skills", {}), evaluator_version=version)
+
+    def lookup(self, skill_dir: Path) -> Optional[SkillMetadata]:
+        """fingerprint가 일치하면 캐시된 SkillMetadata, 아니면 None."""
+        key = os.path.abspath(skill_dir)
+        self._seen.add(key)
+        self._roots.add(os.path.dirname(key))
+        try:
+            fingerprint = compute_fingerprint(skill_dir)
+        except OSError:
+            self._pending.pop(key, None)
+            return None
+        entry = self.entries.get(key)
+        if entry and entry.get("fingerprint") == fingerprint:
+            self.hits += 1
+            skill = skill_from_dict(entry["skill"])
+            skill.skill_path = skill_dir
+            return skill
+        self.misses += 1
+        self._pending[key] = fingerprint
+        return None
+
+    def store(self, skill_dir: Path, skill: SkillMetadata):
+        """lookup() 미스 이후 새로 파싱한 결과 저장."""
+        key = os.path.abspath(skill_dir)
+        fingerprint = self._pending.pop(key, None)
+        if fingerprint is None:
+            return
+        self.entries[key] = {"fingerprint": fingerprint, "skill": skill_to_dict(skill)}
+
+    def save(self):
+        """이번 실행에서 본 root의 사라진 스킬은 제거하고 원자적으로 저장."""
+        kept = {
+            k: v for k, v in self.entries.items()
+            if k in self._seen or os.path.dirname(k) not in self._roots
+        }
+        payload = {
+            "format": INDEX_FORMAT_VERSION,
+            "evaluator_version": self.evaluator_version,
+            "skills": kept,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
@@ -12,6 +12,20 @@ DEFAULT_LAYER_WEIGHTS = {
     "L6": 0.10,
 }
 
+# SKILL.md "## " 헤더 분류: 카테고리명 → 정규식 (문자열 또는 목록, 소문자 헤더에 매칭).
+# 카테고리마다 SkillMetadata.section_flags["has_<카테고리>"]가 생긴다.
+DEFAULT_SECTION_TAXONOMY = {
+    "when_to_use": r"when to use|사용\s*조건|언제\s*사용",
+    "dont_use": r"don'?t use|비목표|non-?goal|비사용",
+    "pipeline_integration": r"pipeline|파이프라인",
+    "llm_judgment_guide": [r"llm.*판단", r"llm.*decision", r"자가\s*판단"],
+    "quick_start": r"quick\s*start|빠른\s*시작",
+    "cli_options": [r"cli.*옵션", r"cli.*option", r"command"],
+    "prerequisites": r"prerequisit|사전\s*요구|설치|setup|환경",
+    "security_notes": r"security|보안",
+    "performance_notes": r"performance|성능",
+}
+
 
 @dataclass
 class EvalConfig:
@@ -20,3 +34,4 @@ class EvalConfig:
     skills_root: str = ""
     threshold: float = 60.0
     layer_weights: dict = field(default_factory=lambda: dict(DEFAULT_LAYER_WEIGHTS))
+    section_taxonomy: dict = field(default_factory=lambda: dict(DEFAULT_SECTION_TAXONOMY))
@@ -5,7 +5,23 @@ import argparse
 import sys
 from pathlib import Path
 
+from analysis_cache import DEFAULT_CACHE_PATH
+from discovery_index import DEFAULT_INDEX_PATH
+from file_access import DEFAULT_MAX_FILE_SIZE
 from orchestrator import run
+from result_cache import DEFAULT_RESULT_CACHE_PATH
+from scheduler import DEFAULT_TIMINGS_PATH
+
+
+def _workers(value: str):
+    """--workers 값: 정수 또는 "auto"."""
+    if value == "auto":
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer or 'auto', got {value!r}") from None
+
 
 def main():
     default_config = Path(__file__).parent.parent / "config.json"
@@ -13,19 +29,21 @@ def main():
     parser = argparse.ArgumentParser(description="Skill Evaluator")
     parser.add_argument(
         "--skills-root", type=Path, default=None,
-        help="Root directory containing skills (each with SKILL.md)",
+        help="Root directory containing skills (each with SKILL.md), "
+             "or a .zip/.tar.gz skill bundle (read in place, not extracted)",
     )
     parser.add_argument(
         "--skill", type=str, default=None,
-        help="Evaluate a specific skill by name",
+        help="Evaluate a specific skill by name (other skills are discovered from frontmatter only)",
     )
     parser.add_argument(
         "--layer", type=str, default=None,
         help="Comma-separated layers to evaluate (e.g. L1,L4,L6). Default: all",
     )
     parser.add_argument(
-        "--format", choices=["text", "json", "markdown"], default="text",
-        help="Output format (default: text)",
+        "--format", choices=["text", "json", "markdown", "jsonl"], default="text",
+        help="Output format (default: text). jsonl streams one record per finished skill "
+             "evaluation unit, then the ecosystem and summary records",
     )
     parser.add_argument(
         "--output", "-o", type=Path, default=None,
@@ -64,12 +82,83 @@ def main():
         help="Show score history summary and exit",
     )
     parser.add_argument(
-        "--workers", type=int, default=1,
-        help="Number of parallel workers for per-skill evaluation (default: 1)",
+        "--workers", type=_workers, default=1,
+        help="Number of worker processes for per-skill evaluation. 'auto' sizes the process pool from "
+             "the CPU count and an I/O thread pool (see --io-workers) from the I/O wait recorded with "
+             "--layer-timings (default: 1)",
+    )
+    parser.add_argument(
+        "--io-workers", type=int, default=None,
+        help="Number of threads that run I/O-bound layers (L1/L3/L4) alongside the --workers processes, "
+             "which then only run CPU-bound layers. Total concurrency is --workers + --io-workers "
+             "(default: 1 = no thread pool, every layer on the processes; with --workers auto: sized "
+             "from the recorded I/O wait)",
+    )
+    parser.add_argument(
+        "--discovery-workers", type=int, default=1,
+        help="Number of threads used to parse skill directories concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--max-depth", type=int, default=1,
+        help="Directory depth searched for SKILL.md below --skills-root "
+             "(default: 1 = direct children, 0 = unlimited)",
+    )
+    parser.add_argument(
+        "--ignore", action="append", default=None, metavar="PATTERN",
+        help=".gitignore-style directory pattern to skip during discovery (repeatable; "
+             "also read from <skills-root>/.skillignore)",
+    )
+    parser.add_argument(
+        "--discovery-index", nargs="?", type=Path, const=DEFAULT_INDEX_PATH, default=None,
+        help="Reuse cached skill metadata for unchanged skills "
+             "(default path: reports/discovery_index.json)",
+    )
+    parser.add_argument(
+        "--analysis-cache", nargs="?", type=Path, const=DEFAULT_CACHE_PATH, default=None,
+        help="Reuse per-script analysis (AST features) across runs, keyed by content sha256 "
+             "(default path: reports/analysis_cache.sqlite)",
+    )
+    parser.add_argument(
+        "--result-cache", nargs="?", type=Path, const=DEFAULT_RESULT_CACHE_PATH, default=None,
+        help="Skip layer evaluation when the skill contents, evaluator code, benchmark entries "
+             "and cross-skill inputs are unchanged (default path: reports/result_cache.json)",
+    )
+    parser.add_argument(
+        "--layer-timings", nargs="?", type=Path, const=DEFAULT_TIMINGS_PATH, default=None,
+        help="Record per-layer durations and use the previous run's values to schedule the slowest "
+             "(skill, layer) units first with --workers (default path: reports/layer_timings.json)",
+    )
+    parser.add_argument(
+        "--changed-since", type=str, default=None, metavar="REF",
+        help="Evaluate only skills changed since a git ref (plus L2 overlap partners) and reuse "
+             "scores of the others from the latest history snapshot of the same evaluator version",
+    )
+    parser.add_argument(
+        "--rev", type=str, default=None, metavar="REV",
+        help="Evaluate skills as of a git revision (sha/branch/tag) of the repository "
+             "containing --skills-root, without checking it out",
+    )
+    parser.add_argument(
+        "--max-file-size", type=int, default=DEFAULT_MAX_FILE_SIZE // (1024 * 1024), metavar="MB",
+        help="Skip skill files larger than this during evaluation and report them in metric "
+             "details (default: %(default)s, 0 = unlimited)",
+    )
+    parser.add_argument(
+        "--layer-timeout", type=float, default=None, metavar="SECONDS",
+        help="Wall-clock budget per layer evaluation. An overrun is reported as a 'timeout' "
+             "metric and the run continues (default: unlimited)",
+    )
+    parser.add_argument(
+        "--skill-timeout", type=float, default=None, metavar="SECONDS",
+        help="Wall-clock budget for all layers of one skill, including the cross-skill L2 pass. Layers "
+             "left when it runs out are reported as 'timeout'. A timed-out layer cannot be interrupted "
+             "and keeps running in the background, so that skill's results are not written to "
+             "--result-cache (default: unlimited)",
     )
     parser.add_argument(
         "--fail-fast", action="store_true",
-        help="Abort immediately if any layer evaluation raises runtime exception",
+        help="Abort immediately if any layer evaluation raises runtime exception or times out, "
+             "cancelling pending work",
     )
     args = parser.parse_args()
     sys.exit(run(args))
@@ -9,7 +9,8 @@
     result = evaluate_l1(skill)
 """
 
-from evaluators.base import run_layer_evaluation
+from evaluators import l1_structural, l2_activation, l3_retrieval, l4_workflow, l5_execution, l6_validation
+from evaluators.base import RESOURCE_CPU, RESOURCE_IO, run_layer_evaluation
 from evaluators.l1_structural import evaluate as evaluate_l1
 from evaluators.l2_activation import evaluate as evaluate_l2
 from evaluators.l3_retrieval import evaluate as evaluate_l3
@@ -27,8 +28,24 @@ LAYERS = {
     "L6": evaluate_l6,
 }
 
+# 전체 스킬 목록(all_skills)이 필요한 레이어.
+# 스트리밍 평가에서는 discovery가 끝난 뒤 두 번째 단계에서 실행한다.
+CROSS_SKILL_LAYERS = {"L2"}
+
+# 레이어 → 자원 분류 (RESOURCE_IO: 스레드 풀, RESOURCE_CPU: 프로세스 풀)
+LAYER_RESOURCES = {
+    "L1": l1_structural.RESOURCE_CLASS,
+    "L2": l2_activation.RESOURCE_CLASS,
+    "L3": l3_retrieval.RESOURCE_CLASS,
+    "L4": l4_workflow.RESOURCE_CLASS,
+    "L5": l5_execution.RESOURCE_CLASS,
+    "L6": l6_validation.RESOURCE_CLASS,
+}
+
 __all__ = [
     "LAYERS",
+    "CROSS_SKILL_LAYERS",
+    "LAYER_RESOURCES", "RESOURCE_IO", "RESOURCE_CPU",
     "evaluate_l1", "evaluate_l2", "evaluate_l3",
     "evaluate_l4", "evaluate_l5", "evaluate_l6",
     "evaluate_ecosystem",
@@ -2,16 +2,60 @@
 
 모든 Layer evaluator가 재사용하는 패턴:
   - run_layer_evaluation(): check_* 리스트 → LayerResult 생성
-  - read_skill_md(): SKILL.md 텍스트 캐싱 읽기
-  - read_scripts(): scripts/*.py 콘텐츠 일괄 읽기
+  - read_skill_md(): discovery 시점에 읽어둔 SKILL.md 텍스트 반환
+  - get_document(): SKILL.md 텍스트 + scan_markdown 결과 (없으면 1회 생성)
+  - get_inventory(): discovery 시점의 파일 인벤토리 (없으면 1회 생성)
+  - get_corpus(): scripts/**/*.py 코퍼스 (파일당 1회 읽기, AST 지연 파싱)
+  - iter_scripts(): scripts/**/*.py 콘텐츠 순회
+  - iter_script_buffers(): scripts/**/*.py 버퍼 순회 (큰 파일은 mmap, 정규식 스캔 전용)
+  - load_benchmark(): 벤치마크 JSON (프로세스당 파일 변경 시에만 파싱)
+
+크기 제한(file_access.get_max_file_size)을 넘는 파일은 읽지 않고 capped 목록에
+담아 호출자가 메트릭 detail로 보고한다.
 """
 
+import json
 import re
 from pathlib import Path
 from typing import Callable, List, Optional
 
-from models import MetricResult, LayerResult
-from discovery import SkillMetadata
+from inventory import SkillInventory, build_inventory
+from models import MetricResult, LayerResult, SkillDocument
+from script_corpus import ScriptCorpus
+from discovery import SkillMetadata, build_skill_document
+
+
+# 레이어 모듈의 RESOURCE_CLASS 값 — orchestrator가 레이어를 실행할 풀을 고른다
+RESOURCE_IO = "io"    # stat/read 위주: 스레드 풀 (파일 대기 중 GIL을 놓는다)
+RESOURCE_CPU = "cpu"  # AST/교차 스킬 연산 위주: 프로세스 풀
+
+# 벤치마크 파일 경로 → ((mtime_ns, size), 파싱 결과)
+_BENCHMARKS = {}
+
+
+def load_benchmark(benchmarks_dir: Path, rel_path: str) -> dict:
+    """benchmarks_dir/rel_path JSON (스킬 이름 → 항목). 파일이 없으면 {}.
+
+    스킬마다 같은 파일을 다시 파싱하지 않도록 프로세스 안에서 캐시하고,
+    mtime/크기가 바뀌면 다시 읽는다. 반환값은 공유되므로 수정하지 않는다.
+    """
+    bench_file = Path(benchmarks_dir) / rel_path
+    try:
+        st = bench_file.stat()
+    except FileNotFoundError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _BENCHMARKS.get(bench_file)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, json.loads(bench_file.read_text(encoding="utf-8")))
+        _BENCHMARKS[bench_file] = cached
+    return cached[1]
+
+
+def benchmark_entry(benchmarks_dir: Path, rel_path: str, skill: SkillMetadata) -> dict:
+    """벤치마크 파일에서 스킬 항목. 한정 이름(team-a/foo)이 없으면 frontmatter 이름으로 찾는다."""
+    data = load_benchmark(benchmarks_dir, rel_path)
+    return data.get(skill.name if skill.name in data else skill.local_name, {})
 
 
 def run_layer_evaluation(
@@ -30,31 +74,73 @@ def run_layer_evaluation(
 
 
 def read_skill_md(skill: SkillMetadata) -> str:
-    """SKILL.md 텍스트 반환. 없으면 빈 문자열."""
+    """SKILL.md 텍스트 반환. 없으면 빈 문자열.
+
+    discovery가 붙여둔 SkillDocument가 있으면 파일시스템을 다시 읽지 않는다. 평가 후
+    문서를 놓은 스킬은 인벤토리에서 다시 읽는다 (--rev/아카이브 소스도 같은 내용).
+    """
+    if skill.document is not None:
+        return skill.document.text
+    if skill.inventory is not None:
+        return skill.inventory.read_text("SKILL.md") if skill.inventory.has_file("SKILL.md") else ""
     skill_md = skill.skill_path / "SKILL.md"
     if not skill_md.exists():
         return ""
     return skill_md.read_text(encoding="utf-8")
 
 
-def iter_scripts(skill: SkillMetadata, skip_init: bool = True):
-    """scripts/*.py 파일을 순회하며 (Path, content) 튜플 yield.
+def get_document(skill: SkillMetadata) -> SkillDocument:
+    """SkillDocument 반환. 없으면 (직접 만든 SkillMetadata 등) 만들어 skill에 붙여둔다."""
+    if skill.document is None:
+        skill.document = build_skill_document(read_skill_md(skill))
+    return skill.document
+
+
+def get_inventory(skill: SkillMetadata) -> SkillInventory:
+    """스킬 파일 인벤토리 반환.
+
+    discovery가 만든 인벤토리를 재사용하고, 없으면 (직접 만든 SkillMetadata,
+    discovery index 캐시 복원 등) 한 번 순회해 skill에 붙여둔다.
+    """
+    if skill.inventory is None:
+        skill.inventory = build_inventory(skill.skill_path)
+    return skill.inventory
+
+
+def get_corpus(skill: SkillMetadata) -> ScriptCorpus:
+    """스킬 scripts/**/*.py 코퍼스 반환 — 검사마다 다시 읽지 않도록 skill에 붙여둔다."""
+    if skill.corpus is None:
+        skill.corpus = ScriptCorpus(get_inventory(skill))
+    return skill.corpus
+
+
+def iter_scripts(skill: SkillMetadata, skip_init: bool = True, capped: Optional[list] = None):
+    """scripts/**/*.py 파일을 순회하며 (Path, content) 튜플 yield.
+
+    UnicodeDecodeError, PermissionError는 자동 건너뜀. 크기 제한을 넘는 파일은
+    capped(리스트)에 FileEntry를 추가하고 건너뜀.
+    """
+    corpus = get_corpus(skill)
+    if capped is not None:
+        capped.extend(corpus.capped(skip_init))
+    for script in corpus.texts(skip_init):
+        yield script.path, script.content
+
+
+def iter_script_buffers(skill: SkillMetadata, skip_init: bool = True, capped: Optional[list] = None):
+    """iter_scripts와 같은 파일을 (Path, buffer)로 yield — 정규식/부분 문자열 검사 전용.
 
-    UnicodeDecodeError, PermissionError는 자동 건너뜀.
+    이미 읽은 파일과 작은 파일은 코퍼스의 문자열, 아직 읽지 않은 MMAP_THRESHOLD
+    이상 파일은 mmap 버퍼라 디코드·복사 없이 스캔한다 (file_access.ScanPattern/
+    contains 사용). 버퍼는 다음 항목으로 넘어가면 닫힌다.
     """
-    scripts_dir = skill.skill_path / "scripts"
-    if not scripts_dir.is_dir():
-        return
-    for py_file in scripts_dir.rglob("*.py"):
-        if skip_init and py_file.name == "__init__.py":
-            continue
-        try:
-            content = py_file.read_text(encoding="utf-8")
-            yield py_file, content
-        except (UnicodeDecodeError, PermissionError):
-            pass
+    corpus = get_corpus(skill)
+    if capped is not None:
+        capped.extend(corpus.capped(skip_init))
+    for script, buf in corpus.buffers(skip_init):
+        yield script.path, buf
 
 
 def has_scripts_dir(skill: SkillMetadata) -> bool:
     """scripts/ 디렉토리 존재 여부."""
-    return (skill.skill_path / "scripts").is_dir()
+    return get_inventory(skill).has_dir("scripts")
@@ -1,11 +1,18 @@
 """Ecosystem: 크로스 스킬 분석."""
 
 import re
+from collections import Counter
 from typing import List
 
 from models import EcosystemMetric, EcosystemResult
 from discovery import SkillMetadata
+from evaluators.base import get_corpus, get_inventory
 from evaluators.l2_activation import GENERIC_KEYWORDS
+from keywords import normalize_keyword
+
+
+# 파싱할 수 없는 스크립트용 이전 정규식
+_ADD_ARGUMENT_FLAG = re.compile(r"add_argument\(\s*['\"](-{1,2}[\w-]+)['\"]")
 
 
 def check_bridge_connectivity(skills: List[SkillMetadata]) -> EcosystemMetric:
@@ -17,20 +24,17 @@ def check_bridge_connectivity(skills: List[SkillMetadata]) -> EcosystemMetric:
     skill_names = {s.skill_path.name for s in skills}
 
     for skill in skills:
-        bridge_files = []
-        bridges_dir = skill.skill_path / "bridges"
-        scripts_dir = skill.skill_path / "scripts"
-
-        if bridges_dir.is_dir():
-            bridge_files.extend(bridges_dir.rglob("*.py"))
-            bridge_files.extend(bridges_dir.rglob("*.md"))
-        if scripts_dir.is_dir():
-            for f in scripts_dir.glob("bridge*.py"):
-                bridge_files.append(f)
+        inventory = get_inventory(skill)
+        bridge_files = list(inventory.files("bridges", ".py"))
+        bridge_files.extend(inventory.files("bridges", ".md"))
+        bridge_files.extend(
+            e for e in inventory.files("scripts", ".py", recursive=False)
+            if e.name.startswith("bridge")
+        )
 
         for bf in bridge_files:
             try:
-                content = bf.read_text(encoding="utf-8").lower()
+                content = inventory.read_text(bf).lower()
             except (UnicodeDecodeError, PermissionError):
                 continue
             for other_name in skill_names:
@@ -59,15 +63,15 @@ def check_cli_consistency(skills: List[SkillMetadata]) -> EcosystemMetric:
     flag_usage = {}
 
     for skill in skills:
-        scripts_dir = skill.skill_path / "scripts"
-        if not scripts_dir.is_dir():
-            continue
-        for py_file in scripts_dir.rglob("*.py"):
-            try:
-                content = py_file.read_text(encoding="utf-8")
-            except (UnicodeDecodeError, PermissionError):
-                continue
-            flags = re.findall(r"add_argument\(\s*['\"](-{1,2}[\w-]+)['\"]", content)
+        for script in get_corpus(skill).texts(skip_init=False):
+            features = script.features
+            if features is None:
+                # 파싱할 수 없는 스크립트는 이전 정규식 검사
+                flags = _ADD_ARGUMENT_FLAG.findall(script.content)
+            else:
+                # add_argument 호출마다 첫 인자가 옵션이면 그것을 대표 플래그로, sys.argv 비교 옵션은 그대로
+                flags = [args[0] for args in features.add_arguments if args and args[0].startswith("-")]
+                flags.extend(features.argv_flags)
             for f in flags:
                 flag_usage.setdefault(f, set()).add(skill.name)
 
@@ -132,20 +136,19 @@ def check_pipeline_coverage(skills: List[SkillMetadata]) -> EcosystemMetric:
 
 def check_trigger_ecosystem_health(skills: List[SkillMetadata]) -> EcosystemMetric:
     """에코시스템 트리거 건강도 (25점)."""
-    all_keywords = {}
+    # 정규화 키워드 → 등장 횟수 (처음 나온 순서 유지; 한 스킬 안의 대소문자 변형도 따로 센다)
+    uses = Counter()
     generic_count = 0
-    total_count = 0
 
     for skill in skills:
-        for kw in skill.triggers.keywords:
-            kw_lower = kw.lower()
-            all_keywords.setdefault(kw_lower, []).append(skill.name)
-            total_count += 1
-            if kw_lower in GENERIC_KEYWORDS:
+        for word in map(normalize_keyword, skill.triggers.keywords):
+            uses[word] += 1
+            if word in GENERIC_KEYWORDS:
                 generic_count += 1
 
-    overlapping = {k: v for k, v in all_keywords.items() if len(v) >= 2}
-    overlap_ratio = len(overlapping) / len(all_keywords) if all_keywords else 0
+    total_count = sum(uses.values())
+    overlapping = [word for word, count in uses.items() if count >= 2]
+    overlap_ratio = len(overlapping) / len(uses) if uses else 0
     generic_ratio = generic_count / total_count if total_count > 0 else 0
 
     score = 25.0
@@ -171,7 +174,7 @@ def check_trigger_ecosystem_health(skills: List[SkillMetadata]) -> EcosystemMetr
     return EcosystemMetric(
         name="trigger_ecosystem_health", score=score, max_score=25.0,
         details="; ".join(details),
-        affected_skills=[k for k in list(overlapping.keys())[:5]],
+        affected_skills=overlapping[:5],
     )
 
 
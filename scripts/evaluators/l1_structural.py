@@ -1,10 +1,16 @@
 """L1: 구조적 무결성 평가."""
 
-import re
-
 from models import MetricResult
 from discovery import SkillMetadata
-from evaluators.base import run_layer_evaluation, iter_scripts
+from evaluators.base import run_layer_evaluation, iter_script_buffers, has_scripts_dir, RESOURCE_IO
+from file_access import ScanPattern, contains, format_capped
+
+
+RESOURCE_CLASS = RESOURCE_IO  # 파일 stat과 스크립트 버퍼(mmap) 스캔
+
+
+_HARDCODED_PATH = ScanPattern(r'["\'/](Users|home|mnt)/\w+/')
+_RELATIVE_MARKERS = ("Path(__file__)", "SKILLS_ROOT", "skill_paths")
 
 
 def check_yaml_validity(skill: SkillMetadata) -> MetricResult:
@@ -12,7 +18,7 @@ def check_yaml_validity(skill: SkillMetadata) -> MetricResult:
     score = 0.0
     details = []
 
-    if skill.name and skill.name != skill.skill_path.name:
+    if skill.name and skill.local_name != skill.skill_path.name:
         score += 10
         details.append("name 필드 존재")
     elif skill.name:
@@ -82,8 +88,7 @@ def check_resource_independence(skill: SkillMetadata) -> MetricResult:
     details = []
     violations = []
 
-    scripts_dir = skill.skill_path / "scripts"
-    if not scripts_dir.is_dir():
+    if not has_scripts_dir(skill):
         return MetricResult(
             name="resource_independence",
             score=15.0,
@@ -92,15 +97,14 @@ def check_resource_independence(skill: SkillMetadata) -> MetricResult:
             passed=True,
         )
 
-    hardcoded_pattern = re.compile(r'["\'/](Users|home|mnt)/\w+/')
     uses_relative = False
+    capped = []
 
-    for py_file, content in iter_scripts(skill, skip_init=False):
-        matches = hardcoded_pattern.findall(content)
-        if matches:
+    for py_file, buf in iter_script_buffers(skill, skip_init=False, capped=capped):
+        if _HARDCODED_PATH.search(buf):
             score -= 10
             violations.append(py_file.name)
-        if "Path(__file__)" in content or "SKILLS_ROOT" in content or "skill_paths" in content:
+        if any(contains(buf, marker) for marker in _RELATIVE_MARKERS):
             uses_relative = True
 
     if uses_relative:
@@ -113,6 +117,8 @@ def check_resource_independence(skill: SkillMetadata) -> MetricResult:
         details.append(f"하드코딩 경로 발견: {', '.join(violations)}")
     else:
         details.append("하드코딩 절대경로 없음")
+    if capped:
+        details.append(format_capped(capped))
 
     score = max(score, 0.0)
     return MetricResult(
@@ -1,12 +1,15 @@
 """L2: 활성화 신뢰성 평가 (정적 분석)."""
 
-import json
 import re
 from pathlib import Path
 
 from models import MetricResult
 from discovery import SkillMetadata
-from evaluators.base import run_layer_evaluation
+from evaluators.base import benchmark_entry, run_layer_evaluation, RESOURCE_CPU
+from keywords import normalize_keyword
+
+
+RESOURCE_CLASS = RESOURCE_CPU  # 전체 스킬 목록과의 키워드 비교
 
 
 # 범용 키워드 — 도메인 특이성 판별용
@@ -69,9 +72,9 @@ def check_trigger_specificity(skill: SkillMetadata) -> MetricResult:
 
 
 def check_trigger_overlap(skill: SkillMetadata, all_skills: list) -> MetricResult:
-    """트리거 중복도 (10점). 다른 스킬과 키워드 겹침."""
-    my_kws = set(kw.lower() for kw in skill.triggers.keywords)
-    if not my_kws:
+    """트리거 중복도 (10점). 다른 스킬과 키워드 겹침 (정규화 키워드 id 집합 비교)."""
+    my_ids = frozenset(skill.triggers.keyword_ids)
+    if not my_ids:
         return MetricResult(
             name="trigger_overlap", score=0, max_score=10.0,
             details="키워드 없음", passed=False,
@@ -81,8 +84,7 @@ def check_trigger_overlap(skill: SkillMetadata, all_skills: list) -> MetricResul
     for other in all_skills:
         if other.name == skill.name:
             continue
-        other_kws = set(kw.lower() for kw in other.triggers.keywords)
-        shared = my_kws & other_kws
+        shared = my_ids.intersection(other.triggers.keyword_ids)
         if shared:
             overlaps.append((other.name, shared))
 
@@ -98,7 +100,7 @@ def check_trigger_overlap(skill: SkillMetadata, all_skills: list) -> MetricResul
         total_shared |= shared
         overlap_names.append(f"{name}({len(shared)})")
 
-    ratio = len(total_shared) / len(my_kws)
+    ratio = len(total_shared) / len(my_ids)
     if ratio <= 0.1:
         score = 8
     elif ratio <= 0.3:
@@ -114,13 +116,13 @@ def check_trigger_overlap(skill: SkillMetadata, all_skills: list) -> MetricResul
     )
 
 
+# benchmarks_dir 기준 벤치마크 파일 (스킬 이름 → 항목)
+BENCHMARK_FILE = "L2_activation/trigger_queries.json"
+
+
 def _load_trigger_benchmarks(skill: SkillMetadata, benchmarks_dir: Path) -> dict:
     """L2 벤치마크 데이터 로드."""
-    bench_file = benchmarks_dir / "L2_activation" / "trigger_queries.json"
-    if not bench_file.exists():
-        return {}
-    data = json.loads(bench_file.read_text(encoding="utf-8"))
-    return data.get(skill.name, {})
+    return benchmark_entry(benchmarks_dir, BENCHMARK_FILE, skill)
 
 
 def check_trigger_benchmark(skill: SkillMetadata, benchmarks_dir: Path) -> MetricResult:
@@ -133,19 +135,19 @@ def check_trigger_benchmark(skill: SkillMetadata, benchmarks_dir: Path) -> Metri
             passed=True,
         )
 
-    keywords = set(kw.lower() for kw in skill.triggers.keywords)
+    keywords = skill.triggers.normalized
     correct = 0
     total = 0
 
     for item in bench.get("positive", []):
         total += 1
-        query = item["query"].lower()
+        query = normalize_keyword(item["query"])
         if any(kw in query for kw in keywords):
             correct += 1
 
     for item in bench.get("negative", []):
         total += 1
-        query = item["query"].lower()
+        query = normalize_keyword(item["query"])
         if not any(kw in query for kw in keywords):
             correct += 1
 
@@ -5,7 +5,11 @@ import re
 
 from models import MetricResult
 from discovery import SkillMetadata
-from evaluators.base import run_layer_evaluation
+from evaluators.base import run_layer_evaluation, get_inventory, RESOURCE_IO
+from file_access import exceeds_cap, format_capped
+
+
+RESOURCE_CLASS = RESOURCE_IO  # references/ 파일 stat/읽기
 
 
 def check_reference_count(skill: SkillMetadata) -> MetricResult:
@@ -79,14 +83,14 @@ def check_progressive_disclosure(skill: SkillMetadata) -> MetricResult:
 
 def check_reference_freshness(skill: SkillMetadata) -> MetricResult:
     """참조 파일 실존 여부 (20점)."""
-    refs_dir = skill.skill_path / "references"
-    if not refs_dir.is_dir() or not skill.reference_files:
+    inventory = get_inventory(skill)
+    if not inventory.has_dir("references") or not skill.reference_files:
         return MetricResult(
             name="reference_freshness", score=0, max_score=20.0,
             details="references/ 없음", passed=False,
         )
 
-    existing = sum(1 for f in skill.reference_files if (refs_dir / f).exists())
+    existing = sum(1 for f in skill.reference_files if inventory.has_file(f"references/{f}"))
     total = len(skill.reference_files)
     ratio = existing / total if total > 0 else 0
 
@@ -107,8 +111,8 @@ def check_reference_freshness(skill: SkillMetadata) -> MetricResult:
 
 def check_reference_content_validity(skill: SkillMetadata) -> MetricResult:
     """참조 파일 내용 품질 검증 (10점)."""
-    refs_dir = skill.skill_path / "references"
-    if not refs_dir.is_dir() or not skill.reference_files:
+    inventory = get_inventory(skill)
+    if not inventory.has_dir("references") or not skill.reference_files:
         return MetricResult(
             name="reference_content_validity", score=0, max_score=10.0,
             details="references/ 없음", passed=False,
@@ -120,13 +124,18 @@ def check_reference_content_validity(skill: SkillMetadata) -> MetricResult:
     md_score = 0
     nonempty_score = 0
 
+    capped = []
     for fname in skill.reference_files:
-        fpath = refs_dir / fname
-        if not fpath.exists():
+        rel = f"references/{fname}"
+        entry = inventory.get(rel)
+        if entry is None or entry.kind != "file":
+            continue
+        if exceeds_cap(entry):
+            capped.append(entry)
             continue
 
         try:
-            content = fpath.read_text(encoding="utf-8")
+            content = inventory.read_text(entry)
         except (UnicodeDecodeError, PermissionError):
             continue
 
@@ -154,6 +163,8 @@ def check_reference_content_validity(skill: SkillMetadata) -> MetricResult:
     score = min(json_score + md_score + nonempty_score, 10)
 
     details.insert(0, f"json:{json_score} md:{md_score} nonempty:{nonempty_score}")
+    if capped:
+        details.append(format_capped(capped))
 
     return MetricResult(
         name="reference_content_validity",
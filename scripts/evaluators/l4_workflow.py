@@ -4,7 +4,10 @@ import re
 
 from models import MetricResult
 from discovery import SkillMetadata
-from evaluators.base import run_layer_evaluation, read_skill_md
+from evaluators.base import run_layer_evaluation, read_skill_md, get_document, RESOURCE_IO
+
+
+RESOURCE_CLASS = RESOURCE_IO  # SKILL.md 읽기
 
 
 def check_workflow_structure(skill: SkillMetadata) -> MetricResult:
@@ -65,12 +68,13 @@ def check_workflow_structure(skill: SkillMetadata) -> MetricResult:
 
 def check_plan_adherence(skill: SkillMetadata) -> MetricResult:
     """계획 준수 마커 감지 (40점)."""
-    text = read_skill_md(skill)
+    document = get_document(skill)
+    text = document.text
 
     score = 0.0
     details = []
 
-    checklists = re.findall(r'- \[[ x]\]', text)
+    checklists = document.scan.checklist
     if checklists:
         score += 8
         details.append(f"체크리스트 {len(checklists)}개")
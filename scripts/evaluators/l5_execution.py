@@ -1,13 +1,18 @@
 """L5: 실행 정밀도 평가 (정적 분석)."""
 
-import ast
-import json
 import re
 from pathlib import Path
 
 from models import MetricResult
 from discovery import SkillMetadata
-from evaluators.base import run_layer_evaluation, iter_scripts, has_scripts_dir
+from evaluators.base import (
+    benchmark_entry, get_corpus, get_inventory, has_scripts_dir, iter_script_buffers, run_layer_evaluation,
+    RESOURCE_CPU,
+)
+from file_access import format_capped, head
+
+
+RESOURCE_CLASS = RESOURCE_CPU  # 스크립트 AST 분석
 
 
 def check_script_count(skill: SkillMetadata) -> MetricResult:
@@ -22,6 +27,24 @@ def check_script_count(skill: SkillMetadata) -> MetricResult:
     )
 
 
+def _script_features(corpus, skip_init: bool = True):
+    """파싱에 성공한 스크립트의 ScriptFeatures (구문 오류/디코드 실패 파일 제외)."""
+    return (s.features for s in corpus.texts(skip_init) if s.features is not None)
+
+
+def _starts_with_docstring(text: str) -> bool:
+    """파싱할 수 없는 스크립트용 — 셔뱅 다음 첫 내용이 삼중 따옴표 문자열인지 (이전 텍스트 검사)."""
+    c = head(text).lstrip()
+    if c.startswith("#!"):
+        c = c.split("\n", 1)[-1].lstrip()
+    return c.startswith('"""') or c.startswith("'''")
+
+
+def _with_capped(details: str, capped: list) -> str:
+    """크기 제한으로 건너뛴 파일이 있으면 detail 뒤에 덧붙인다."""
+    return f"{details}; {format_capped(capped)}" if capped else details
+
+
 def check_shebang(skill: SkillMetadata) -> MetricResult:
     """shebang 준수 (10점)."""
     if not has_scripts_dir(skill):
@@ -32,16 +55,16 @@ def check_shebang(skill: SkillMetadata) -> MetricResult:
 
     total = 0
     with_shebang = 0
-    for _, content in iter_scripts(skill):
+    capped = []
+    for _, buf in iter_script_buffers(skill, capped=capped):
         total += 1
-        first_line = content.split("\n", 1)[0]
-        if first_line.startswith("#!"):
+        if head(buf, 2) == "#!":
             with_shebang += 1
 
     if total == 0:
         return MetricResult(
             name="shebang", score=5, max_score=10.0,
-            details="실행 가능한 스크립트 없음", passed=True,
+            details=_with_capped("실행 가능한 스크립트 없음", capped), passed=True,
         )
 
     ratio = with_shebang / total
@@ -49,7 +72,7 @@ def check_shebang(skill: SkillMetadata) -> MetricResult:
     return MetricResult(
         name="shebang",
         score=score, max_score=10.0,
-        details=f"shebang {with_shebang}/{total} ({ratio:.0%})",
+        details=_with_capped(f"shebang {with_shebang}/{total} ({ratio:.0%})", capped),
         passed=ratio >= 0.5,
     )
 
@@ -64,11 +87,18 @@ def check_cli_interface(skill: SkillMetadata) -> MetricResult:
 
     has_argparse = False
     has_help = False
-    for _, content in iter_scripts(skill):
-        if "argparse" in content or "ArgumentParser" in content:
-            has_argparse = True
-        if "--help" in content or "add_argument" in content:
-            has_help = True
+    corpus = get_corpus(skill)
+    capped = corpus.capped()
+    for script in corpus.texts():
+        features = script.features
+        if features is None:
+            # 파싱할 수 없는 스크립트는 이전 부분 문자열 검사
+            has_argparse = has_argparse or "argparse" in script.content or "ArgumentParser" in script.content
+            has_help = has_help or "add_argument" in script.content or "--help" in script.content
+        else:
+            has_argparse = has_argparse or features.uses_argparse
+            # sys.argv를 직접 보는 도움말 처리('--help' in sys.argv)도 인자 정의로 인정
+            has_help = has_help or bool(features.add_arguments) or "--help" in features.argv_flags
 
     score = 0
     details = []
@@ -81,6 +111,8 @@ def check_cli_interface(skill: SkillMetadata) -> MetricResult:
 
     if not details:
         details.append("CLI 인터페이스 없음")
+    if capped:
+        details.append(format_capped(capped))
 
     return MetricResult(
         name="cli_interface",
@@ -98,20 +130,20 @@ def check_docstrings(skill: SkillMetadata) -> MetricResult:
             details="scripts/ 없음", passed=False,
         )
 
+    corpus = get_corpus(skill)
+    capped = corpus.capped()
     total = 0
     with_doc = 0
-    for _, content in iter_scripts(skill):
+    for script in corpus.texts():
         total += 1
-        c = content.lstrip()
-        if c.startswith("#!"):
-            c = c.split("\n", 1)[-1].lstrip()
-        if c.startswith('"""') or c.startswith("'''"):
+        features = script.features
+        if features.module_docstring if features is not None else _starts_with_docstring(script.content):
             with_doc += 1
 
     if total == 0:
         return MetricResult(
             name="docstrings", score=5, max_score=10.0,
-            details="스크립트 없음", passed=True,
+            details=_with_capped("스크립트 없음", capped), passed=True,
         )
 
     ratio = with_doc / total
@@ -119,7 +151,7 @@ def check_docstrings(skill: SkillMetadata) -> MetricResult:
     return MetricResult(
         name="docstrings",
         score=score, max_score=10.0,
-        details=f"docstring {with_doc}/{total} ({ratio:.0%})",
+        details=_with_capped(f"docstring {with_doc}/{total} ({ratio:.0%})", capped),
         passed=ratio >= 0.3,
     )
 
@@ -156,23 +188,10 @@ def check_function_quality(skill: SkillMetadata) -> MetricResult:
             details="scripts/ 없음", passed=False,
         )
 
-    func_pattern = re.compile(r'^(\s*)def\s+(\w+)\s*\(([^)]*)\)(\s*->\s*\S+)?:', re.MULTILINE)
-    total_funcs = 0
-    with_docstring = 0
-    with_typehint = 0
-
-    for _, content in iter_scripts(skill):
-        for match in func_pattern.finditer(content):
-            total_funcs += 1
-            params = match.group(3)
-            return_type = match.group(4)
-            if return_type or (": " in params and "self" not in params.split(":")[0].split(",")[0]):
-                with_typehint += 1
-
-            func_end = match.end()
-            remaining = content[func_end:func_end + 200].lstrip()
-            if remaining.startswith('"""') or remaining.startswith("'''"):
-                with_docstring += 1
+    functions = [f for features in _script_features(get_corpus(skill)) for f in features.functions]
+    total_funcs = len(functions)
+    with_docstring = sum(1 for f in functions if f.has_docstring)
+    with_typehint = sum(1 for f in functions if f.annotated)
 
     if total_funcs == 0:
         return MetricResult(
@@ -208,22 +227,6 @@ def check_function_quality(skill: SkillMetadata) -> MetricResult:
     )
 
 
-def _cyclomatic_complexity(node: ast.AST) -> int:
-    """단일 함수/메서드의 cyclomatic complexity 계산."""
-    complexity = 1
-    for child in ast.walk(node):
-        if isinstance(child, (ast.If, ast.For, ast.While, ast.ExceptHandler)):
-            complexity += 1
-        elif isinstance(child, ast.BoolOp):
-            # and/or 연산자 수 (values가 2개면 연산자 1개)
-            complexity += len(child.values) - 1
-        elif isinstance(child, ast.Assert):
-            complexity += 1
-        elif isinstance(child, ast.IfExp):
-            complexity += 1
-    return complexity
-
-
 def check_code_complexity(skill: SkillMetadata) -> MetricResult:
     """코드 복잡도 — AST 기반 cyclomatic complexity (15점).
 
@@ -236,18 +239,11 @@ def check_code_complexity(skill: SkillMetadata) -> MetricResult:
             details="scripts/ 없음", passed=False,
         )
 
-    func_complexities = []
-
-    for py_file, content in iter_scripts(skill, skip_init=True):
-        try:
-            tree = ast.parse(content, filename=str(py_file))
-        except SyntaxError:
-            continue
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                cc = _cyclomatic_complexity(node)
-                func_complexities.append((node.name, cc))
+    func_complexities = [
+        (f.name, f.complexity)
+        for features in _script_features(get_corpus(skill))
+        for f in features.functions
+    ]
 
     if not func_complexities:
         return MetricResult(
@@ -276,13 +272,13 @@ def check_code_complexity(skill: SkillMetadata) -> MetricResult:
     )
 
 
+# benchmarks_dir 기준 벤치마크 파일 (스킬 이름 → 항목)
+BENCHMARK_FILE = "L5_execution/script_tests.json"
+
+
 def _load_script_benchmarks(skill: SkillMetadata, benchmarks_dir: Path) -> dict:
     """L5 벤치마크 데이터 로드."""
-    bench_file = benchmarks_dir / "L5_execution" / "script_tests.json"
-    if not bench_file.exists():
-        return {}
-    data = json.loads(bench_file.read_text(encoding="utf-8"))
-    return data.get(skill.name, {})
+    return benchmark_entry(benchmarks_dir, BENCHMARK_FILE, skill)
 
 
 def check_script_benchmark(skill: SkillMetadata, benchmarks_dir: Path) -> MetricResult:
@@ -295,8 +291,8 @@ def check_script_benchmark(skill: SkillMetadata, benchmarks_dir: Path) -> Metric
             passed=True,
         )
 
-    scripts_dir = skill.skill_path / "scripts"
-    if not scripts_dir.is_dir():
+    inventory = get_inventory(skill)
+    if not inventory.has_dir("scripts"):
         return MetricResult(
             name="script_benchmark", score=0, max_score=50.0,
             details="scripts/ 없음", passed=False,
@@ -307,17 +303,17 @@ def check_script_benchmark(skill: SkillMetadata, benchmarks_dir: Path) -> Metric
 
     for item in bench.get("required_patterns", []):
         total += 1
-        target_file = scripts_dir / item["file"]
-        if target_file.exists():
-            content = target_file.read_text(encoding="utf-8")
+        target = f"scripts/{item['file']}"
+        if inventory.has_file(target):
+            content = inventory.read_text(target)
             if re.search(item["pattern"], content):
                 correct += 1
 
     for item in bench.get("forbidden_patterns", []):
         total += 1
-        target_file = scripts_dir / item["file"]
-        if target_file.exists():
-            content = target_file.read_text(encoding="utf-8")
+        target = f"scripts/{item['file']}"
+        if inventory.has_file(target):
+            content = inventory.read_text(target)
             if not re.search(item["pattern"], content):
                 correct += 1
         else:
@@ -4,7 +4,20 @@ import re
 
 from models import MetricResult
 from discovery import SkillMetadata
-from evaluators.base import run_layer_evaluation, iter_scripts, read_skill_md
+from evaluators.base import (
+    run_layer_evaluation, read_skill_md, get_corpus, get_inventory, has_scripts_dir, RESOURCE_CPU,
+)
+from file_access import format_capped
+
+
+RESOURCE_CLASS = RESOURCE_CPU  # 스크립트 AST 특징 (옵션 문자열, 예외 처리)
+
+
+# 검증 모드로 보는 CLI 옵션 접두사 (--verify-all 등 포함)
+_VERIFY_FLAGS = ("--verify", "--check", "--validate")
+# 파싱할 수 없는 스크립트용 이전 텍스트 검사
+_VERIFY_FLAG_TEXT = re.compile(r'--verify|--check|--validate')
+_SPECIFIC_EXCEPT_TEXT = re.compile(r'except\s+\w+')
 
 
 def check_verification_infra(skill: SkillMetadata) -> MetricResult:
@@ -16,22 +29,32 @@ def check_verification_infra(skill: SkillMetadata) -> MetricResult:
         score += 20
         details.append("tests/ 존재")
 
-    scripts_dir = skill.skill_path / "scripts"
-    if scripts_dir.is_dir():
-        for py_file, content in iter_scripts(skill, skip_init=False):
-            if re.search(r'--verify|--check|--validate', content):
+    inventory = get_inventory(skill)
+    capped = ()
+    if inventory.has_dir("scripts"):
+        corpus = get_corpus(skill)
+        capped = corpus.capped(skip_init=False)
+        for script in corpus.texts(skip_init=False):
+            features = script.features
+            if features is None:
+                has_flag = _VERIFY_FLAG_TEXT.search(script.content) is not None
+            else:
+                has_flag = any(o.startswith(_VERIFY_FLAGS) for o in features.option_strings)
+            if has_flag:
                 score += 15
-                details.append(f"검증 플래그 ({py_file.name})")
+                details.append(f"검증 플래그 ({script.name})")
                 break
 
-        for py_file in scripts_dir.rglob("*.py"):
-            if re.search(r'check|valid|verif', py_file.stem, re.IGNORECASE):
+        for entry in inventory.files("scripts", ".py"):
+            if re.search(r'check|valid|verif', entry.stem, re.IGNORECASE):
                 score += 15
-                details.append(f"검증 스크립트 ({py_file.name})")
+                details.append(f"검증 스크립트 ({entry.name})")
                 break
 
     if not details:
         details.append("검증 인프라 없음")
+    if capped:
+        details.append(format_capped(capped))
 
     return MetricResult(
         name="verification_infra",
@@ -44,7 +67,7 @@ def check_verification_infra(skill: SkillMetadata) -> MetricResult:
 
 def check_error_handling(skill: SkillMetadata) -> MetricResult:
     """에러 처리 패턴 (30점)."""
-    if not (skill.skill_path / "scripts").is_dir():
+    if not has_scripts_dir(skill):
         return MetricResult(
             name="error_handling", score=0, max_score=30.0,
             details="scripts/ 없음", passed=False,
@@ -56,13 +79,20 @@ def check_error_handling(skill: SkillMetadata) -> MetricResult:
     has_specific = False
     has_exit = False
 
-    for _, content in iter_scripts(skill, skip_init=False):
-        if "try:" in content:
-            has_try = True
-        if re.search(r'except\s+\w+', content):
-            has_specific = True
-        if "sys.exit" in content:
-            has_exit = True
+    corpus = get_corpus(skill)
+    capped = corpus.capped(skip_init=False)
+    for script in corpus.texts(skip_init=False):
+        features = script.features
+        if features is None:
+            # 파싱할 수 없는 스크립트는 이전 부분 문자열 검사
+            content = script.content
+            has_try = has_try or "try:" in content
+            has_specific = has_specific or _SPECIFIC_EXCEPT_TEXT.search(content) is not None
+            has_exit = has_exit or "sys.exit" in content
+            continue
+        has_try = has_try or features.try_blocks > 0
+        has_specific = has_specific or bool(features.except_types)
+        has_exit = has_exit or features.sys_exit_calls > 0
 
     if has_try:
         score += 10
@@ -76,6 +106,8 @@ def check_error_handling(skill: SkillMetadata) -> MetricResult:
 
     if not details:
         details.append("에러 처리 없음")
+    if capped:
+        details.append(format_capped(capped))
 
     return MetricResult(
         name="error_handling",
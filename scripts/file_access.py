@@ -0,0 +1,85 @@
+"""평가기용 파일 접근 — 크기 제한 + 큰 파일은 mmap 버퍼로 바로 스캔."""
+
+import mmap
+import re
+from contextlib import contextmanager
+from typing import Iterable, Union
+
+# 파일당 크기 제한 기본값 (초과 파일은 읽지 않고 메트릭 detail로 보고). 0이면 무제한.
+DEFAULT_MAX_FILE_SIZE = 16 * 1024 * 1024
+# 이 크기 이상인 작업 트리 파일은 read_text() 대신 읽기 전용 mmap으로 스캔
+MMAP_THRESHOLD = 1024 * 1024
+
+_max_file_size = DEFAULT_MAX_FILE_SIZE
+
+Buffer = Union[str, bytes, mmap.mmap]
+
+
+def get_max_file_size() -> int:
+    return _max_file_size
+
+
+def set_max_file_size(limit: int):
+    """프로세스 전역 크기 제한 설정 (orchestrator가 워커마다 호출)."""
+    global _max_file_size
+    _max_file_size = limit
+
+
+def exceeds_cap(entry) -> bool:
+    """인벤토리 항목이 크기 제한을 넘는지 (stat 결과만 사용, 파일은 열지 않음)."""
+    return 0 < _max_file_size < entry.size
+
+
+def format_capped(entries: Iterable) -> str:
+    """크기 제한으로 건너뛴 파일 목록 detail."""
+    entries = list(entries)
+    names = ", ".join(f"{e.name}({e.size / (1024 * 1024):.1f}MB)" for e in entries[:3])
+    more = f" 외 {len(entries) - 3}개" if len(entries) > 3 else ""
+    return f"크기 제한({_max_file_size / (1024 * 1024):.0f}MB) 초과 {len(entries)}개 건너뜀: {names}{more}"
+
+
+@contextmanager
+def open_buffer(inventory, entry):
+    """파일 내용 버퍼.
+
+    MMAP_THRESHOLD 미만이거나 디렉토리가 아닌 소스(아카이브/git)면 read_text()
+    문자열 (UnicodeDecodeError 등은 호출자에게 전파), 이상이면 읽기 전용 mmap이다.
+    mmap은 디코드/개행 정규화를 하지 않으므로 ScanPattern/contains로만 검사하고,
+    with 블록을 벗어나기 전에 match 결과를 다 써야 한다.
+    """
+    if entry.size < MMAP_THRESHOLD or inventory.reader is not None:
+        yield inventory.read_text(entry)
+        return
+    with open(inventory.path(entry), "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # 스캔 사이에 빈 파일이 된 경우
+            yield b""
+            return
+        with mapped:
+            yield mapped
+
+
+class ScanPattern:
+    """str/bytes 양쪽으로 컴파일한 정규식 — 버퍼 종류에 맞는 쪽으로 검색.
+
+    bytes 쪽의 \\w, \\s 등은 ASCII 기준이다.
+    """
+
+    def __init__(self, pattern: str, flags: int = 0):
+        self.text = re.compile(pattern, flags)
+        self.bytes = re.compile(pattern.encode("utf-8"), flags)
+
+    def search(self, buf: Buffer):
+        return (self.text if isinstance(buf, str) else self.bytes).search(buf)
+
+
+def contains(buf: Buffer, needle: str) -> bool:
+    """부분 문자열 포함 여부 (mmap의 `in`은 바이트 하나만 비교하므로 find 사용)."""
+    return buf.find(needle if isinstance(buf, str) else needle.encode("utf-8")) >= 0
+
+
+def head(buf: Buffer, size: int = 4096) -> str:
+    """버퍼 앞부분을 문자열로 (shebang/모듈 docstring 확인용)."""
+    chunk = buf[:size]
+    return chunk if isinstance(chunk, str) else chunk.decode("utf-8", errors="replace")
@@ -0,0 +1,193 @@
+"""git 리비전 스킬 소스 — checkout 없이 ls-tree 1회 + cat-file --batch 1개 프로세스."""
+
+import os
+import subprocess
+import threading
+import weakref
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+def _git(cwd: Path, *args) -> str:
+    proc = subprocess.run(
+        ["git", "-C", str(cwd), *args],
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise ValueError(proc.stderr.strip() or f"git {' '.join(args)} failed")
+    return proc.stdout
+
+
+def _existing_ancestor(path: Path) -> Path:
+    """작업 트리에 없는 경로(해당 리비전에만 있는 디렉토리)면 존재하는 상위로."""
+    path = path.absolute()
+    while not path.exists() and path != path.parent:
+        path = path.parent
+    return path
+
+
+def worktree_commit(skills_root: Path, *paths: Path) -> Optional[str]:
+    """작업 트리의 HEAD 커밋 sha — skills_root(와 저장소 안의 paths)에 커밋되지 않은
+    변경이 없을 때만. 저장소가 아니거나 변경이 있으면 None (--changed-since 기준 기록용).
+    """
+    try:
+        repo = Path(_git(_existing_ancestor(skills_root), "rev-parse", "--show-toplevel").strip())
+        sha = _git(repo, "rev-parse", "--verify", "--quiet", "HEAD^{commit}").strip()
+        specs = []
+        for path in (skills_root, *paths):
+            try:
+                specs.append(path.resolve().relative_to(repo.resolve()).as_posix())
+            except ValueError:
+                continue  # 저장소 밖 (예: 다른 위치의 벤치마크)
+        dirty = GitSource(repo, sha).changed_paths(*specs)
+    except ValueError:
+        return None
+    return None if dirty else sha
+
+
+# 프로세스별 소스 ((repo, rev, subdir) → GitSource). 피클링된 소스는 받는 프로세스의
+# 이 항목으로 풀리므로 워커마다 cat-file 프로세스가 하나이고, 작업에는 트리가 실리지 않는다
+_SOURCES: Dict[Tuple[str, str, str], "GitSource"] = {}
+_SOURCES_LOCK = threading.Lock()
+
+
+def _shared_source(repo: str, rev: str, subdir: str) -> "GitSource":
+    """이 프로세스의 (repo, rev, subdir) 소스 — 없으면 트리 목록 없이 만든다 (read_bytes만 씀)."""
+    key = (repo, rev, subdir)
+    with _SOURCES_LOCK:
+        source = _SOURCES.get(key)
+        if source is None:
+            source = _SOURCES[key] = GitSource(Path(repo), rev, subdir)
+        return source
+
+
+def _reset_after_fork():
+    """fork된 자식은 부모의 cat-file 파이프와 (잡혀 있었을 수 있는) 락을 쓰지 않는다."""
+    global _SOURCES_LOCK
+    _SOURCES_LOCK = threading.Lock()
+    for source in _SOURCES.values():
+        source._proc = None
+        source._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _terminate(proc):
+    if proc.poll() is None:
+        proc.stdin.close()
+        proc.wait()
+
+
+class GitSource:
+    """특정 커밋의 skills_root 하위 트리.
+
+    listing()은 `git ls-tree -r -l` 한 번의 결과이며 경로는 skills_root 기준이다.
+    read_bytes()는 오래 살아있는 `git cat-file --batch` 프로세스 하나로 blob을
+    스트리밍한다 (프로세스는 처음 읽을 때 시작). 피클링하면 repo/rev/subdir만 넘어가고
+    받는 프로세스의 공유 소스(_shared_source)로 풀린다 — 워커마다 cat-file 하나.
+    서브모듈과 심볼릭 링크 항목은 건너뛴다.
+    """
+
+    def __init__(self, repo: Path, rev: str, subdir: str = ""):
+        self.repo = repo
+        self.rev = rev
+        self.subdir = subdir
+        self.commit_time_ns = 0
+        self._blobs: Dict[str, str] = {}
+        self._listing: List[Tuple[str, int, int]] = []
+        self._indexed = False
+        self._proc = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, skills_root: Path, rev: str) -> "GitSource":
+        """skills_root가 속한 저장소에서 rev를 커밋 sha로 고정하고 트리를 나열.
+
+        rev나 저장소가 유효하지 않으면 ValueError.
+        """
+        start = _existing_ancestor(skills_root)
+        repo = Path(_git(start, "rev-parse", "--show-toplevel").strip())
+        sha = _git(repo, "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}").strip()
+        subdir = skills_root.resolve().relative_to(repo.resolve()).as_posix()
+        source = cls(repo, sha, "" if subdir == "." else subdir)
+        source.commit_time_ns = int(_git(repo, "show", "-s", "--format=%ct", sha).strip()) * 1_000_000_000
+        source._load_tree()
+        with _SOURCES_LOCK:
+            _SOURCES[(str(repo), sha, source.subdir)] = source
+        return source
+
+    def _load_tree(self):
+        args = ["ls-tree", "-r", "-l", "-z", "--full-tree", self.rev]
+        if self.subdir:
+            args += ["--", self.subdir]
+        prefix = f"{self.subdir}/" if self.subdir else ""
+        for record in _git(self.repo, *args).split("\0"):
+            if not record:
+                continue
+            meta, path = record.split("\t", 1)
+            mode, obj_type, sha, size = meta.split()
+            if obj_type != "blob" or mode == "120000" or not path.startswith(prefix):
+                continue
+            rel = path[len(prefix):]
+            self._blobs[rel] = sha
+            self._listing.append((rel, int(size), self.commit_time_ns))
+        self._indexed = True
+
+    def listing(self) -> List[Tuple[str, int, int]]:
+        return list(self._listing)
+
+    def _process(self):
+        if self._proc is None:
+            self._proc = subprocess.Popen(
+                ["git", "-C", str(self.repo), "cat-file", "--batch"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            )
+            weakref.finalize(self, _terminate, self._proc)
+        return self._proc
+
+    def read_bytes(self, rel_path: str) -> bytes:
+        # 트리를 나열하지 않은 (워커의) 소스는 blob sha 대신 rev:경로로 요청한다
+        sha = self._blobs.get(rel_path)
+        if sha is None:
+            if self._indexed:
+                raise FileNotFoundError(f"{self.rev}:{self.subdir}/{rel_path}")
+            sha = f"{self.rev}:{self.subdir}/{rel_path}" if self.subdir else f"{self.rev}:{rel_path}"
+        with self._lock:
+            proc = self._process()
+            proc.stdin.write(f"{sha}\n".encode())
+            proc.stdin.flush()
+            header = proc.stdout.readline().split()
+            if len(header) < 3 or header[1] == b"missing":
+                raise FileNotFoundError(f"{self.rev}:{self.subdir}/{rel_path}")
+            data = proc.stdout.read(int(header[2]))
+            proc.stdout.read(1)  # 내용 뒤 개행
+        return data
+
+    def changed_paths(self, *pathspecs: str) -> List[str]:
+        """이 커밋과 작업 트리 사이에 바뀐 파일 (저장소 기준 경로, 추가/삭제/추적 안 된 파일 포함)."""
+        specs = ["--", *pathspecs] if pathspecs else []
+        diff = _git(self.repo, "diff", "--name-only", "--no-renames", "-z", self.rev, *specs)
+        untracked = _git(self.repo, "ls-files", "--others", "--exclude-standard", "-z", *specs)
+        return sorted({p for p in (diff + untracked).split("\0") if p})
+
+    def show(self, repo_path: str):
+        """이 커밋의 저장소 기준 파일 텍스트. 없으면 None."""
+        try:
+            return _git(self.repo, "show", f"{self.rev}:{repo_path}")
+        except ValueError:
+            return None
+
+    def close(self):
+        with self._lock:
+            if self._proc is not None:
+                _terminate(self._proc)
+                self._proc = None
+        with _SOURCES_LOCK:
+            key = (str(self.repo), self.rev, self.subdir)
+            if _SOURCES.get(key) is self:
+                del _SOURCES[key]
+
+    def __reduce__(self):
+        return _shared_source, (str(self.repo), self.rev, self.subdir)
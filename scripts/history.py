@@ -5,6 +5,7 @@ import hashlib
 from datetime import datetime
 from pathlib import Path
 
+from models import LayerResult
 from score_utils import weighted_score
 
 
@@ -32,8 +33,13 @@ def build_snapshot(
     ecosystem_result=None,
     evaluator_version: str = None,
     layer_weights: dict = None,
+    source_commit: str = None,
 ) -> dict:
-    """현재 결과를 스냅샷 dict로 변환."""
+    """현재 결과를 스냅샷 dict로 변환.
+
+    source_commit은 평가한 스킬 트리의 커밋 sha (--changed-since가 이 커밋 기준일 때만
+    스냅샷 점수를 재사용한다). 알 수 없으면 (변경이 남은 작업 트리 등) 기록하지 않는다.
+    """
     if evaluator_version is None:
         evaluator_version = _compute_evaluator_version()
     snapshot = {
@@ -42,6 +48,8 @@ def build_snapshot(
         "skills": {},
         "summary": {},
     }
+    if source_commit:
+        snapshot["source_commit"] = source_commit
     all_w = []
     for skill_name, layer_results in results.items():
         w = weighted_score(layer_results, layer_weights=layer_weights)
@@ -59,12 +67,13 @@ def build_snapshot(
     return snapshot
 
 
-def save_snapshot(results: dict, ecosystem_result=None, filepath: Path = None, layer_weights: dict = None):
+def save_snapshot(results: dict, ecosystem_result=None, filepath: Path = None, layer_weights: dict = None,
+                  source_commit: str = None):
     """스냅샷을 history.jsonl에 append."""
     if filepath is None:
         filepath = DEFAULT_HISTORY_PATH
     filepath.parent.mkdir(parents=True, exist_ok=True)
-    snapshot = build_snapshot(results, ecosystem_result, layer_weights=layer_weights)
+    snapshot = build_snapshot(results, ecosystem_result, layer_weights=layer_weights, source_commit=source_commit)
     with open(filepath, "a", encoding="utf-8") as f:
         f.write(json.dumps(snapshot, ensure_ascii=False) + "\n")
     return filepath
@@ -89,6 +98,32 @@ def get_latest(filepath: Path = None):
     return history[-1] if history else None
 
 
+def latest_compatible(evaluator_version: str = None, filepath: Path = None, source_commit: str = None):
+    """evaluator_version이 같은 (source_commit을 주면 그 커밋에서 만든) 가장 최근 스냅샷. 없으면 None."""
+    if evaluator_version is None:
+        evaluator_version = _compute_evaluator_version()
+    for snapshot in reversed(load_history(filepath)):
+        if snapshot.get("evaluator_version") != evaluator_version:
+            continue
+        if source_commit is None or snapshot.get("source_commit") == source_commit:
+            return snapshot
+    return None
+
+
+def snapshot_layer_results(snapshot: dict, skill_name: str, layer_ids) -> dict:
+    """스냅샷의 레이어 점수로 {layer_id: LayerResult} 복원 (메트릭 상세 없음).
+
+    스냅샷에 스킬이나 요청한 레이어 중 하나라도 없으면 None.
+    """
+    layers = snapshot.get("skills", {}).get(skill_name, {}).get("layers", {})
+    if any(lid not in layers for lid in layer_ids):
+        return None
+    return {
+        lid: LayerResult(layer=lid, skill_name=skill_name, overall_score=layers[lid])
+        for lid in layer_ids
+    }
+
+
 def compute_diff(current: dict, baseline: dict) -> dict:
     """두 스냅샷 비교."""
     diff = {
@@ -0,0 +1,184 @@
+"""스킬 디렉토리 파일 인벤토리 — os.scandir 1회 순회 결과 (불변)."""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+# 하위 트리 전체를 순회하는 최상위 디렉토리 (scripts/**/*.py, bridges/**, references/*)
+RECURSIVE_DIRS = ("scripts", "bridges", "references")
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """인벤토리 항목 하나."""
+    rel_path: str      # 스킬 디렉토리 기준 POSIX 상대경로
+    size: int
+    mtime_ns: int
+    kind: str          # "file" | "dir"
+
+    @property
+    def name(self) -> str:
+        return self.rel_path.rsplit("/", 1)[-1]
+
+    @property
+    def stem(self) -> str:
+        name = self.name
+        return name.rsplit(".", 1)[0] if "." in name[1:] else name
+
+    @property
+    def top(self) -> str:
+        """최상위 하위 디렉토리명. 스킬 루트 직속 항목이면 ""."""
+        return self.rel_path.split("/", 1)[0] if "/" in self.rel_path else ""
+
+    @property
+    def depth(self) -> int:
+        return self.rel_path.count("/")
+
+
+@dataclass(frozen=True)
+class SkillInventory:
+    """스킬 디렉토리 스냅샷. 평가기는 파일시스템 대신 이 객체를 조회한다.
+
+    groups는 최상위 하위 디렉토리명 → 그 디렉토리와 하위 항목들
+    (루트 직속 파일은 "").
+
+    reader가 있으면 (아카이브 등 디렉토리가 아닌 소스) 파일 내용은
+    reader.read_bytes(prefix + rel_path)로 읽고, root는 표시용 가상 경로다.
+    """
+    root: Path
+    entries: Tuple[FileEntry, ...]
+    groups: Dict[str, Tuple[FileEntry, ...]] = field(compare=False, repr=False)
+    by_path: Dict[str, FileEntry] = field(compare=False, repr=False)
+    reader: Optional[object] = field(default=None, compare=False, repr=False)
+    prefix: str = ""
+
+    def get(self, rel_path: str) -> Optional[FileEntry]:
+        return self.by_path.get(rel_path)
+
+    def has_file(self, rel_path: str) -> bool:
+        entry = self.get(rel_path)
+        return entry is not None and entry.kind == "file"
+
+    def has_dir(self, rel_path: str) -> bool:
+        entry = self.get(rel_path)
+        return entry is not None and entry.kind == "dir"
+
+    def files(self, top: str, suffix: str = None, recursive: bool = True) -> Tuple[FileEntry, ...]:
+        """top/ 아래 파일 목록 (경로 정렬). recursive=False면 직속 파일만."""
+        return tuple(
+            e for e in self.groups.get(top, ())
+            if e.kind == "file"
+            and (suffix is None or e.rel_path.endswith(suffix))
+            and (recursive or e.depth == 1)
+        )
+
+    def path(self, entry) -> Path:
+        """FileEntry 또는 상대경로 → 실제 경로."""
+        rel = entry.rel_path if isinstance(entry, FileEntry) else entry
+        return self.root / rel
+
+    def read_text(self, entry) -> str:
+        """UTF-8 디코드 + 개행 정규화 (Path.read_text의 universal newlines와 동일)."""
+        text = self.read_bytes(entry).decode("utf-8")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def read_bytes(self, entry) -> bytes:
+        if self.reader is None:
+            return self.path(entry).read_bytes()
+        rel = entry.rel_path if isinstance(entry, FileEntry) else entry
+        return self.reader.read_bytes(self.prefix + rel)
+
+
+def _stat_entry(dir_entry: os.DirEntry, rel: str, kind: str) -> FileEntry:
+    st = dir_entry.stat()
+    return FileEntry(rel_path=rel, size=st.st_size, mtime_ns=st.st_mtime_ns, kind=kind)
+
+
+def _walk(path, prefix: str, out: list):
+    """scandir 재귀 순회 (경로 정렬).
+
+    루트 직속(prefix == "")에서는 RECURSIVE_DIRS만 내려가며, 하위에서는
+    심볼릭 링크 디렉토리를 따라가지 않는다 (순환 방지).
+    """
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    with it:
+        children = sorted(it, key=lambda e: e.name)
+    top_level = not prefix
+    for child in children:
+        rel = f"{prefix}{child.name}"
+        try:
+            if child.is_dir(follow_symlinks=top_level):
+                out.append(_stat_entry(child, rel, "dir"))
+                if not top_level or child.name in RECURSIVE_DIRS:
+                    _walk(child.path, rel + "/", out)
+            elif child.is_file():
+                out.append(_stat_entry(child, rel, "file"))
+        except OSError:
+            continue
+
+
+def build_inventory(skill_dir: Path) -> SkillInventory:
+    """스킬 디렉토리를 한 번 순회해 인벤토리 생성.
+
+    루트 직속 항목은 모두 기록하고, RECURSIVE_DIRS만 하위까지 내려간다
+    (tests/ 등은 존재 여부만 필요).
+    """
+    entries = []
+    _walk(skill_dir, "", entries)
+    return make_inventory(skill_dir, entries)
+
+
+def inventory_from_listing(root: Path, listing, prefix: str = "", reader=None) -> SkillInventory:
+    """파일 목록 [(경로, size, mtime_ns)]에서 prefix 아래 스킬의 인벤토리 생성.
+
+    아카이브/git 트리처럼 한 번에 나열되는 소스용. "/"로 끝나는 경로는 디렉토리
+    항목이고, 나머지 디렉토리는 파일 경로에서 합성한다. 디렉토리 순회와 같은
+    규칙(루트 직속 + RECURSIVE_DIRS 하위)만 남긴다.
+    """
+    files = {}
+    dirs = set()
+    for path, size, mtime_ns in listing:
+        if prefix and not path.startswith(prefix):
+            continue
+        rel = path[len(prefix):]
+        if rel.endswith("/"):
+            parts = rel.rstrip("/").split("/")
+            if parts[0] and (len(parts) == 1 or parts[0] in RECURSIVE_DIRS):
+                dirs.update("/".join(parts[:i]) for i in range(1, len(parts) + 1))
+            continue
+        if not rel:
+            continue
+        parts = rel.split("/")
+        if len(parts) > 1 and parts[0] not in RECURSIVE_DIRS:
+            dirs.add(parts[0])
+            continue
+        for i in range(1, len(parts)):
+            dirs.add("/".join(parts[:i]))
+        files[rel] = FileEntry(rel_path=rel, size=size, mtime_ns=mtime_ns, kind="file")
+    entries = list(files.values())
+    entries.extend(FileEntry(rel_path=d, size=0, mtime_ns=0, kind="dir") for d in dirs if d not in files)
+    entries.sort(key=lambda e: e.rel_path.split("/"))
+    return make_inventory(root, entries, reader=reader, prefix=prefix)
+
+
+def make_inventory(root: Path, entries, reader=None, prefix: str = "") -> SkillInventory:
+    """FileEntry 목록으로 그룹/경로 색인을 갖춘 SkillInventory 생성."""
+    groups = {}
+    for entry in entries:
+        key = entry.top if entry.top else ("" if entry.kind == "file" else entry.rel_path)
+        groups.setdefault(key, []).append(entry)
+    return SkillInventory(
+        root=root,
+        entries=tuple(entries),
+        groups={k: tuple(v) for k, v in groups.items()},
+        by_path={e.rel_path: e for e in entries},
+        reader=reader,
+        prefix=prefix,
+    )
@@ -0,0 +1,59 @@
+"""실행 단위 트리거 키워드 사전 — 정규화된 키워드 ↔ 정수 id."""
+
+import sys
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+
+def normalize_keyword(keyword: str) -> str:
+    """키워드 비교 기준 (소문자)."""
+    return keyword.lower()
+
+
+class KeywordTable:
+    """정규화된 키워드에 등장 순서대로 정수 id를 부여하는 사전.
+
+    TriggerInfo가 생성될 때 키워드를 여기 등록하고 (keyword_ids, normalized)를
+    보관하므로, 평가기는 문자열 소문자화/해싱 대신 정수 집합 연산을 쓴다.
+    id는 discovery가 돌아가는 메인 프로세스에서 부여되고 TriggerInfo와 함께
+    피클링되므로 워커 프로세스에서도 스킬 간 비교가 일관된다.
+    discovery 스레드에서 동시에 등록할 수 있도록 잠금을 건다.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._words: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def intern(self, keyword: str) -> int:
+        """키워드(정규화 전) → id. 처음 보는 키워드면 새 id."""
+        word = normalize_keyword(keyword)
+        kid = self._ids.get(word)
+        if kid is None:
+            with self._lock:
+                kid = self._ids.get(word)
+                if kid is None:
+                    kid = len(self._words)
+                    self._words.append(sys.intern(word))
+                    self._ids[self._words[kid]] = kid
+        return kid
+
+    def intern_all(self, keywords: Iterable[str]) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+        """키워드 목록 → (정렬된 고유 id, 같은 순서의 정규화 키워드)."""
+        ids = tuple(sorted({self.intern(kw) for kw in keywords}))
+        return ids, tuple(self._words[i] for i in ids)
+
+    def lookup(self, keywords: Iterable[str]) -> frozenset:
+        """이미 등록된 키워드의 id 집합 (등록하지 않음)."""
+        ids = self._ids
+        return frozenset(ids[w] for w in map(normalize_keyword, keywords) if w in ids)
+
+    def word(self, kid: int) -> str:
+        return self._words[kid]
+
+
+# 프로세스 전역 사전 (한 번의 평가 실행 = 한 프로세스)
+KEYWORDS = KeywordTable()
@@ -0,0 +1,181 @@
+"""SKILL.md 선형 스캐너 — 결과는 원문 텍스트의 오프셋."""
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+# fenced code block 여는 ``` 뒤 언어태그
+_FENCE_LANG_RE = re.compile(r'\w*')
+# 트리거 헤더 줄 (## 트리거, ### 트리거 등)
+_TRIGGER_HEADER_RE = re.compile(r'##\s*트리거\s*$')
+# "-" / "*"로 시작하는 줄
+_LIST_LINE_RE = re.compile(r'^[-*]', re.MULTILINE)
+
+
+@dataclass(frozen=True, slots=True)
+class MarkdownScan:
+    """scan_markdown 결과. 모든 span은 text 기준 [start, end) 오프셋.
+
+    - frontmatter_end: YAML 파서에 넘길 구간 끝 (frontmatter 없으면 0)
+    - body_start: frontmatter 이후 본문 시작
+    - sections: (헤더, 내용 start, 내용 end) — "## " 줄 기준, 등장 순서
+    - code_blocks: (언어태그, 내용 start, 내용 end)
+    - checklist: (오프셋, 체크 여부) — "- [ ]" / "- [x]" (frontmatter 포함 전체)
+    - trigger_span: 트리거 섹션의 목록 줄 구간 (없으면 None)
+    """
+    frontmatter_end: int
+    body_start: int
+    sections: Tuple[Tuple[str, int, int], ...]
+    code_blocks: Tuple[Tuple[str, int, int], ...]
+    checklist: Tuple[Tuple[int, bool], ...]
+    trigger_span: Optional[Tuple[int, int]]
+
+
+def _find_body_start(text: str) -> Tuple[int, int]:
+    """(frontmatter_end, body_start). 닫는 ---가 없으면 본문은 전체, YAML 구간도 전체."""
+    n = len(text)
+    first_end = text.find("\n")
+    if first_end < 0:
+        first_end = n
+    if text[:first_end].strip() != "---":
+        return 0, 0
+    pos = first_end + 1
+    while pos <= n:
+        end = text.find("\n", pos)
+        if end < 0:
+            end = n
+        if text[pos:end].strip() == "---":
+            body_start = min(end + 1, n)
+            return body_start, body_start
+        pos = end + 1
+    return n, 0
+
+
+def _line_end(text: str, pos: int, n: int) -> int:
+    end = text.find("\n", pos)
+    return n if end < 0 else end
+
+
+def _trigger_list_span(text: str, pos: int, n: int) -> Optional[Tuple[int, int]]:
+    """트리거 헤더 다음 줄(pos)부터 첫 목록 줄을 찾고, 이어지는 목록 줄 구간 반환.
+
+    "- "/"* "로 시작하는 줄이 목록의 시작이며, 끝까지 없으면 공백 없는 "-키워드"
+    줄 중 마지막 것을 쓴다 (이전 정규식의 되돌림 결과와 동일).
+    """
+    fallback = None
+    for m in _LIST_LINE_RE.finditer(text, pos):
+        start = m.start()
+        end = _line_end(text, start, n)
+        if end <= start + 1:
+            continue
+        if end >= n or text.startswith((" ", "\t"), start + 1):
+            last = end
+            nxt = end + 1
+            while nxt <= n and text.startswith(("-", "*"), nxt):
+                last = _line_end(text, nxt, n)
+                nxt = last + 1
+            return start, last
+        fallback = (start, end)
+    return fallback
+
+
+def _header_sections(text: str, body_start: int, n: int) -> list:
+    """"## "로 시작하는 본문 줄마다 (헤더, 내용 start, 내용 end)."""
+    sections = []
+    header = None
+    start = 0
+    if text.startswith("## ", body_start):
+        pos = body_start
+    else:
+        pos = text.find("\n## ", body_start)
+        pos = pos + 1 if pos >= 0 else -1
+    while pos >= 0:
+        end = _line_end(text, pos, n)
+        if header is not None:
+            sections.append((header, start, max(start, pos - 1)))
+        header = text[pos + 3:end].strip()
+        start = min(end + 1, n)
+        pos = text.find("\n## ", end)
+        pos = pos + 1 if pos >= 0 else -1
+    if header is not None:
+        sections.append((header, start, n))
+    return sections
+
+
+def _code_blocks(text: str, body_start: int, n: int) -> list:
+    """(언어태그, 내용 start, 내용 end). 백틱 run 단위로 처리한다.
+
+    블록 밖에서는 run 끝의 ``` 뒤에 언어태그 + 줄바꿈이 오면 열리고, 블록
+    안에서는 run 앞의 ``` 에서 닫힌다 (남은 run이 3개 이상이면 다시 열릴 수 있음).
+    """
+    blocks = []
+    lang = None
+    start = 0
+    pos = text.find("```", body_start)
+    while pos >= 0:
+        run_end = pos + 3
+        while run_end < n and text[run_end] == "`":
+            run_end += 1
+        run = run_end - pos
+        if lang is not None:
+            blocks.append((lang, start, pos))
+            lang = None
+            run -= 3
+        if run >= 3:
+            lang_end = _FENCE_LANG_RE.match(text, run_end).end()
+            if lang_end < n and text[lang_end] == "\n":
+                lang = text[run_end:lang_end]
+                start = lang_end + 1
+        pos = text.find("```", run_end)
+    return blocks
+
+
+def _checklist(text: str) -> list:
+    """"- [ ]" / "- [x]" 위치와 체크 여부 (겹치지 않게, 전체 텍스트)."""
+    out = []
+    end = len(text)
+    j = text.find("- [")
+    while j >= 0:
+        if j + 5 <= end and text[j + 4] == "]" and text[j + 3] in " x":
+            out.append((j, text[j + 3] == "x"))
+            j = text.find("- [", j + 5)
+        else:
+            j = text.find("- [", j + 1)
+    return out
+
+
+def _trigger_span(text: str, body_start: int, n: int) -> Optional[Tuple[int, int]]:
+    """첫 트리거 헤더 줄(줄바꿈으로 끝나야 함) 뒤의 목록 구간."""
+    pos = text.find("트리거", body_start)
+    while pos >= 0:
+        line_start = text.rfind("\n", body_start, pos) + 1 or body_start
+        end = _line_end(text, pos, n)
+        if end < n and _TRIGGER_HEADER_RE.search(text, line_start, end):
+            return _trigger_list_span(text, end + 1, n)
+        pos = text.find("트리거", end)
+    return None
+
+
+def scan_markdown(text: str, frontmatter: bool = True) -> MarkdownScan:
+    """SKILL.md를 선형 시간에 스캔해 섹션/코드 블록/체크리스트/트리거 구간 수집.
+
+    토큰 종류(## 헤더, ``` run, 체크박스, 트리거 헤더)마다 str.find로 리터럴
+    위치만 찾아 상태 기계를 돌린다. 파이썬 코드는 토큰 위치에서만 실행되고
+    텍스트는 잘라내지 않는다 (헤더명과 언어태그 제외). 백트래킹이 없으므로
+    트리거 헤더가 반복되는 문서에서도 O(n)이다.
+
+    섹션과 코드 블록 규칙은 기존 파서와 동일하다: "## "로 시작하는 줄은 코드
+    블록 안에서도 섹션을 나누고, 코드 블록은 줄 끝의 ```lang 으로 열려 다음
+    ``` (줄 중간 포함)에서 닫힌다.
+    """
+    n = len(text)
+    frontmatter_end, body_start = _find_body_start(text) if frontmatter else (0, 0)
+    return MarkdownScan(
+        frontmatter_end=frontmatter_end,
+        body_start=body_start,
+        sections=tuple(_header_sections(text, body_start, n)),
+        code_blocks=tuple(_code_blocks(text, body_start, n)),
+        checklist=tuple(_checklist(text)),
+        trigger_span=_trigger_span(text, body_start, n),
+    )
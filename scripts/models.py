@@ -1,20 +1,90 @@
-"""Skill Evaluator 핵심 데이터 모델."""
+"""Skill Evaluator 핵심 데이터 모델.
 
+스킬 수 × 레이어 × 메트릭만큼 인스턴스가 생기고 프로세스 풀로 피클링되므로
+모든 모델은 __slots__ 기반이며, 생성 후 바뀌지 않는 TriggerInfo/MetricResult는
+frozen이다. 반복되는 짧은 문자열(메트릭명, 레이어 id, 파일명)은 intern해
+인스턴스 간 공유한다.
+"""
+
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
+
+from inventory import SkillInventory
+from keywords import KEYWORDS
+from markdown_scan import MarkdownScan
+from script_corpus import ScriptCorpus
+
+
+# 평가 자체의 실패를 나타내는 메트릭 이름 (orchestrator가 만든다 — 오류 집계 대상, 결과 캐시 제외)
+ERROR_METRICS = frozenset({"runtime_error", "timeout"})
+
+
+def _intern_all(values) -> Tuple[str, ...]:
+    return tuple(sys.intern(v) for v in values)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TriggerInfo:
-    """SKILL.md에서 추출한 트리거 정보."""
-    keywords: List[str]
+    """SKILL.md에서 추출한 트리거 정보.
+
+    생성 시 키워드를 keywords.KEYWORDS에 등록해 정렬된 고유 id(keyword_ids)와
+    같은 순서의 정규화 키워드(normalized)를 함께 보관한다.
+    """
+    keywords: Tuple[str, ...]  # list로 넘겨도 tuple로 보관 (frozen)
     source: str  # "yaml_description" | "markdown_section" | "both"
+    keyword_ids: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    normalized: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "keywords", tuple(self.keywords))
+        ids, words = KEYWORDS.intern_all(self.keywords)
+        object.__setattr__(self, "keyword_ids", ids)
+        object.__setattr__(self, "normalized", words)
+
+
+@dataclass(slots=True)
+class SkillDocument:
+    """SKILL.md 1회 읽기 + 1회 스캔 결과 — discovery와 모든 layer가 공유.
+
+    본문/섹션/코드 블록은 scan의 오프셋으로만 보관하고, 아래 프로퍼티는
+    호출할 때 text에서 잘라낸다.
+    """
+    text: str
+    scan: MarkdownScan
+
+    @property
+    def body(self) -> str:
+        return self.text[self.scan.body_start:]
 
+    @property
+    def section_headers(self) -> List[str]:
+        """## 헤더 (중복 제거, 첫 등장 순서)."""
+        return list(dict.fromkeys(h for h, _, _ in self.scan.sections))
 
-@dataclass
+    @property
+    def sections(self) -> Dict[str, str]:
+        """{헤더: 내용}. 같은 헤더가 반복되면 마지막 내용."""
+        return {h: self.text[start:end] for h, start, end in self.scan.sections}
+
+    @property
+    def code_blocks(self) -> List[tuple]:
+        """[(언어태그, 내용)]."""
+        return [(lang, self.text[start:end]) for lang, start, end in self.scan.code_blocks]
+
+    @property
+    def line_count(self) -> int:
+        return self.text.count("\n") + 1
+
+
+@dataclass(slots=True)
 class SkillMetadata:
-    """SKILL.md 파싱 + 파일시스템 스캔 결과."""
+    """SKILL.md 파싱 + 파일시스템 스캔 결과. 파일 목록은 tuple로 보관.
+
+    deferred()로 만든 인스턴스는 name/description/skill_path만 채워져 있고,
+    나머지 필드는 처음 접근할 때 loader(skill)가 채운다 (loader가 None이면 로드 완료).
+    """
     name: str
     description: str
     skill_path: Path
@@ -31,16 +101,65 @@ class SkillMetadata:
     has_quick_start: bool = False
     has_cli_options: bool = False
     has_prerequisites: bool = False
-    script_files: List[str] = field(default_factory=list)
-    reference_files: List[str] = field(default_factory=list)
+    script_files: Tuple[str, ...] = ()
+    reference_files: Tuple[str, ...] = ()
     skill_md_lines: int = 0
     code_block_count: int = 0
     code_block_languages: List[str] = field(default_factory=list)
     section_headers: List[str] = field(default_factory=list)
+    section_flags: Dict[str, bool] = field(default_factory=dict)  # {"has_<섹션 카테고리>": bool}
     pipeline_targets: List[str] = field(default_factory=list)
+    qualifier: str = ""  # 중첩 스킬이면 discovery가 name 앞에 붙인 상위 상대경로 (예: team-a)
+    document: Optional[SkillDocument] = field(default=None, repr=False, compare=False)
+    inventory: Optional[SkillInventory] = field(default=None, repr=False, compare=False)
+    corpus: Optional[ScriptCorpus] = field(default=None, repr=False, compare=False)
+    loader: Optional[Callable] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.script_files = _intern_all(self.script_files)
+        self.reference_files = _intern_all(self.reference_files)
 
+    @classmethod
+    def deferred(
+        cls,
+        name: str,
+        description: str,
+        skill_path: Path,
+        loader: Callable,
+        inventory: Optional[SkillInventory] = None,
+    ) -> "SkillMetadata":
+        """본문/파일시스템 필드를 비워 둔 인스턴스 (slot 미설정 → __getattr__에서 로드)."""
+        skill = object.__new__(cls)
+        skill.name = name
+        skill.description = description
+        skill.skill_path = skill_path
+        skill.pipeline_targets = []
+        skill.qualifier = ""
+        skill.loader = loader
+        if inventory is not None:
+            skill.inventory = inventory
+        return skill
 
-@dataclass
+    @property
+    def local_name(self) -> str:
+        """qualifier를 뗀 frontmatter 이름 (디렉토리명 비교, 벤치마크 항목 조회용)."""
+        return self.name[len(self.qualifier) + 1:] if self.qualifier else self.name
+
+    def __getattr__(self, attr):
+        # 설정된 slot은 여기까지 오지 않는다 — 미설정 필드 첫 접근 시 1회 로드
+        loader = object.__getattribute__(self, "loader")
+        if loader is None or attr not in self.__dataclass_fields__:
+            raise AttributeError(attr)
+        self.loader = None
+        try:
+            loader(self)
+        except BaseException:
+            self.loader = loader
+            raise
+        return object.__getattribute__(self, attr)
+
+
+@dataclass(frozen=True, slots=True)
 class MetricResult:
     """개별 메트릭 측정 결과."""
     name: str
@@ -49,8 +168,11 @@ class MetricResult:
     details: str
     passed: bool = True
 
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
 
-@dataclass
+
+@dataclass(slots=True)
 class LayerResult:
     """단일 Layer 평가 결과."""
     layer: str         # L1, L2, ...
@@ -59,6 +181,10 @@ class LayerResult:
     overall_score: float = 0.0
     recommendations: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        self.layer = sys.intern(self.layer)
+        self.skill_name = sys.intern(self.skill_name)
+
     def compute_score(self):
         """가용 메트릭으로 점수 계산 (0-100)."""
         if not self.metrics:
@@ -69,7 +195,7 @@ class LayerResult:
         self.overall_score = (total / max_total * 100) if max_total > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class EcosystemMetric:
     """에코시스템 단위 메트릭."""
     name: str
@@ -79,7 +205,7 @@ class EcosystemMetric:
     affected_skills: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EcosystemResult:
     """크로스 스킬 에코시스템 평가 결과."""
     metrics: List[EcosystemMetric] = field(default_factory=list)
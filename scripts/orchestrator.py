@@ -2,23 +2,38 @@
 
 import os
 import sys
-from concurrent.futures import ProcessPoolExecutor
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from analysis_cache import AnalysisCache
+from archive_source import is_archive
+from ast_features import FEATURES
+from change_set import ChangeSet
 from config_loader import load_eval_config
-from discovery import discover_skills
-from evaluators import LAYERS, evaluate_ecosystem
+from discovery import iter_skills, resolve_pipeline_targets
+from discovery_index import DiscoveryIndex
+from file_access import get_max_file_size, set_max_file_size
+from git_source import GitSource, worktree_commit
+from evaluators import CROSS_SKILL_LAYERS, LAYER_RESOURCES, LAYERS, RESOURCE_IO, evaluate_ecosystem
+from evaluators.base import get_inventory
 from history import (
     build_snapshot,
     compute_diff,
     format_diff_text,
     format_history_text,
+    latest_compatible,
     load_history,
     save_snapshot,
+    snapshot_layer_results,
 )
 from models import LayerResult, MetricResult
-from reporter import format_json, format_markdown, format_text
+from reporter import JsonlWriter, format_json, format_markdown, format_text
+from result_cache import ResultCache, cross_skill_context
+from scheduler import CostModel, auto_workers, plan_units
 from score_utils import weighted_score
+from section_taxonomy import SectionTaxonomy
 
 
 class LayerEvaluationError(Exception):
@@ -31,13 +46,23 @@ class LayerEvaluationError(Exception):
         super().__init__(f"skill={skill_name} layer={layer_id} error={type(original).__name__}: {original}")
 
 
+class LayerTimeoutError(Exception):
+    """레이어 평가가 시간 예산(--layer-timeout/--skill-timeout)을 넘김."""
+
+
+def _is_timeout(result: LayerResult) -> bool:
+    """_error_layer_result가 만든 시간 초과 결과인지."""
+    return bool(result.metrics) and result.metrics[0].name == "timeout"
+
+
 def _error_layer_result(layer_id: str, skill_name: str, exc: Exception) -> LayerResult:
-    """레이어 평가 실패를 LayerResult 형태로 캡슐화."""
+    """레이어 평가 실패를 LayerResult 형태로 캡슐화 (시간 초과는 timeout 메트릭)."""
     detail = f"{type(exc).__name__}: {exc}"
+    metric = "timeout" if isinstance(exc, LayerTimeoutError) else "runtime_error"
     lr = LayerResult(layer=layer_id, skill_name=skill_name)
     lr.metrics = [
         MetricResult(
-            name="runtime_error",
+            name=metric,
             score=0.0,
             max_score=1.0,
             details=detail,
@@ -45,22 +70,117 @@ def _error_layer_result(layer_id: str, skill_name: str, exc: Exception) -> Layer
         )
     ]
     lr.compute_score()
-    lr.recommendations.append(f"runtime_error: {detail}")
+    lr.recommendations.append(f"{metric}: {detail}")
     return lr
 
 
+# 2단계(교차 스킬) 워커가 공유하는 읽기 전용 컨텍스트 (skills, all_skills, benchmarks_dir, fail_fast)
+_SHARED = None
+# 벽시계 예산(초) (레이어 하나, 스킬 하나의 레이어 전체). None이면 제한 없음.
+# 스킬 예산은 부모가 스킬별로 쓴 시간을 빼서 남은 몫을 작업마다 넘긴다
+_BUDGETS = (None, None)
+# 스킬 단위 레이어가 끝난 스킬의 SKILL.md 문서와 스크립트 코퍼스를 놓을지. 뒤에서 텍스트를 다시
+# 보는 단계(ecosystem)가 있으면 끄고, 그때까지 붙들어 두어 다시 읽지 않게 한다
+_RELEASE_TEXT = True
+
+
+def set_time_budgets(layer_timeout=None, skill_timeout=None):
+    """이 프로세스의 레이어/스킬 시간 예산 설정 (프로세스 풀 워커에는 initializer로 전달)."""
+    global _BUDGETS
+    _BUDGETS = (layer_timeout, skill_timeout)
+
+
+def set_release_text(release: bool):
+    """평가가 끝난 스킬의 문서/코퍼스 해제 여부 설정 (프로세스 풀 워커에는 initializer로 전달)."""
+    global _RELEASE_TEXT
+    _RELEASE_TEXT = release
+
+
+def _init_worker(max_file_size: int, analysis_cache_path, shared=None, budgets=(None, None), release_text=True):
+    """프로세스 풀 워커 초기화 — 파일 크기 제한, (워커별 연결의) 분석 캐시, 공유 컨텍스트, 시간 예산,
+    텍스트 해제 여부."""
+    global _SHARED
+    set_max_file_size(max_file_size)
+    FEATURES.attach(AnalysisCache(analysis_cache_path) if analysis_cache_path else None)
+    _SHARED = shared
+    set_time_budgets(*budgets)
+    set_release_text(release_text)
+
+
+def _make_executor(workers: int, shared=None):
+    """워커 풀 생성. 환경 제약으로 만들 수 없으면 None (순차 실행으로 복구)."""
+    store = FEATURES.store
+    try:
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(get_max_file_size(), store.path if store is not None else None, shared, _BUDGETS, _RELEASE_TEXT),
+        )
+    except (PermissionError, OSError):
+        # 일부 샌드박스/환경에서 프로세스 풀이 제한될 수 있으므로 순차 실행으로 복구.
+        return None
+
+
+def _run_layer(lid, skill, all_skills, benchmarks_dir, timeout):
+    """레이어 하나를 평가해 (결과, CPU 초) 반환. CPU 시간은 스레드 기준(thread_time).
+
+    timeout(초)이 있으면 데몬 스레드에서 실행하고 그 안에 끝나지 않으면
+    LayerTimeoutError. 파이썬 스레드는 중단할 수 없으므로 멈춘 스레드는 버린다
+    (데몬이라 프로세스 종료를 막지 않는다). 버린 스레드는 계속 돌며 같은 skill 객체
+    (지연 로드 필드, 코퍼스)를 바꿀 수 있으므로, 호출한 쪽은 그 스킬의 코퍼스를
+    해제하지 않고 이후 결과를 result_cache에 쓰지 않는다.
+    """
+    def _call():
+        cpu_start = time.thread_time()
+        result = LAYERS[lid](skill, all_skills=all_skills, benchmarks_dir=benchmarks_dir)
+        return result, time.thread_time() - cpu_start
+
+    if timeout is None:
+        return _call()
+    outcome = {}
+
+    def _target():
+        try:
+            outcome["value"] = _call()
+        except BaseException as exc:  # noqa: BLE001 — 호출한 스레드에서 다시 올린다
+            outcome["error"] = exc
+
+    runner = threading.Thread(target=_target, name=f"layer-{lid}", daemon=True)
+    runner.start()
+    runner.join(timeout)
+    if runner.is_alive():
+        raise LayerTimeoutError(f"{lid} did not finish within {timeout:.3g}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+
 def _evaluate_one_skill(task):
-    """단일 스킬의 모든 레이어를 평가."""
-    skill, layer_ids, all_skills, benchmarks_dir, fail_fast = task
+    """단일 스킬의 지정 레이어들을 평가하고 (이름, 결과, 레이어별 소요 초, 레이어별 CPU 초) 반환.
+
+    task의 skill_budget은 부모가 넘긴 이 스킬의 남은 예산(초, None이면 제한 없음)이다.
+    레이어마다 _BUDGETS의 레이어 예산과 남은 스킬 예산 중 작은 쪽을 적용하고,
+    넘기면 timeout 결과로 바꾼 뒤 다음 레이어로 넘어간다.
+    """
+    skill, layer_ids, all_skills, benchmarks_dir, fail_fast, skill_budget = task
+    layer_timeout = _BUDGETS[0]
+    deadline = None if skill_budget is None else time.perf_counter() + skill_budget
+    timed_out = False
     layer_results = {}
+    durations = {}
+    cpu_times = {}
     for lid in layer_ids:
+        start = time.perf_counter()
+        timeout = layer_timeout
+        if deadline is not None:
+            remaining = deadline - start
+            timeout = remaining if timeout is None else min(timeout, remaining)
         try:
-            layer_results[lid] = LAYERS[lid](
-                skill,
-                all_skills=all_skills,
-                benchmarks_dir=benchmarks_dir,
-            )
+            if timeout is not None and timeout <= 0:
+                raise LayerTimeoutError(f"skill budget of {_BUDGETS[1]:.3g}s exhausted before {lid}")
+            layer_results[lid], cpu_times[lid] = _run_layer(lid, skill, all_skills, benchmarks_dir, timeout)
         except Exception as exc:  # noqa: BLE001
+            timed_out = timed_out or isinstance(exc, LayerTimeoutError)
             if fail_fast:
                 raise LayerEvaluationError(skill.name, lid, exc) from exc
             print(
@@ -68,25 +188,273 @@ def _evaluate_one_skill(task):
                 file=sys.stderr,
             )
             layer_results[lid] = _error_layer_result(lid, skill.name, exc)
-    return skill.name, layer_results
+        durations[lid] = time.perf_counter() - start
+    # L5/L6이 끝나면 코퍼스가 붙든 디코드 텍스트와 AST 특징을 버린다 (_RELEASE_TEXT가 꺼져 있으면
+    # ecosystem이 쓰도록 둔다). 같은 스킬의 CPU 레이어가 다른 스레드에서 코퍼스를 쓰는 중일 수
+    # 있으므로 I/O 레이어만 돈 작업과, 시간 초과로 버린 스레드가 남은 작업은 건드리지 않는다
+    ran_cpu = any(LAYER_RESOURCES.get(lid) != RESOURCE_IO for lid in layer_ids)
+    if _RELEASE_TEXT and ran_cpu and not timed_out and skill.corpus is not None:
+        skill.corpus.release()
+    # 워커 프로세스는 종료 훅이 없으므로 스킬마다 새 분석 결과를 디스크 캐시에 쓴다
+    FEATURES.flush()
+    return skill.name, layer_results, durations, cpu_times
+
+
+def _release_skill(skill):
+    """스킬 단위 레이어가 모두 끝난 스킬의 SKILL.md 문서와 스크립트 코퍼스를 놓는다.
+
+    L2와 ecosystem이 보는 이름/트리거/인벤토리/플래그는 남는다. _RELEASE_TEXT가 꺼져 있으면
+    (ecosystem의 pipeline_targets, cli_consistency가 텍스트를 다시 볼 때) 아무것도 놓지 않는다.
+    """
+    if not _RELEASE_TEXT:
+        return
+    skill.document = None
+    skill.corpus = None
+
 
+def _evaluate_shared(task):
+    """2단계 작업 (스킬 인덱스, 레이어 목록, 남은 스킬 예산)을 워커의 공유 컨텍스트로 평가."""
+    index, layer_ids, skill_budget = task
+    skills, all_skills, benchmarks_dir, fail_fast = _SHARED
+    return _evaluate_one_skill((skills[index], layer_ids, all_skills, benchmarks_dir, fail_fast, skill_budget))
 
-def _collect_results_sequential(skills, layer_ids, all_skills, benchmarks_dir, fail_fast):
-    """순차 실행으로 결과 수집."""
+
+def _merge_layer_results(skills, layer_ids, *partials):
+    """단계별 결과를 스킬 discovery 순서 + layer_ids 순서로 병합."""
     results = {}
     for skill in skills:
-        name, layer_results = _evaluate_one_skill((skill, layer_ids, all_skills, benchmarks_dir, fail_fast))
-        results[name] = layer_results
+        merged = {}
+        for partial in partials:
+            merged.update(partial.get(skill.name, {}))
+        results[skill.name] = {lid: merged[lid] for lid in layer_ids if lid in merged}
     return results
 
 
-def _collect_results_parallel(tasks, workers):
-    """병렬 실행으로 결과 수집."""
-    results = {}
-    with ProcessPoolExecutor(max_workers=workers) as ex:
-        for name, layer_results in ex.map(_evaluate_one_skill, tasks):
-            results[name] = layer_results
-    return results
+def _lookup_cached(result_cache, skill, layer_ids, benchmarks_dir, cached, context=""):
+    """result_cache에 있는 레이어 결과는 cached에 담고, 평가할 레이어 목록을 반환."""
+    if result_cache is None:
+        return layer_ids
+    todo = []
+    for lid in layer_ids:
+        hit = result_cache.lookup(skill, lid, benchmarks_dir, context)
+        if hit is None:
+            todo.append(lid)
+        else:
+            cached.setdefault(skill.name, {})[lid] = hit
+    return todo
+
+
+def _collect_results_streaming(skill_iter, layer_ids, benchmarks_dir, fail_fast, workers, result_cache=None,
+                               all_skills=None, cost_model=None, io_threads=1, sink=None):
+    """discovery와 평가를 겹쳐 실행하고 (skills, results) 반환.
+
+    1단계: skill_iter가 스킬을 내놓는 즉시 스킬 단위 레이어를 평가. workers나
+    io_threads가 1보다 크면 스킬을 몇 배수씩 모아 scheduler.plan_units로
+    (스킬, 레이어) 단위로 나누고 예상 비용이 큰 것부터 제출한 뒤 as_completed로
+    모은다 (예측과 측정은 cost_model). io_threads가 1보다 크면 각 단위의 RESOURCE_IO
+    레이어는 이 프로세스의 스레드 풀(io_threads개), 나머지는 프로세스 풀(workers개)에서
+    동시에 실행하고, 아니면 (기본) 모든 레이어를 프로세스 풀에서 실행한다.
+    2단계: discovery가 끝난 뒤 전체 스킬 목록이 필요한
+    CROSS_SKILL_LAYERS를 평가한다. 결과 순서는 discovery 순서를 따른다.
+    result_cache가 있으면 캐시된 (스킬, 레이어)는 평가하지 않고, 새 결과를 저장한다.
+    fail_fast면 첫 실패에서 대기 중인 작업을 취소하고 바로 LayerEvaluationError를 올린다.
+    sink(skill_name, {layer_id: LayerResult})가 있으면 결과를 보관하지 않고 (캐시 적중
+    포함) 끝나는 대로 넘기며, 반환하는 results에는 레이어가 없다.
+    all_skills는 교차 스킬 레이어가 비교할 전체 목록 (기본: 평가하는 스킬들이며,
+    일부만 평가할 때는 2단계 시작 전까지 채워지는 리스트를 넘긴다).
+    """
+    per_skill_layers = [lid for lid in layer_ids if lid not in CROSS_SKILL_LAYERS]
+    deferred_layers = [lid for lid in layer_ids if lid in CROSS_SKILL_LAYERS]
+
+    cost_model = cost_model or CostModel()
+    slots = max(workers, io_threads)
+    executor = _make_executor(workers) if workers > 1 else None
+    threads = ThreadPoolExecutor(max_workers=io_threads, thread_name_prefix="io-layer") if io_threads > 1 else None
+
+    skills = []
+    cached = {}
+    first_phase = {}
+    second_phase = {}
+    futures = set()
+    window = []
+    # --skill-timeout: 스킬 하나에 예산 하나 — 끝난 작업의 소요 시간을 빼서 다음 작업에 남은 몫만 준다
+    # (같은 스킬의 작업이 동시에 제출되면 각각 그 시점의 남은 몫을 받는다)
+    skill_timeout = _BUDGETS[1]
+    spent = {}
+    # 시간 초과 레이어가 나온 스킬 — 버린 스레드가 스킬 상태를 바꿀 수 있어 이후 결과를 캐시에 쓰지 않는다
+    timed_out = set()
+    # 작업이 남은 스킬만: 이름 → [스킬, 끝나지 않은 작업 수]. 0이 되면 항목을 지우고, 1단계면
+    # _release_skill. 스킬별 소요 시간(spent)과 시간 초과 표시도 그 스킬의 마지막 단계가
+    # 끝나면 지워 스트리밍 중 상태가 스킬 수에 비례하지 않게 한다
+    pending = {}
+
+    def _budget(name):
+        return None if skill_timeout is None else skill_timeout - spent.get(name, 0.0)
+
+    def _record(into, name, layer_results, durations, cpu_times):
+        cost_model.record(name, durations, cpu_times)
+        spent[name] = spent.get(name, 0.0) + sum(durations.values())
+        if any(_is_timeout(lr) for lr in layer_results.values()):
+            timed_out.add(name)
+        entry = pending[name]
+        if result_cache is not None and name not in timed_out:
+            for lid, layer_result in layer_results.items():
+                result_cache.store(entry[0], lid, layer_result)
+        entry[1] -= 1
+        if not entry[1]:
+            del pending[name]
+            if into is first_phase:
+                _release_skill(entry[0])
+            if into is second_phase or not deferred_layers:
+                spent.pop(name, None)
+                timed_out.discard(name)
+        if sink is not None:
+            sink(name, layer_results)
+        else:
+            into.setdefault(name, {}).update(layer_results)
+
+    def _lookup(skill, lids, context=""):
+        todo = _lookup_cached(result_cache, skill, lids, benchmarks_dir, cached, context)
+        if sink is not None and skill.name in cached:
+            sink(skill.name, cached.pop(skill.name))
+        return todo
+
+    def _track(skill):
+        pending.setdefault(skill.name, [skill, 0])[1] += 1
+
+    def _task(skill, lids):
+        _track(skill)
+        return skill, lids, None, benchmarks_dir, fail_fast, _budget(skill.name)
+
+    def _submit_cpu(skill, todo):
+        nonlocal executor
+        task = _task(skill, todo)
+        if executor is not None:
+            try:
+                futures.add(executor.submit(_evaluate_one_skill, task))
+                return
+            except (PermissionError, OSError):
+                executor.shutdown(wait=True)
+                executor = None
+        _record(first_phase, *_evaluate_one_skill(task))
+
+    def _submit_window():
+        units = plan_units(window, slots, cost_model)
+        window.clear()
+        io_units = {}
+        for skill, todo in units:
+            if threads is None:
+                _submit_cpu(skill, todo)
+                continue
+            io_layers = [lid for lid in todo if LAYER_RESOURCES.get(lid) == RESOURCE_IO]
+            cpu_layers = [lid for lid in todo if lid not in io_layers]
+            if cpu_layers:
+                _submit_cpu(skill, cpu_layers)
+            if io_layers:
+                # 레이어별로 나뉜 스킬도 I/O 레이어는 한 스레드 작업으로 모아 코퍼스 로드를 겹치지 않게
+                io_units.setdefault(id(skill), (skill, []))[1].extend(io_layers)
+        for skill, io_layers in io_units.values():
+            futures.add(threads.submit(_evaluate_one_skill, _task(skill, io_layers)))
+
+    def _collect_done():
+        # discovery 중에도 끝난 작업을 거둔다 — --fail-fast 실패를 제출이 끝나기 전에 올린다
+        done = [fut for fut in futures if fut.done()]
+        futures.difference_update(done)
+        for fut in done:
+            _record(first_phase, *fut.result())
+
+    try:
+        for skill in skill_iter:
+            skills.append(skill)
+            todo = _lookup(skill, per_skill_layers)
+            if not todo:
+                _release_skill(skill)
+                continue
+            if executor is None and threads is None:
+                _record(first_phase, *_evaluate_one_skill(_task(skill, todo)))
+                continue
+            if threads is not None:
+                # 지연 로드 필드는 스레드와 프로세스 풀 피클링이 동시에 건드리기 전에 여기서 채운다
+                getattr(skill, "has_scripts_dir")
+                get_inventory(skill)
+            window.append((skill, todo))
+            if len(window) >= slots * 4:
+                _submit_window()
+                _collect_done()
+        if window:
+            _submit_window()
+
+        for fut in as_completed(futures):
+            _record(first_phase, *fut.result())
+        if threads is not None:
+            threads.shutdown(wait=True)
+            threads = None
+
+        if deferred_layers and skills:
+            peers = skills if all_skills is None else all_skills
+            context = cross_skill_context(peers) if result_cache is not None else ""
+            tasks = []
+            for i, skill in enumerate(skills):
+                todo = _lookup(skill, deferred_layers, context)
+                if todo:
+                    _track(skill)
+                    tasks.append((i, todo, _budget(skill.name)))
+            if executor is not None and len(tasks) > 1:
+                # 작업마다 전체 스킬 목록을 피클링하면 O(N²)이므로, 새 풀의 initializer로
+                # 워커당 한 번만 보내고 (fork면 복사도 없음) 작업에는 인덱스만 담는다
+                executor.shutdown(wait=True)
+                executor = _make_executor(workers, shared=(skills, peers, benchmarks_dir, fail_fast))
+            if executor is not None and len(tasks) > 1:
+                chunksize = max(1, len(tasks) // (workers * 4))
+                for outcome in executor.map(_evaluate_shared, tasks, chunksize=chunksize):
+                    _record(second_phase, *outcome)
+            else:
+                for i, todo, budget in tasks:
+                    task = (skills[i], todo, peers, benchmarks_dir, fail_fast, budget)
+                    _record(second_phase, *_evaluate_one_skill(task))
+    except BaseException:
+        # --fail-fast(또는 중단): 대기 중인 작업은 취소하고 풀이 비기를 기다리지 않는다.
+        # 실행 중인 작업은 시간 예산 안에 끝난다
+        for pool in (threads, executor):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        threads = executor = None
+        raise
+    finally:
+        if threads is not None:
+            threads.shutdown(wait=True)
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    return skills, _merge_layer_results(skills, layer_ids, cached, first_phase, second_phase)
+
+
+def _complete_from_snapshot(change_set, snapshot, selected, evaluated, results, reused, layer_ids,
+                            benchmarks_dir, fail_fast, workers, result_cache, sink=None):
+    """--changed-since: 바뀌지 않은 스킬은 스냅샷 점수로 채우고, 바뀐 스킬과 키워드가
+    겹쳐 교차 스킬 레이어(L2 trigger_overlap)가 무효화된 스킬은 그 레이어만 다시 평가.
+    sink가 있으면 채운 스킬들을 (다시 평가한 레이어 포함) sink로 넘긴다."""
+    deferred = [lid for lid in layer_ids if lid in CROSS_SKILL_LAYERS]
+    partners = []
+    if deferred:
+        partners = change_set.overlap_partners(evaluated, [s for s in selected if s.name in reused])
+    if partners:
+        _, partner_results = _collect_results_streaming(
+            iter(partners), deferred, benchmarks_dir, fail_fast, workers, result_cache, all_skills=selected
+        )
+        for name, layer_results in partner_results.items():
+            reused[name].update(layer_results)
+    print(
+        f"[INFO] --changed-since {change_set.ref}: evaluated {len(evaluated)} skill(s), "
+        f"re-evaluated {','.join(deferred) or '-'} for {len(partners)} overlap partner(s), "
+        f"reused {len(reused)} from snapshot {snapshot.get('timestamp', '?')}",
+        file=sys.stderr,
+    )
+    if sink is not None:
+        for skill in selected:
+            if skill.name in reused:
+                sink(skill.name, reused[skill.name])
+    return {s.name: reused[s.name] if s.name in reused else results[s.name] for s in selected}
 
 
 def run(args) -> int:
@@ -102,7 +470,9 @@ def run(args) -> int:
     config_root = config.skills_root
     raw = args.skills_root or (Path(env_root) if env_root else None) or (Path(config_root) if config_root else None)
     skills_root = raw
-    if not skills_root or not skills_root.is_dir():
+    rev = args.rev
+    # --rev는 작업 트리에 없는 (과거 리비전에만 있는) skills_root도 허용
+    if not skills_root or not (rev or skills_root.is_dir() or (skills_root.is_file() and is_archive(skills_root))):
         print("Error: --skills-root required (or set in config.json / SKILLS_ROOT env)", file=sys.stderr)
         return 1
 
@@ -120,43 +490,176 @@ def run(args) -> int:
     if missing_weights:
         print(f"[ERROR] Missing layer weights for selected layers: {', '.join(missing_weights)}", file=sys.stderr)
         return 1
-    if args.workers < 1:
-        print("--workers must be >= 1", file=sys.stderr)
+    if args.workers != "auto" and args.workers < 1:
+        print("--workers must be >= 1 or 'auto'", file=sys.stderr)
         return 1
-
-    skills = discover_skills(skills_root)
-    if not skills:
-        print(f"No skills found in {skills_root}", file=sys.stderr)
+    if args.io_workers is not None and args.io_workers < 1:
+        print("--io-workers must be >= 1", file=sys.stderr)
         return 1
+    if args.discovery_workers < 1:
+        print("--discovery-workers must be >= 1", file=sys.stderr)
+        return 1
+    if args.max_file_size < 0:
+        print("--max-file-size must be >= 0", file=sys.stderr)
+        return 1
+    set_max_file_size(args.max_file_size * 1024 * 1024)
+    for option, value in (("--layer-timeout", args.layer_timeout), ("--skill-timeout", args.skill_timeout)):
+        if value is not None and value <= 0:
+            print(f"{option} must be > 0", file=sys.stderr)
+            return 1
+    set_time_budgets(args.layer_timeout, args.skill_timeout)
+    result_cache = None
+    if args.result_cache:
+        result_cache = ResultCache.load(args.result_cache, settings={
+            "max_file_size": get_max_file_size(),
+            "section_taxonomy": config.section_taxonomy,
+        })
+    FEATURES.attach(AnalysisCache(args.analysis_cache) if args.analysis_cache else None)
+    cost_model = CostModel.load(args.layer_timings) if args.layer_timings else CostModel()
+    # --workers는 프로세스 수만 정한다. I/O 스레드 풀은 --io-workers(또는 auto)로 따로 켠다
+    if args.workers == "auto":
+        workers, io_threads = auto_workers(cost_model.io_wait)
+        io_threads = args.io_workers or io_threads
+        print(
+            f"[INFO] --workers auto: {workers} process(es), {io_threads} I/O thread(s) "
+            f"(I/O wait {cost_model.io_wait:.2f})",
+            file=sys.stderr,
+        )
+    else:
+        workers, io_threads = args.workers, args.io_workers or 1
 
-    if args.skill:
-        skills = [s for s in skills if s.name == args.skill]
-        if not skills:
-            print(f"Skill '{args.skill}' not found", file=sys.stderr)
+    source = None
+    if rev:
+        try:
+            source = GitSource.open(skills_root, rev)
+        except ValueError as e:
+            print(f"[ERROR] Cannot read revision {rev!r}: {e}", file=sys.stderr)
             return 1
 
+    # --skill이면 frontmatter만 읽어 이름을 고르고, 선택된 스킬만 평가 중에 전체 로드
+    metadata_only = args.skill is not None
+    # 인덱스는 작업 트리 경로 기준이므로 과거 리비전 평가에는 쓰지 않는다
+    # (frontmatter만 읽을 때는 fingerprint 계산이 오히려 비싸므로 쓰지 않음)
+    use_index = args.discovery_index and source is None and not metadata_only
+    index = DiscoveryIndex.load(args.discovery_index) if use_index else None
     benchmarks_dir = args.benchmarks or Path(__file__).parent.parent / "benchmarks"
     fail_fast = args.fail_fast
 
+    taxonomy = SectionTaxonomy(config.section_taxonomy)
+    change_set = None
+    snapshot = None
+    if args.changed_since:
+        if rev:
+            print("--changed-since cannot be combined with --rev", file=sys.stderr)
+            return 1
+        try:
+            change_set = ChangeSet.from_git(
+                skills_root, args.changed_since, benchmarks_dir, args.max_depth, args.ignore, taxonomy
+            )
+        except ValueError as e:
+            print(f"[ERROR] Cannot diff against {args.changed_since!r}: {e}", file=sys.stderr)
+            return 1
+        # 스냅샷 점수는 그 스냅샷을 만든 커밋 대비 diff일 때만 "바뀌지 않은 스킬"의 점수다
+        snapshot = latest_compatible(source_commit=change_set.commit)
+        if snapshot is None:
+            print(f"[WARN] --changed-since: no history snapshot of commit {change_set.commit[:12]} for the "
+                  "current evaluator version; evaluating all skills", file=sys.stderr)
+            change_set = None
+        elif change_set.full:
+            print("[WARN] --changed-since: .skillignore or benchmark files changed in a way that affects "
+                  "every skill; evaluating all skills", file=sys.stderr)
+            change_set = None
+
+    discovered = []
+    selected = []
+    reused = {}
+
+    def _selected_skills():
+        for skill in iter_skills(
+            skills_root,
+            workers=args.discovery_workers,
+            index=index,
+            max_depth=args.max_depth,
+            ignore_patterns=args.ignore,
+            source=source,
+            metadata_only=metadata_only,
+            taxonomy=taxonomy,
+        ):
+            discovered.append(skill)
+            if args.skill is None or skill.name == args.skill:
+                selected.append(skill)
+                if change_set is not None and not change_set.is_changed(skill):
+                    previous = snapshot_layer_results(snapshot, skill.name, layer_ids)
+                    if previous is not None:
+                        reused[skill.name] = previous
+                        _release_skill(skill)
+                        continue
+                yield skill
+
+    # --format jsonl: 스킬 결과를 끝나는 대로 출력하고 점수만 보관한다 (--diff면 리포트 없음)
+    writer = None
+    if args.format == "jsonl" and args.diff is None:
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+        writer = JsonlWriter(
+            args.output.open("w", encoding="utf-8") if args.output else sys.stdout,
+            layer_ids,
+            layer_weights=config.layer_weights,
+            keep_scores=args.save_history,
+        )
+    sink = writer.write_layers if writer is not None else None
+    # --ecosystem이 스킬 텍스트를 다시 보므로 그때까지 문서/코퍼스를 붙들어 둔다. jsonl 스트리밍은
+    # 메모리를 스킬 수에 비례시키지 않는 쪽을 택해 놓고, ecosystem에서 다시 읽는다
+    set_release_text(not args.ecosystem or writer is not None)
+
     try:
-        if args.workers == 1 or len(skills) <= 1:
-            results = _collect_results_sequential(
-                skills, layer_ids, skills, benchmarks_dir, fail_fast
+        skills, results = _collect_results_streaming(
+            _selected_skills(), layer_ids, benchmarks_dir, fail_fast, workers, result_cache,
+            all_skills=selected, cost_model=cost_model, io_threads=io_threads, sink=sink,
+        )
+        if change_set is not None:
+            results = _complete_from_snapshot(
+                change_set, snapshot, selected, skills, results, reused, layer_ids,
+                benchmarks_dir, fail_fast, workers, result_cache, sink=sink,
             )
-        else:
-            tasks = [(skill, layer_ids, skills, benchmarks_dir, fail_fast) for skill in skills]
-            try:
-                results = _collect_results_parallel(tasks, args.workers)
-            except (PermissionError, OSError):
-                # 일부 샌드박스/환경에서 프로세스 풀이 제한될 수 있으므로 순차 실행으로 복구.
-                results = _collect_results_sequential(
-                    skills, layer_ids, skills, benchmarks_dir, fail_fast
-                )
+            skills = selected
     except LayerEvaluationError as e:
         print(f"[ERROR] {e}", file=sys.stderr)
+        if writer is not None:
+            writer.close()
         return 1
+    finally:
+        FEATURES.flush()
+        if source is not None:
+            source.close()
 
-    ecosystem_result = evaluate_ecosystem(skills) if args.ecosystem else None
+    if index is not None:
+        index.save()
+    if result_cache is not None:
+        result_cache.save()
+    cost_model.save()
+    if not discovered:
+        print(f"No skills found in {skills_root}", file=sys.stderr)
+        return 1
+    if not skills:
+        print(f"Skill '{args.skill}' not found", file=sys.stderr)
+        return 1
+    ecosystem_result = None
+    if args.ecosystem:
+        # pipeline_targets는 ecosystem만 본다 (jsonl 스트리밍이 놓은 SKILL.md는 다시 읽는다)
+        resolve_pipeline_targets(skills, discovered)
+        ecosystem_result = evaluate_ecosystem(skills)
+    FEATURES.attach(None)  # 분석 캐시 flush + 닫기
+    if writer is not None:
+        writer.finish(ecosystem_result)
+        writer.close()
+        if args.output:
+            print(f"Saved to {args.output}")
+        # 가중 점수만 남겼다 — 레이어별 점수는 히스토리 스냅샷이 필요할 때만 보관했다
+        results = None
+        if args.save_history:
+            scores = writer.score_results()
+            results = {s.name: scores[s.name] for s in skills}
 
     if args.diff is not None:
         history = load_history()
@@ -184,10 +687,11 @@ def run(args) -> int:
             results,
             ecosystem_result,
             layer_weights=config.layer_weights,
+            source_commit=source.rev if source is not None else worktree_commit(skills_root, benchmarks_dir),
         )
         print(f"History saved to {fp}", file=sys.stderr)
 
-    if args.diff is None:
+    if args.diff is None and writer is None:
         formatters = {"text": format_text, "json": format_json, "markdown": format_markdown}
         output = formatters[args.format](
             results,
@@ -202,11 +706,14 @@ def run(args) -> int:
             print(output)
 
     if args.ci_mode:
-        failed = []
-        for skill_name, layer_results in results.items():
-            w = weighted_score(layer_results, layer_weights=config.layer_weights)
-            if w < threshold:
-                failed.append((skill_name, w))
+        if writer is not None:
+            scores = ((s.name, writer.weighted[s.name]) for s in skills)
+        else:
+            scores = (
+                (name, weighted_score(layer_results, layer_weights=config.layer_weights))
+                for name, layer_results in results.items()
+            )
+        failed = [(skill_name, w) for skill_name, w in scores if w < threshold]
         if failed:
             print(f"\nCI FAILED: {len(failed)} skill(s) below {threshold}:", file=sys.stderr)
             for name, score in failed:
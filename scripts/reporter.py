@@ -1,11 +1,15 @@
-"""평가 결과 출력 — Text, JSON, Markdown."""
+"""평가 결과 출력 — Text, JSON, Markdown, JSONL(스트리밍)."""
 
 import json
+import sys
 from datetime import datetime
 
 from models import LayerResult, EcosystemResult
 from eval_config import DEFAULT_LAYER_WEIGHTS
-from score_utils import weighted_score, summarize_results
+from score_utils import is_error_result, summarize_scores, weighted_score, summarize_results
+
+# 메트릭 없는 레이어 결과 — --changed-since가 history 스냅샷에서 가져온 점수 (상세/권고 없음)
+_SCORE_ONLY_NOTE = " (score only, reused from history snapshot)"
 
 
 def _ecosystem_text(eco: EcosystemResult) -> str:
@@ -26,6 +30,30 @@ def _ecosystem_text(eco: EcosystemResult) -> str:
     return "\n".join(lines)
 
 
+def _layer_dict(lr: LayerResult) -> dict:
+    return {
+        "score": round(lr.overall_score, 1),
+        "metrics": [
+            {"name": m.name, "score": m.score, "max_score": m.max_score,
+             "passed": m.passed, "details": m.details}
+            for m in lr.metrics
+        ],
+        "recommendations": lr.recommendations,
+    }
+
+
+def _ecosystem_dict(eco: EcosystemResult) -> dict:
+    return {
+        "overall_score": round(eco.overall_score, 1),
+        "metrics": [
+            {"name": m.name, "score": m.score, "max_score": m.max_score,
+             "details": m.details, "affected_skills": m.affected_skills}
+            for m in eco.metrics
+        ],
+        "recommendations": eco.recommendations,
+    }
+
+
 def format_text(results: dict, ecosystem_result=None, layer_weights: dict = None) -> str:
     """Text 출력. results: {skill_name: {layer_id: LayerResult}}"""
     layers_used = sorted({lid for lrs in results.values() for lid in lrs})
@@ -39,7 +67,7 @@ def format_text(results: dict, ecosystem_result=None, layer_weights: dict = None
             lr = layer_results.get(lid)
             if not lr:
                 continue
-            lines.append(f"  {lid}: {lr.overall_score:.1f}/100")
+            lines.append(f"  {lid}: {lr.overall_score:.1f}/100{_SCORE_ONLY_NOTE if not lr.metrics else ''}")
             for m in lr.metrics:
                 status = "PASS" if m.passed else "FAIL"
                 lines.append(f"    {m.name}: {m.score:.0f}/{m.max_score:.0f} [{status}] - {m.details}")
@@ -71,36 +99,89 @@ def format_json(results: dict, ecosystem_result=None, layer_weights: dict = None
     output = {"timestamp": datetime.now().isoformat(), "skills": [], "summary": {}}
 
     for skill_name, layer_results in results.items():
-        skill_data = {"name": skill_name, "layers": {}}
-        for lid, lr in layer_results.items():
-            skill_data["layers"][lid] = {
-                "score": round(lr.overall_score, 1),
-                "metrics": [
-                    {"name": m.name, "score": m.score, "max_score": m.max_score,
-                     "passed": m.passed, "details": m.details}
-                    for m in lr.metrics
-                ],
-                "recommendations": lr.recommendations,
-            }
+        skill_data = {"name": skill_name, "layers": {lid: _layer_dict(lr) for lid, lr in layer_results.items()}}
         skill_data["weighted_score"] = round(weighted_score(layer_results, layer_weights=weights), 1)
         output["skills"].append(skill_data)
 
     output["summary"] = summarize_results(results, layer_weights=weights)
 
     if ecosystem_result:
-        output["ecosystem"] = {
-            "overall_score": round(ecosystem_result.overall_score, 1),
-            "metrics": [
-                {"name": m.name, "score": m.score, "max_score": m.max_score,
-                 "details": m.details, "affected_skills": m.affected_skills}
-                for m in ecosystem_result.metrics
-            ],
-            "recommendations": ecosystem_result.recommendations,
-        }
+        output["ecosystem"] = _ecosystem_dict(ecosystem_result)
 
     return json.dumps(output, ensure_ascii=False, indent=2)
 
 
+class JsonlWriter:
+    """--format jsonl: 레이어 결과를 끝나는 대로 한 줄씩 쓰고 flush.
+
+    레코드 (한 줄에 JSON 하나, "type"으로 구분):
+      skill     {"name", "layers"} — 평가 단위가 끝날 때마다. 한 스킬이 여러 줄로 나뉠 수
+                있고, 모든 레이어가 모인 마지막 줄에 "weighted_score"가 붙는다
+      ecosystem format_json의 "ecosystem"과 같은 내용
+      summary   format_json의 "summary" + "timestamp" (항상 마지막 줄)
+    쓴 뒤에는 스킬별 가중 점수(weighted)만 남긴다 — 레이어 점수는 레이어가 다 모일
+    때까지만 들고 있다. keep_scores면 히스토리 스냅샷용으로 레이어별 점수도 남기고
+    score_results()로 점수만 담은 LayerResult를 만든다.
+    """
+
+    def __init__(self, stream, layer_ids, layer_weights: dict = None, keep_scores: bool = False):
+        self.stream = stream
+        self.layer_ids = list(layer_ids)
+        self.layer_weights = layer_weights or DEFAULT_LAYER_WEIGHTS
+        self.weighted = {}
+        self.scores = {} if keep_scores else None
+        self.error_count = 0
+        self._partial = {}
+        self._timestamp = datetime.now().isoformat()
+
+    def _write(self, record: dict):
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def write_layers(self, skill_name: str, layer_results: dict):
+        """한 스킬의 (일부) 레이어 결과 기록."""
+        partial = self._partial.setdefault(skill_name, {})
+        record = {"type": "skill", "name": skill_name, "layers": {}}
+        for lid, lr in layer_results.items():
+            record["layers"][lid] = _layer_dict(lr)
+            partial[lid] = LayerResult(layer=lid, skill_name=skill_name, overall_score=lr.overall_score)
+            self.error_count += is_error_result(lr)
+        if all(lid in partial for lid in self.layer_ids):
+            record["weighted_score"] = round(self._complete(skill_name), 1)
+        self._write(record)
+
+    def _complete(self, skill_name: str) -> float:
+        """레이어가 모인 스킬의 가중 점수를 남기고 레이어 점수는 (keep_scores가 아니면) 버린다."""
+        partial = self._partial.pop(skill_name)
+        w = self.weighted[skill_name] = weighted_score(partial, layer_weights=self.layer_weights)
+        if self.scores is not None:
+            self.scores[skill_name] = {lid: lr.overall_score for lid, lr in partial.items()}
+        return w
+
+    def score_results(self) -> dict:
+        """{스킬: {레이어: 점수만 담은 LayerResult}} (keep_scores일 때만)."""
+        if self.scores is None:
+            raise ValueError("JsonlWriter was created without keep_scores")
+        return {
+            name: {lid: LayerResult(layer=lid, skill_name=name, overall_score=score) for lid, score in scores.items()}
+            for name, scores in self.scores.items()
+        }
+
+    def finish(self, ecosystem_result=None):
+        """ecosystem과 summary 레코드로 마무리."""
+        for name in list(self._partial):
+            self._complete(name)
+        if ecosystem_result:
+            self._write({"type": "ecosystem", **_ecosystem_dict(ecosystem_result)})
+        summary = summarize_scores(list(self.weighted.values()), self.error_count, layer_weights=self.layer_weights)
+        self._write({"type": "summary", "timestamp": self._timestamp, **summary})
+
+    def close(self):
+        """파일로 쓰는 중이면 닫는다 (표준 출력은 그대로)."""
+        if self.stream is not sys.stdout:
+            self.stream.close()
+
+
 def format_markdown(results: dict, ecosystem_result=None, layer_weights: dict = None) -> str:
     """Markdown 리포트."""
     weights = layer_weights or DEFAULT_LAYER_WEIGHTS
@@ -145,7 +226,7 @@ def format_markdown(results: dict, ecosystem_result=None, layer_weights: dict =
             lr = layer_results.get(lid)
             if not lr:
                 continue
-            lines.append(f"**{lid}**: {lr.overall_score:.1f}/100")
+            lines.append(f"**{lid}**: {lr.overall_score:.1f}/100{_SCORE_ONLY_NOTE if not lr.metrics else ''}")
             lines.append("")
             for m in lr.metrics:
                 icon = "+" if m.passed else "-"
@@ -0,0 +1,199 @@
+"""Result Cache — (스킬 내용, 레이어, evaluator 버전, 벤치마크, 교차 스킬 입력) → LayerResult 디스크 캐시."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from evaluators import l2_activation, l5_execution
+from evaluators.base import get_inventory
+from file_access import exceeds_cap
+from history import _compute_evaluator_version
+from models import ERROR_METRICS, LayerResult, MetricResult, SkillMetadata
+
+
+DEFAULT_RESULT_CACHE_PATH = Path(__file__).parent.parent / "reports" / "result_cache.json"
+CACHE_FORMAT_VERSION = 1
+# 이 수를 넘으면 이번 실행에서 쓰지 않은 항목 중 오래된 것부터 지운다
+DEFAULT_MAX_ENTRIES = 50_000
+
+# 레이어 → benchmarks_dir 기준 벤치마크 파일 (스킬 이름으로 항목 조회)
+BENCHMARK_FILES = {
+    "L2": l2_activation.BENCHMARK_FILE,
+    "L5": l5_execution.BENCHMARK_FILE,
+}
+
+
+def result_to_dict(result: LayerResult) -> dict:
+    return {
+        "layer": result.layer,
+        "skill_name": result.skill_name,
+        "metrics": [[m.name, m.score, m.max_score, m.details, m.passed] for m in result.metrics],
+        "overall_score": result.overall_score,
+        "recommendations": list(result.recommendations),
+    }
+
+
+def result_from_dict(data: dict) -> LayerResult:
+    return LayerResult(
+        layer=data["layer"],
+        skill_name=data["skill_name"],
+        metrics=[MetricResult(*m) for m in data["metrics"]],
+        overall_score=data["overall_score"],
+        recommendations=list(data["recommendations"]),
+    )
+
+
+def content_fingerprint(skill: SkillMetadata) -> str:
+    """스킬 디렉토리 내용 해시 — 디렉토리명 + 인벤토리 항목 경로/종류 + 파일 내용.
+
+    mtime은 쓰지 않으므로 새로 clone한 트리에서도 같은 값이다. 크기 제한을 넘는
+    파일은 평가기가 읽지 않으므로 (file_access.exceeds_cap) 크기만 반영한다.
+    """
+    inventory = get_inventory(skill)
+    hasher = hashlib.sha256(skill.skill_path.name.encode("utf-8"))
+    for entry in inventory.entries:
+        hasher.update(f"\0{entry.rel_path}\0{entry.kind}\0".encode("utf-8"))
+        if entry.kind != "file":
+            continue
+        if exceeds_cap(entry):
+            hasher.update(f"capped:{entry.size}".encode("ascii"))
+        else:
+            hasher.update(hashlib.sha256(inventory.read_bytes(entry)).digest())
+    return hasher.hexdigest()
+
+
+def cross_skill_context(skills) -> str:
+    """교차 스킬 레이어(L2 overlap) 입력 해시 — 전체 스킬 이름 + 정규화 키워드 집합."""
+    hasher = hashlib.sha256()
+    for name, words in sorted((s.name, sorted(s.triggers.normalized)) for s in skills):
+        hasher.update(json.dumps([name, words], ensure_ascii=False).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _is_error_result(result: LayerResult) -> bool:
+    return any(m.name in ERROR_METRICS for m in result.metrics)
+
+
+class ResultCache:
+    """레이어 평가 결과 캐시. 키는 내용 주소 방식이라 경로가 달라도 재사용된다.
+
+    lookup()이 키를 계산해 두고, 미스였던 (스킬, 레이어)는 평가 후 store()로 저장한다.
+    runtime_error/timeout 결과는 일시적일 수 있으므로 저장하지 않는다. settings에는 결과에
+    영향을 주는 실행 설정(파일 크기 제한, section_taxonomy 등)을 넘긴다.
+    """
+
+    def __init__(self, path: Path, entries: dict = None, settings: dict = None,
+                 evaluator_version: str = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.evaluator_version = evaluator_version or _compute_evaluator_version()
+        self.entries = entries or {}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._base = hashlib.sha256(
+            json.dumps([self.evaluator_version, settings or {}], sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        self._fingerprints = {}
+        self._benchmarks = {}
+        self._pending = {}
+        self._used = set()
+
+    @classmethod
+    def load(cls, path: Path, settings: dict = None) -> "ResultCache":
+        """캐시 파일 로드. 없거나 형식/버전이 다르면 빈 캐시."""
+        version = _compute_evaluator_version()
+        entries = {}
+        if path.exists():
+            try:
+                raw = json.loads(path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+                raw = {}
+            if raw.get("format") == CACHE_FORMAT_VERSION and raw.get("evaluator_version") == version:
+                entries = raw.get("results", {})
+        return cls(path, entries=entries, settings=settings, evaluator_version=version)
+
+    def _fingerprint(self, skill: SkillMetadata) -> Optional[str]:
+        key = str(skill.skill_path)
+        if key not in self._fingerprints:
+            try:
+                self._fingerprints[key] = content_fingerprint(skill)
+            except OSError:
+                self._fingerprints[key] = None
+        return self._fingerprints[key]
+
+    def _benchmark_entry(self, layer_id: str, skill: SkillMetadata, benchmarks_dir: Optional[Path]) -> str:
+        """레이어가 이 스킬에 대해 읽는 벤치마크 항목 (JSON 문자열, evaluators.base.benchmark_entry와 같은 조회)."""
+        rel = BENCHMARK_FILES.get(layer_id)
+        if rel is None or not benchmarks_dir:
+            return ""
+        bench_file = Path(benchmarks_dir) / rel
+        if bench_file not in self._benchmarks:
+            try:
+                data = json.loads(bench_file.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                data = {}
+            except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+                data = None  # 평가도 실패하므로 저장되지 않지만, 정상 파일의 키와는 구분한다
+            self._benchmarks[bench_file] = data
+        data = self._benchmarks[bench_file]
+        if not isinstance(data, dict):
+            return "invalid"
+        name = skill.name if skill.name in data else skill.local_name
+        return json.dumps(data.get(name), sort_keys=True, ensure_ascii=False)
+
+    def key(self, skill: SkillMetadata, layer_id: str, benchmarks_dir: Optional[Path] = None,
+            context: str = "") -> Optional[str]:
+        """캐시 키. 스킬 디렉토리를 읽을 수 없으면 None (캐시하지 않음)."""
+        fingerprint = self._fingerprint(skill)
+        if fingerprint is None:
+            return None
+        hasher = hashlib.sha256()
+        for part in (self._base, fingerprint, layer_id,
+                     self._benchmark_entry(layer_id, skill, benchmarks_dir), context):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    def lookup(self, skill: SkillMetadata, layer_id: str, benchmarks_dir: Optional[Path] = None,
+               context: str = "") -> Optional[LayerResult]:
+        """캐시된 LayerResult, 없으면 None (이후 store()로 저장할 키를 기억)."""
+        key = self.key(skill, layer_id, benchmarks_dir, context)
+        if key is None:
+            return None
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._used.add(key)
+            return result_from_dict(entry["result"])
+        self.misses += 1
+        self._pending[(str(skill.skill_path), layer_id)] = key
+        return None
+
+    def store(self, skill: SkillMetadata, layer_id: str, result: LayerResult):
+        """lookup() 미스 이후 새로 평가한 결과 저장."""
+        key = self._pending.pop((str(skill.skill_path), layer_id), None)
+        if key is None or _is_error_result(result):
+            return
+        self.entries[key] = {"result": result_to_dict(result)}
+        self._used.add(key)
+
+    def save(self):
+        """이번 실행에서 쓴 항목의 사용 시각을 갱신하고 상한을 넘는 오래된 항목을 지운 뒤 원자적으로 저장."""
+        now = time.time()
+        for key in self._used:
+            self.entries[key]["used"] = now
+        if len(self.entries) > self.max_entries:
+            ranked = sorted(self.entries.items(), key=lambda kv: kv[1].get("used", 0), reverse=True)
+            self.entries = dict(ranked[:self.max_entries])
+        payload = {
+            "format": CACHE_FORMAT_VERSION,
+            "evaluator_version": self.evaluator_version,
+            "results": self.entries,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
@@ -0,0 +1,143 @@
+"""Scheduler — (스킬, 레이어) 작업 단위 비용 예측, longest-first 배치, --workers auto 풀 크기."""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from evaluators import LAYER_RESOURCES, RESOURCE_IO
+from evaluators.base import get_inventory
+from models import SkillMetadata
+
+
+DEFAULT_TIMINGS_PATH = Path(__file__).parent.parent / "reports" / "layer_timings.json"
+TIMINGS_FORMAT_VERSION = 1
+
+# 기록이 없을 때의 근사: 레이어 고정 비용(초) + 레이어가 읽는 파일 바이트 / 처리 속도
+_FIXED_COST = 0.002
+_BYTES_PER_SECOND = 4_000_000
+# 레이어 → SKILL.md 외에 읽는 최상위 디렉토리
+_LAYER_INPUTS = {
+    "L1": ("scripts",),
+    "L3": ("references",),
+    "L5": ("scripts", "bridges"),
+    "L6": ("scripts",),
+}
+# --workers auto: I/O 레이어 대기 비율 기록이 없을 때의 가정과 I/O 스레드 상한
+DEFAULT_IO_WAIT = 0.5
+MAX_IO_THREADS = 32
+
+
+def _input_bytes(skill: SkillMetadata, layer_id: str) -> int:
+    inventory = get_inventory(skill)
+    entry = inventory.get("SKILL.md")
+    total = entry.size if entry is not None else 0
+    for top in _LAYER_INPUTS.get(layer_id, ()):
+        total += sum(e.size for e in inventory.files(top))
+    return total
+
+
+class CostModel:
+    """(스킬, 레이어) 평가 시간 예측.
+
+    이전 실행에서 기록한 레이어별 소요 시간이 있으면 그 값을, 없으면 레이어가
+    읽는 파일 크기로 근사한다. record()한 값은 timings에 바로 합쳐 save()로 다음
+    실행에 넘긴다 (path가 None이면 스킬별 기록을 남기지 않는다). I/O 레이어의 CPU 시간도 받으면 대기 비율
+    (1 - CPU/경과)을 함께 저장해 --workers auto가 스레드 풀 크기에 쓴다.
+    """
+
+    def __init__(self, path: Path = None, timings: Dict[str, Dict[str, float]] = None, io_wait: float = None):
+        self.path = path
+        self.timings = timings or {}
+        self.io_wait = DEFAULT_IO_WAIT if io_wait is None else io_wait
+        self._dirty = False
+        self._io_wall = 0.0
+        self._io_cpu = 0.0
+
+    @classmethod
+    def load(cls, path: Path) -> "CostModel":
+        """기록 파일 로드. 없거나 형식이 다르면 빈 기록."""
+        if not path.exists():
+            return cls(path)
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+            return cls(path)
+        if raw.get("format") != TIMINGS_FORMAT_VERSION:
+            return cls(path)
+        return cls(path, raw.get("timings", {}), raw.get("io_wait"))
+
+    def predict(self, skill: SkillMetadata, layer_id: str) -> float:
+        recorded = self.timings.get(skill.name, {}).get(layer_id)
+        if recorded is not None:
+            return recorded
+        return _FIXED_COST + _input_bytes(skill, layer_id) / _BYTES_PER_SECOND
+
+    def record(self, skill_name: str, durations: Dict[str, float], cpu_times: Dict[str, float] = None):
+        if self.path is not None:
+            # 예측은 스킬을 제출할 때 끝나므로 이번 실행 값을 바로 합쳐도 된다
+            self.timings.setdefault(skill_name, {}).update({lid: round(t, 6) for lid, t in durations.items()})
+            self._dirty = True
+        for lid, cpu in (cpu_times or {}).items():
+            if LAYER_RESOURCES.get(lid) == RESOURCE_IO:
+                self._io_wall += durations[lid]
+                self._io_cpu += cpu
+
+    def observed_io_wait(self) -> float:
+        """이번 실행의 I/O 레이어 대기 비율. 기록이 없으면 불러온 값."""
+        if self._io_wall <= 0:
+            return self.io_wait
+        return min(max(1.0 - self._io_cpu / self._io_wall, 0.0), 1.0)
+
+    def save(self):
+        """이번 실행 기록을 합쳐 원자적으로 저장."""
+        if self.path is None or not self._dirty:
+            return
+        payload = {
+            "format": TIMINGS_FORMAT_VERSION,
+            "io_wait": round(self.observed_io_wait(), 4),
+            "timings": self.timings,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def plan_units(window: List[Tuple[SkillMetadata, List[str]]], workers: int,
+               cost_model: CostModel) -> List[Tuple[SkillMetadata, List[str]]]:
+    """제출 창 [(skill, layer_ids)]을 예상 비용 내림차순 작업 단위 목록으로.
+
+    스킬 하나의 예상 비용이 창 전체의 워커당 몫보다 크면 레이어별 단위로 나눠
+    여러 워커에 퍼뜨린다. 나머지는 스킬 단위로 두어 한 워커 안에서 ScriptCorpus와
+    분석 결과를 레이어끼리 공유한다.
+    """
+    costed = [(skill, [(lid, cost_model.predict(skill, lid)) for lid in layer_ids]) for skill, layer_ids in window]
+    fair_share = sum(c for _, layers in costed for _, c in layers) / max(workers, 1)
+    units = []
+    for skill, layers in costed:
+        total = sum(c for _, c in layers)
+        if total > fair_share and len(layers) > 1:
+            units.extend((c, skill, [lid]) for lid, c in layers)
+        else:
+            units.append((total, skill, [lid for lid, _ in layers]))
+    units.sort(key=lambda u: u[0], reverse=True)
+    return [(skill, layer_ids) for _, skill, layer_ids in units]
+
+
+def _cpu_count() -> int:
+    try:
+        return len(os.sched_getaffinity(0))  # 컨테이너/taskset 제한 반영
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def auto_workers(io_wait: float, cpu_count: int = None) -> Tuple[int, int]:
+    """--workers auto의 (프로세스 수, I/O 스레드 수).
+
+    CPU 레이어는 코어 수만큼의 프로세스, I/O 레이어는 대기 비율 w일 때 코어를
+    채우는 스레드 수 cpus / (1 - w)로 잡는다 (w=0.5면 코어의 2배, 상한 MAX_IO_THREADS).
+    """
+    cpus = cpu_count or _cpu_count()
+    wait = min(max(io_wait, 0.0), 0.95)
+    return cpus, max(1, min(MAX_IO_THREADS, round(cpus / (1 - wait))))
@@ -1,6 +1,7 @@
 """점수 계산/요약 집계 유틸리티."""
 
 from eval_config import DEFAULT_LAYER_WEIGHTS
+from models import ERROR_METRICS
 
 
 def weighted_score(layer_results: dict, layer_weights: dict = None) -> float:
@@ -18,17 +19,24 @@ def weighted_score(layer_results: dict, layer_weights: dict = None) -> float:
     return weighted_sum / total_weight if total_weight > 0 else 0.0
 
 
+def is_error_result(layer_result) -> bool:
+    """평가 자체가 실패한 레이어 결과인지 (runtime_error/timeout)."""
+    return any(m.name in ERROR_METRICS for m in layer_result.metrics)
+
+
 def summarize_results(results: dict, layer_weights: dict = None) -> dict:
     """평가 결과 요약 집계."""
     weights = layer_weights or DEFAULT_LAYER_WEIGHTS
     all_w = [weighted_score(lrs, layer_weights=weights) for lrs in results.values()]
-    error_count = 0
-    for layer_results in results.values():
-        for lr in layer_results.values():
-            if any(m.name == "runtime_error" for m in lr.metrics):
-                error_count += 1
+    error_count = sum(is_error_result(lr) for lrs in results.values() for lr in lrs.values())
+    return summarize_scores(all_w, error_count, layer_weights=weights)
+
+
+def summarize_scores(all_w: list, error_count: int, layer_weights: dict = None) -> dict:
+    """스킬별 가중 점수 목록과 실패 레이어 수로 요약 집계 (스트리밍 출력용)."""
+    weights = layer_weights or DEFAULT_LAYER_WEIGHTS
     return {
-        "total_skills": len(results),
+        "total_skills": len(all_w),
         "weighted_average": round(sum(all_w) / len(all_w), 1) if all_w else 0,
         "min": round(min(all_w), 1) if all_w else 0,
         "max": round(max(all_w), 1) if all_w else 0,
@@ -0,0 +1,147 @@
+"""스킬 scripts/**/*.py 코퍼스 — 파일당 1회 읽기/디코드, 줄 인덱스·AST 특징은 지연 생성.
+
+L1/L5/L6 검사와 ecosystem이 같은 ScriptCorpus를 공유한다 (evaluators.base.get_corpus).
+"""
+
+import bisect
+from typing import Iterator, List, Optional, Tuple
+
+import file_access
+from ast_features import FEATURES, ScriptFeatures
+from file_access import exceeds_cap, open_buffer
+from inventory import FileEntry, SkillInventory
+
+_UNREAD = object()
+
+
+class ScriptFile:
+    """scripts/ 아래 .py 파일 하나. content/line_starts/features는 처음 접근 시 1회 계산.
+
+    AST는 features를 만들 때만 (FEATURES 캐시 미스에서) 파싱하고 붙들지 않는다.
+    """
+
+    __slots__ = ("inventory", "entry", "_content", "_line_starts", "_features")
+
+    def __init__(self, inventory: SkillInventory, entry: FileEntry):
+        self.inventory = inventory
+        self.entry = entry
+        self._content = _UNREAD
+        self._line_starts = None
+        self._features = _UNREAD
+
+    def __repr__(self) -> str:
+        return f"ScriptFile({self.entry.rel_path!r})"
+
+    @property
+    def name(self) -> str:
+        return self.entry.name
+
+    @property
+    def path(self):
+        return self.inventory.path(self.entry)
+
+    @property
+    def loaded(self) -> bool:
+        return self._content is not _UNREAD
+
+    @property
+    def content(self) -> Optional[str]:
+        """디코드된 텍스트. UnicodeDecodeError/PermissionError면 None."""
+        if self._content is _UNREAD:
+            try:
+                self._content = self.inventory.read_text(self.entry)
+            except (UnicodeDecodeError, PermissionError):
+                self._content = None
+        return self._content
+
+    @property
+    def line_starts(self) -> Tuple[int, ...]:
+        """각 줄의 시작 오프셋 (content 기준)."""
+        if self._line_starts is None:
+            text = self.content or ""
+            starts = [0]
+            pos = text.find("\n")
+            while pos >= 0:
+                starts.append(pos + 1)
+                pos = text.find("\n", pos + 1)
+            self._line_starts = tuple(starts)
+        return self._line_starts
+
+    def line_of(self, offset: int) -> int:
+        """content 오프셋 → 1부터 시작하는 줄 번호."""
+        return bisect.bisect_right(self.line_starts, offset)
+
+    @property
+    def features(self) -> Optional[ScriptFeatures]:
+        """AST 특징 (ast_features.FEATURES 내용 해시 캐시). 읽기/파싱 실패면 None."""
+        if self._features is _UNREAD:
+            content = self.content
+            self._features = None if content is None else FEATURES.features(content, str(self.path))
+        return self._features
+
+
+class ScriptCorpus:
+    """스킬 하나의 scripts/**/*.py 목록 (경로 정렬).
+
+    생성 시점의 크기 제한(file_access)을 넘는 파일은 capped로 분리해 읽지 않는다.
+    피클링하면 읽어둔 내용 없이 인벤토리만 넘어가 워커에서 다시 지연 로드한다.
+    """
+
+    __slots__ = ("inventory", "_files", "_capped")
+
+    def __init__(self, inventory: SkillInventory):
+        self.inventory = inventory
+        files: List[ScriptFile] = []
+        capped: List[FileEntry] = []
+        for entry in inventory.files("scripts", ".py"):
+            if exceeds_cap(entry):
+                capped.append(entry)
+            else:
+                files.append(ScriptFile(inventory, entry))
+        self._files = tuple(files)
+        self._capped = tuple(capped)
+
+    def __reduce__(self):
+        return (ScriptCorpus, (self.inventory,))
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def files(self, skip_init: bool = True) -> Tuple[ScriptFile, ...]:
+        if not skip_init:
+            return self._files
+        return tuple(f for f in self._files if f.name != "__init__.py")
+
+    def capped(self, skip_init: bool = True) -> Tuple[FileEntry, ...]:
+        """크기 제한으로 제외된 파일."""
+        if not skip_init:
+            return self._capped
+        return tuple(e for e in self._capped if e.name != "__init__.py")
+
+    def release(self):
+        """읽어 둔 내용/줄 인덱스/특징을 모두 버린다 (L5/L6이 끝난 스킬 — 다시 접근하면 지연 로드)."""
+        for f in self._files:
+            f._content = _UNREAD
+            f._line_starts = None
+            f._features = _UNREAD
+
+    def texts(self, skip_init: bool = True) -> Iterator[ScriptFile]:
+        """디코드에 성공한 파일만."""
+        return (f for f in self.files(skip_init) if f.content is not None)
+
+    def buffers(self, skip_init: bool = True):
+        """(ScriptFile, buffer) — 정규식/부분 문자열 검사용.
+
+        이미 읽었거나 MMAP_THRESHOLD 미만인 파일은 content(1회 디코드)를 쓰고,
+        아직 읽지 않은 큰 파일은 디코드 없이 mmap으로 스캔한다 (다음 항목에서 닫힘).
+        """
+        for f in self.files(skip_init):
+            if f.loaded or f.entry.size < file_access.MMAP_THRESHOLD or self.inventory.reader is not None:
+                if f.content is not None:
+                    yield f, f.content
+                continue
+            try:
+                with open_buffer(self.inventory, f.entry) as buf:
+                    yield f, buf
+            except PermissionError:
+                pass
@@ -0,0 +1,57 @@
+"""SKILL.md 섹션 분류 — 카테고리별 패턴을 named group 정규식 하나로 컴파일."""
+
+import re
+from typing import Dict, Iterable, Mapping
+
+from eval_config import DEFAULT_SECTION_TAXONOMY
+
+
+FLAG_PREFIX = "has_"
+
+
+def _alternation(patterns) -> str:
+    """문자열 또는 문자열 목록 → 하나의 alternation."""
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    return "|".join(f"(?:{p})" for p in patterns)
+
+
+class SectionTaxonomy:
+    """카테고리명 → 헤더 패턴(정규식) 매핑을 컴파일한 분류기.
+
+    카테고리마다 `(?=(?P<name>.*?(?:패턴)))?` 형태의 선택적 lookahead를 이어 붙여,
+    헤더 하나를 match() 1회로 분류한다. lookahead는 위치를 소비하지 않으므로
+    한 헤더가 여러 카테고리에 동시에 속할 수 있다 (기존 개별 re.search와 동일).
+    헤더는 소문자로 바꿔 매칭한다.
+    """
+
+    def __init__(self, categories: Mapping[str, object]):
+        self.categories = dict(categories)
+        self.flag_names = tuple(FLAG_PREFIX + name for name in self.categories)
+        self._regex = re.compile("".join(
+            f"(?=(?P<{name}>.*?(?:{_alternation(patterns)})))?"
+            for name, patterns in self.categories.items()
+        ))
+
+    def classify(self, header: str) -> Iterable[str]:
+        """헤더가 속한 카테고리명들."""
+        groups = self._regex.match(header.lower()).groupdict()
+        return [name for name, value in groups.items() if value is not None]
+
+    def flags(self, headers: Iterable[str]) -> Dict[str, bool]:
+        """{"has_<카테고리>": 헤더 중 하나라도 속하면 True} — 모든 카테고리 포함."""
+        found = set()
+        for header in headers:
+            found.update(self.classify(header))
+            if len(found) == len(self.categories):
+                break
+        return {FLAG_PREFIX + name: name in found for name in self.categories}
+
+    def __eq__(self, other):
+        return isinstance(other, SectionTaxonomy) and self.categories == other.categories
+
+    def __reduce__(self):
+        return SectionTaxonomy, (self.categories,)
+
+
+DEFAULT_TAXONOMY = SectionTaxonomy(DEFAULT_SECTION_TAXONOMY)
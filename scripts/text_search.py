@@ -0,0 +1,69 @@
+"""다중 패턴 문자열 탐색 — Aho-Corasick 오토마톤 (stdlib only)."""
+
+from collections import deque
+from typing import Iterable, List, Set
+
+
+class AhoCorasick:
+    """여러 패턴을 한 번에 찾는 오토마톤.
+
+    패턴 목록으로 한 번 빌드한 뒤 find_all()로 텍스트를 한 번만 선형 스캔해
+    등장한 패턴 인덱스를 모두 반환한다. 빈 패턴은 무시한다.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = list(patterns)
+        self._goto: List[dict] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._dict_link: List[int] = [0]  # 출력이 있는 가장 가까운 fail 조상
+
+        for idx, pattern in enumerate(self.patterns):
+            if pattern:
+                self._insert(pattern, idx)
+        self._build_links()
+
+    def _insert(self, pattern: str, idx: int):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._dict_link.append(0)
+            node = nxt
+        self._out[node].append(idx)
+
+    def _build_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                fail = self._goto[f].get(ch, 0)
+                self._fail[child] = fail
+                self._dict_link[child] = fail if self._out[fail] else self._dict_link[fail]
+
+    def find_all(self, text: str) -> Set[int]:
+        """text에 등장하는 모든 패턴 인덱스 집합."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        dict_link = self._dict_link
+        found = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            hit = node if out[node] else dict_link[node]
+            while hit:
+                found.update(out[hit])
+                hit = dict_link[hit]
+        return found
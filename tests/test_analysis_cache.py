@@ -0,0 +1,125 @@
+"""analysis_cache.py 단위 테스트."""
+
+import ast
+import json
+
+import pytest
+
+import ast_features
+from analysis_cache import AnalysisCache, features_from_json, features_to_json
+from ast_features import FEATURES, FeatureCache, content_key, extract_features
+from orchestrator import run
+from test_orchestrator import _make_args, _make_skill_dir
+
+
+SOURCE = (
+    '"""모듈."""\nimport argparse\nimport sys\n\n'
+    "def main(argv: list) -> int:\n"
+    "    parser = argparse.ArgumentParser()\n"
+    "    parser.add_argument('-f', '--format')\n"
+    "    try:\n"
+    "        return 0 if '--dry-run' in argv else 1\n"
+    "    except (ValueError, KeyError):\n"
+    "        sys.exit(2)\n"
+)
+
+
+class TestSerialization:
+
+    def test_roundtrip(self):
+        features = extract_features(ast.parse(SOURCE))
+        assert features_from_json(features_to_json(features)) == features
+
+    def test_parse_failure_roundtrip(self):
+        assert features_from_json(features_to_json(None)) is None
+
+
+class TestAnalysisCache:
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "reports" / "cache.sqlite"
+        features = extract_features(ast.parse(SOURCE))
+        cache = AnalysisCache(path)
+        cache.store(content_key(SOURCE), features)
+        cache.store(content_key("def (:"), None)
+        cache.close()
+
+        reopened = AnalysisCache(path)
+        assert reopened.lookup(content_key(SOURCE)) == (True, features)
+        assert reopened.lookup(content_key("def (:")) == (True, None)
+        assert reopened.lookup(content_key("x = 1")) == (False, None)
+        assert (reopened.hits, reopened.misses) == (2, 1)
+
+    def test_version_mismatch_misses(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        cache = AnalysisCache(path, version="old")
+        cache.store(content_key(SOURCE), None)
+        cache.close()
+        assert AnalysisCache(path, version="new").lookup(content_key(SOURCE)) == (False, None)
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        cache = AnalysisCache(path, max_entries=2)
+        for src in ("a = 1", "b = 2"):
+            cache.store(content_key(src), None)
+            cache.flush()
+        cache.lookup(content_key("a = 1"))
+        cache.flush()
+        cache.store(content_key("c = 3"), None)
+        cache.flush()
+
+        assert len(cache) == 2
+        assert cache.lookup(content_key("a = 1"))[0]
+        assert not cache.lookup(content_key("b = 2"))[0]
+        assert cache.lookup(content_key("c = 3"))[0]
+        cache.close()
+
+    def test_corrupt_file_disables_cache(self, tmp_path, capsys):
+        path = tmp_path / "cache.sqlite"
+        path.write_bytes(b"not a database" * 100)
+        features = FeatureCache(store=AnalysisCache(path))
+        assert features.features(SOURCE).module_docstring
+        features.flush()
+        assert "analysis cache disabled" in capsys.readouterr().err
+
+
+class TestFeatureCacheWithStore:
+
+    def test_duplicate_content_hits_disk_not_parser(self, tmp_path, monkeypatch):
+        path = tmp_path / "cache.sqlite"
+        first = FeatureCache(store=AnalysisCache(path))
+        expected = first.features(SOURCE)
+        first.attach(None)
+
+        monkeypatch.setattr(ast_features, "extract_features", lambda tree: pytest.fail("parsed"))
+        second = FeatureCache(store=AnalysisCache(path))
+        assert second.features(SOURCE) == expected
+        assert second.store.hits == 1
+
+
+class TestOrchestratorAnalysisCache:
+
+    def test_second_run_reuses_analysis(self, tmp_path, monkeypatch, capsys):
+        skills_root = tmp_path / "skills"
+        skills_root.mkdir()
+        _make_skill_dir(skills_root, "cached-skill")
+        skill_dir = skills_root / "cached-skill"
+        (skill_dir / "scripts").mkdir()
+        (skill_dir / "scripts" / "main.py").write_text(SOURCE, encoding="utf-8")
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"layer_weights": {"L5": 1.0}}), encoding="utf-8")
+
+        args = _make_args(skills_root, config_path)
+        args.layer = "L5"
+        args.analysis_cache = tmp_path / "reports" / "analysis_cache.sqlite"
+
+        FEATURES.clear()
+        assert run(args) == 0
+        first = json.loads(capsys.readouterr().out)["skills"]
+        assert FEATURES.store is None
+        assert len(AnalysisCache(args.analysis_cache)) == 1
+
+        FEATURES.clear()
+        monkeypatch.setattr(ast_features, "extract_features", lambda tree: pytest.fail("parsed"))
+        assert run(args) == 0
+        assert json.loads(capsys.readouterr().out)["skills"] == first
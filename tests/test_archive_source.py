@@ -0,0 +1,175 @@
+"""archive_source.py + 아카이브 기반 discovery 단위 테스트."""
+
+import json
+import pickle
+import tarfile
+import zipfile
+
+import pytest
+
+from archive_source import ZipSource, archive_stem, is_archive, open_archive
+from discovery import compile_ignore_patterns, discover_skills, find_listing_skill_prefixes
+from evaluators import LAYERS
+from helpers import make_skill
+
+
+SCRIPT = '''"""Analyzer."""
+import argparse
+import sys
+
+
+def main() -> int:
+    """entry point."""
+    parser = argparse.ArgumentParser(description="analyze")
+    parser.add_argument("--json", action="store_true")
+    try:
+        parser.parse_args()
+    except SystemExit:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+
+
+def _make_tree(root):
+    """디렉토리 기반 스킬 2개 생성 (scripts/references 포함)."""
+    root.mkdir()
+    make_skill(
+        root, name="alpha", triggers=["분석", "analyze"],
+        script_contents={"analyze.py": SCRIPT},
+        reference_contents={"guide.md": "# Guide\n"},
+        skill_md_body="# Alpha\n\n## When to use\n- x\n\nSee references/guide.md\n",
+    )
+    make_skill(root, name="beta", triggers=["정리"], create_tests=True)
+    return root
+
+
+def _zip_tree(src, dest, prefix=""):
+    with zipfile.ZipFile(dest, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path in sorted(src.rglob("*")):
+            zf.write(path, prefix + path.relative_to(src).as_posix())
+    return dest
+
+
+def _tar_tree(src, dest, prefix=""):
+    with tarfile.open(dest, "w:gz") as tf:
+        for path in sorted(src.rglob("*")):
+            tf.add(path, arcname="./" + prefix + path.relative_to(src).as_posix(), recursive=False)
+    return dest
+
+
+def _evaluate_all(skills, benchmarks_dir=None):
+    results = {}
+    for skill in skills:
+        for lid, fn in LAYERS.items():
+            lr = fn(skill, all_skills=skills, benchmarks_dir=benchmarks_dir)
+            results[(skill.name, lid)] = [(m.name, m.score, m.details) for m in lr.metrics]
+    return results
+
+
+class TestArchiveHelpers:
+    def test_is_archive_and_stem(self, tmp_path):
+        assert is_archive("skills.zip")
+        assert is_archive("bundle.TAR.GZ")
+        assert not is_archive("notes.md")
+        assert archive_stem(tmp_path / "my-skill.tar.gz") == "my-skill"
+
+    def test_listing_normalizes_member_paths(self, tmp_path):
+        """'./' 접두사 제거, 디렉토리는 'dir/' 형태, 상위 경로(..) 멤버는 무시."""
+        dest = tmp_path / "a.tar.gz"
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "SKILL.md").write_text("x", encoding="utf-8")
+        with tarfile.open(dest, "w:gz") as tf:
+            tf.add(src / "SKILL.md", arcname="./s/SKILL.md")
+            tf.add(src / "SKILL.md", arcname="../evil.md")
+            tf.add(src, arcname="./s/tests", recursive=False)
+        names = [p for p, _, _ in open_archive(dest).listing()]
+        assert names == ["s/SKILL.md", "s/tests/"]
+
+    def test_source_is_picklable_for_process_pool(self, tmp_path):
+        src = _make_tree(tmp_path / "src")
+        path = _zip_tree(src, tmp_path / "s.zip")
+        source = open_archive(path)
+        source.listing()
+        data = pickle.dumps(source)
+        assert b"beta/SKILL.md" not in data  # 멤버 색인은 피클에 실리지 않는다
+        assert pickle.loads(data) is source  # 같은 프로세스에서는 공유 소스로 풀린다
+
+        # 등록되지 않은 경로(워커가 처음 보는 아카이브)는 색인 없이 만들고 처음 읽을 때 색인한다
+        other = tmp_path / "copy.zip"
+        other.write_bytes(path.read_bytes())
+        clone = pickle.loads(pickle.dumps(ZipSource(other)))
+        assert clone.read_bytes("beta/SKILL.md") == source.read_bytes("beta/SKILL.md")
+
+
+class TestListingPrefixes:
+    def test_nested_and_pruned(self):
+        paths = [
+            "team/a/SKILL.md", "team/a/sub/SKILL.md",
+            "b/SKILL.md", "node_modules/x/SKILL.md", "deep/1/2/SKILL.md",
+        ]
+        rules = compile_ignore_patterns(["node_modules/"])
+        assert find_listing_skill_prefixes(paths, 2, rules) == ["b/", "team/a/"]
+        assert find_listing_skill_prefixes(paths, 0, rules) == ["b/", "deep/1/2/", "team/a/"]
+
+    def test_root_skill_md_makes_single_skill(self):
+        assert find_listing_skill_prefixes(["SKILL.md", "x/SKILL.md"], 1) == [""]
+
+
+class TestArchiveDiscovery:
+    @pytest.mark.parametrize("packer,suffix", [(_zip_tree, ".zip"), (_tar_tree, ".tar.gz")])
+    def test_archive_matches_extracted_directory(self, tmp_path, packer, suffix):
+        """아카이브를 --skills-root로 주면 디렉토리와 같은 평가 결과."""
+        src = _make_tree(tmp_path / "src")
+        archive = packer(src, tmp_path / f"skills{suffix}")
+
+        bench = tmp_path / "bench" / "L5_execution"
+        bench.mkdir(parents=True)
+        (bench / "script_tests.json").write_text(json.dumps({
+            "alpha": {"required_patterns": [{"file": "analyze.py", "pattern": "argparse"}]},
+        }), encoding="utf-8")
+
+        from_dir = discover_skills(src)
+        from_archive = discover_skills(archive)
+        assert [s.name for s in from_archive] == ["alpha", "beta"]
+        assert from_archive[0].script_files == from_dir[0].script_files
+        assert from_archive[0].reference_files == ("guide.md",)
+        assert from_archive[1].has_tests_dir
+        assert _evaluate_all(from_archive, tmp_path / "bench") == _evaluate_all(from_dir, tmp_path / "bench")
+
+    def test_directory_of_archives(self, tmp_path):
+        """디렉토리 안의 단일 스킬 번들(루트에 SKILL.md)과 일반 디렉토리 스킬을 함께 탐지."""
+        src = _make_tree(tmp_path / "src")
+        root = tmp_path / "root"
+        root.mkdir()
+        _zip_tree(src / "alpha", root / "alpha.zip")
+        _tar_tree(src / "beta", root / "bundle.tar.gz", prefix="beta/")
+        make_skill(root, name="gamma")
+
+        skills = discover_skills(root)
+        assert [s.name for s in skills] == ["alpha", "beta", "gamma"]
+        assert skills[0].skill_path == root / "alpha"
+        assert skills[0].script_files == ("analyze.py",)
+        assert not (root / "alpha").exists()
+
+    def test_nested_archive_names_are_qualified(self, tmp_path):
+        src = _make_tree(tmp_path / "src")
+        root = tmp_path / "root"
+        (root / "team-a").mkdir(parents=True)
+        _zip_tree(src, root / "team-a" / "skills.zip", prefix="pack/")
+
+        assert discover_skills(root, max_depth=2) == []
+        skills = discover_skills(root, max_depth=0)
+        assert [s.name for s in skills] == ["team-a/pack/alpha", "team-a/pack/beta"]
+
+    def test_corrupt_archive_is_skipped(self, tmp_path, capsys):
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "broken.zip").write_bytes(b"not a zip")
+        make_skill(root, name="ok")
+        assert [s.name for s in discover_skills(root)] == ["ok"]
+        assert "[WARN]" in capsys.readouterr().err
@@ -0,0 +1,211 @@
+"""ast_features.py 단위 테스트."""
+
+import ast
+
+from ast_features import FeatureCache, approx_size, extract_features
+from evaluators.ecosystem import check_cli_consistency
+from evaluators.l5_execution import check_cli_interface, check_docstrings, check_function_quality
+from evaluators.l6_validation import check_error_handling, check_verification_infra
+from helpers import make_skill
+
+
+def _features(source):
+    return extract_features(ast.parse(source))
+
+
+class TestExtractFeatures:
+
+    def test_multiline_signature_and_annotations(self):
+        feats = _features(
+            "class A:\n"
+            "    def method(\n"
+            "        self,\n"
+            "        value: int,\n"
+            "    ):\n"
+            '        """메서드."""\n'
+            "        return value\n\n"
+            "    def plain(self, x):\n"
+            "        return x\n\n"
+            "async def fetch(url) -> bytes:\n"
+            "    pass\n"
+        )
+        assert [(f.name, f.has_docstring, f.annotated) for f in feats.functions] == [
+            ("fetch", False, True),
+            ("method", True, True),
+            ("plain", False, False),
+        ]
+
+    def test_module_docstring_after_comments(self):
+        assert _features('#!/usr/bin/env python3\n# -*- coding: utf-8 -*-\n"""모듈."""\n').module_docstring
+        assert _features('r"""raw docstring."""\n').module_docstring
+        assert not _features('x = 1\n"""not a docstring"""\n').module_docstring
+
+    def test_complexity_includes_nested_functions(self):
+        feats = _features(
+            "def outer(a, b):\n"
+            "    if a and b:\n"
+            "        pass\n"
+            "    def inner(c):\n"
+            "        return 1 if c else 2\n"
+            "    return inner\n"
+        )
+        assert [(f.name, f.complexity) for f in feats.functions] == [("outer", 4), ("inner", 2)]
+
+    def test_argparse_and_flags(self):
+        feats = _features(
+            "from argparse import ArgumentParser\n"
+            "p = ArgumentParser()\n"
+            "p.add_argument('-f', '--format')\n"
+            "p.add_argument('input')\n"
+            "help_text = 'parser.add_argument(\"--fake\")'\n"
+        )
+        assert feats.uses_argparse
+        assert feats.argument_parsers == 1
+        assert feats.add_arguments == (("-f", "--format"), ("input",))
+        assert feats.option_strings == ("-f", "--format")
+
+    def test_error_handling(self):
+        feats = _features(
+            "import sys\n"
+            "try:\n"
+            "    pass\n"
+            "except (ValueError, json.JSONDecodeError):\n"
+            "    sys.exit(1)\n"
+            "except:\n"
+            "    pass\n"
+            "msg = 'try: sys.exit'\n"
+        )
+        assert feats.try_blocks == 1
+        assert feats.except_types == ("ValueError", "json.JSONDecodeError")
+        assert feats.bare_excepts == 1
+        assert feats.sys_exit_calls == 1
+
+    def test_argv_flags(self):
+        feats = _features(
+            "import sys\n"
+            "if '--verify' in sys.argv:\n"
+            "    pass\n"
+            "if sys.argv[1] in ('-h', '--help'):\n"
+            "    pass\n"
+            "if '--fake' in USAGE:\n"
+            "    pass\n"
+        )
+        assert feats.argv_flags == ("--help", "--verify", "-h")
+        assert feats.option_strings == ("--help", "--verify", "-h")
+
+
+class TestFeatureCache:
+
+    def test_same_content_parsed_once(self):
+        cache = FeatureCache()
+        first = cache.features("def f():\n    pass\n")
+        assert cache.features("def f():\n    pass\n") is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_syntax_error_cached_as_none(self):
+        cache = FeatureCache()
+        assert cache.features("def (:\n") is None
+        assert cache.features("def (:\n") is None
+        assert cache.hits == 1
+
+    def test_lru_eviction(self):
+        cache = FeatureCache(maxsize=2)
+        for src in ("a = 1\n", "b = 2\n", "c = 3\n"):
+            cache.features(src)
+        assert len(cache) == 2
+        cache.features("a = 1\n")
+        assert cache.misses == 4
+
+    def test_byte_bound_eviction(self):
+        small = "a = 1\n"
+        big = "".join(f"def f{i}():\n    pass\n" for i in range(50))
+        big_size = approx_size(extract_features(ast.parse(big)))
+        cache = FeatureCache(max_bytes=big_size + 100)
+        cache.features(small)
+        cache.features(big)
+        assert len(cache) == 1
+        assert cache.nbytes == big_size
+        cache.features(small)
+        assert cache.misses == 3
+
+
+class TestEvaluatorsUseFeatures:
+    """정규식 휴리스틱이 놓치거나 잘못 잡던 경우."""
+
+    def test_function_quality_counts_multiline_defs(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={"main.py": (
+            "def build(\n"
+            "    items: list,\n"
+            ") -> dict:\n"
+            '    """빌드."""\n'
+            "    return {}\n"
+        )})
+        result = check_function_quality(skill)
+        assert "함수 1개, docstring 1 (100%), 타입힌트 1 (100%)" in result.details
+
+    def test_strings_do_not_count(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={"main.py": (
+            "USAGE = 'import argparse; try: sys.exit(1) except ValueError --verify'\n"
+        )}, create_tests=True)
+        assert check_cli_interface(skill).score == 0
+        assert check_error_handling(skill).score == 0
+        assert check_verification_infra(skill).score == 20  # tests/만
+
+    def test_docstring_after_encoding_comment(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={
+            "main.py": '# -*- coding: utf-8 -*-\n"""모듈."""\n',
+        })
+        assert check_docstrings(skill).score == 10
+
+    def test_unparsable_script_keeps_text_docstring_check(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={
+            "ok.py": '"""모듈."""\n',
+            "broken.py": '#!/usr/bin/env python3\n"""모듈."""\ndef (:\n',
+        })
+        assert check_docstrings(skill).score == 10
+
+    def test_manual_help_handling_earns_help_credit(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={"main.py": (
+            "import sys\n\nif '--help' in sys.argv:\n    print('usage: main.py FILE')\n"
+        )})
+        result = check_cli_interface(skill)
+        assert result.score == 3
+        assert result.details == "인자 정의"
+
+    def test_argv_verify_flag_counts(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={"main.py": (
+            "import sys\n\nif '--verify' in sys.argv:\n    sys.exit(0)\n"
+        )})
+        result = check_verification_infra(skill)
+        assert result.score == 15
+        assert result.details == "검증 플래그 (main.py)"
+
+    def test_unparsable_script_keeps_text_checks(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={"broken.py": (
+            "import argparse, sys\n"
+            "p = argparse.ArgumentParser()\n"
+            "p.add_argument('--verify')\n"
+            "try:\n"
+            "    run(\n"
+            "except ValueError:\n"
+            "    sys.exit(1)\n"
+        )})
+        assert check_error_handling(skill).score == 30
+        assert check_verification_infra(skill).score == 15
+        assert check_cli_interface(skill).score == 10
+
+    def test_cli_consistency_uses_first_option(self, tmp_path):
+        s1 = make_skill(tmp_path, name="s1", script_contents={"main.py": "p.add_argument('-f', '--format')\n"})
+        s2 = make_skill(tmp_path, name="s2", script_contents={"main.py": "p.add_argument('-f')\n"})
+        assert check_cli_consistency([s1, s2]).score == 25
+
+    def test_cli_consistency_unparsable_and_argv_flags(self, tmp_path):
+        s1 = make_skill(tmp_path, name="s1", script_contents={"main.py": (
+            "p.add_argument('--format')\np.add_argument('--out')\ndef (:\n"
+        )})
+        s2 = make_skill(tmp_path, name="s2", script_contents={"main.py": (
+            "import sys\nif '-f' in sys.argv or '--out' in sys.argv: pass\n"
+        )})
+        result = check_cli_consistency([s1, s2])
+        assert result.score == 20
+        assert result.affected_skills == ["--format/-f"]
@@ -0,0 +1,188 @@
+"""change_set.py + --changed-since 평가 단위 테스트."""
+
+import json
+import shutil
+
+import pytest
+
+import history
+import orchestrator
+from change_set import ChangeSet
+from discovery import discover_skills
+from helpers import make_skill
+from test_git_source import _commit_all, repo  # noqa: F401
+from test_orchestrator import _make_args
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _by_name(skills):
+    return {s.name: s for s in skills}
+
+
+class TestChangeSet:
+
+    def test_maps_diff_and_untracked_files_to_skills(self, repo):
+        repo_dir, root, sha = repo
+        (root / "alpha" / "scripts" / "run.py").write_text("x = 1\n", encoding="utf-8")
+        make_skill(root, name="gamma")  # 추적되지 않는 새 스킬
+        change_set = ChangeSet.from_git(root, sha)
+
+        skills = _by_name(discover_skills(root))
+        assert [n for n, s in skills.items() if change_set.is_changed(s)] == ["alpha", "gamma"]
+        assert [s.name for s in change_set.old_skills] == ["alpha"]
+        assert not change_set.full
+
+    def test_overlap_partners_use_old_and_new_keywords(self, repo):
+        repo_dir, root, _ = repo
+        make_skill(root, name="delta", triggers=["분석"])
+        make_skill(root, name="omega", triggers=["배포"])
+        sha = _commit_all(repo_dir, "partners")
+        make_skill(root, name="alpha", triggers=["배포"])  # 분석 → 배포
+        change_set = ChangeSet.from_git(root, sha)
+
+        skills = _by_name(discover_skills(root))
+        others = [s for s in skills.values() if not change_set.is_changed(s)]
+        partners = change_set.overlap_partners([skills["alpha"]], others)
+        assert sorted(s.name for s in partners) == ["delta", "omega"]
+
+    def test_benchmark_entry_change_marks_skill(self, repo):
+        repo_dir, root, _ = repo
+        bench_dir = repo_dir / "benchmarks"
+        (bench_dir / "L2_activation").mkdir(parents=True)
+        bench_file = bench_dir / "L2_activation" / "trigger_queries.json"
+        bench_file.write_text(json.dumps({"alpha": {"positive": ["a"]}, "beta": {}}), encoding="utf-8")
+        sha = _commit_all(repo_dir, "bench")
+        bench_file.write_text(json.dumps({"alpha": {"positive": ["a"]}, "beta": {"positive": ["b"]}}),
+                              encoding="utf-8")
+
+        change_set = ChangeSet.from_git(root, sha, bench_dir)
+        skills = _by_name(discover_skills(root))
+        assert change_set.bench_names == {"beta"}
+        assert [n for n, s in skills.items() if change_set.is_changed(s)] == ["beta"]
+
+    def test_ignore_file_change_requires_full_evaluation(self, repo):
+        _, root, sha = repo
+        (root / ".skillignore").write_text("beta\n", encoding="utf-8")
+        assert ChangeSet.from_git(root, sha).full
+
+    def test_invalid_ref(self, repo):
+        _, root, _ = repo
+        with pytest.raises(ValueError):
+            ChangeSet.from_git(root, "no-such-ref")
+
+
+class TestChangedSinceRun:
+
+    @pytest.fixture
+    def history_path(self, tmp_path, monkeypatch):
+        path = tmp_path / "history.jsonl"
+        monkeypatch.setattr(history, "DEFAULT_HISTORY_PATH", path)
+        return path
+
+    def _track(self, monkeypatch):
+        evaluated = []
+        layers = dict(orchestrator.LAYERS)
+
+        def _tracking(lid):
+            def _evaluate(skill, **kwargs):
+                evaluated.append((skill.name, lid))
+                return layers[lid](skill, **kwargs)
+            return _evaluate
+
+        monkeypatch.setattr(orchestrator, "LAYERS", {lid: _tracking(lid) for lid in layers})
+        return evaluated
+
+    def _layer_scores(self, out):
+        return {s["name"]: {lid: l["score"] for lid, l in s["layers"].items()} for s in out["skills"]}
+
+    def test_evaluates_changed_skills_and_overlap_partners(self, repo, tmp_path, history_path, monkeypatch, capsys):
+        repo_dir, root, _ = repo
+        make_skill(root, name="delta", triggers=["분석"])
+        sha = _commit_all(repo_dir, "partner")
+        args = _make_args(root, tmp_path / "missing-config.json")
+        args.layer = None
+        args.save_history = True
+        assert orchestrator.run(args) == 0
+        capsys.readouterr()
+
+        (root / "alpha" / "scripts" / "run.py").write_text('"""doc"""\nimport sys\n', encoding="utf-8")
+        args.save_history = False
+        args.changed_since = sha
+        evaluated = self._track(monkeypatch)
+        assert orchestrator.run(args) == 0
+        captured = capsys.readouterr()
+        incremental = json.loads(captured.out)
+
+        assert sorted({name for name, _ in evaluated}) == ["alpha", "delta"]
+        assert [lid for name, lid in evaluated if name == "delta"] == ["L2"]
+        assert "reused 2 from snapshot" in captured.err
+        assert [s["name"] for s in incremental["skills"]] == ["alpha", "beta", "delta"]
+
+        args.changed_since = None
+        assert orchestrator.run(args) == 0
+        full = json.loads(capsys.readouterr().out)
+        assert self._layer_scores(incremental) == self._layer_scores(full)
+
+    def test_snapshot_of_other_commit_is_not_reused(self, repo, tmp_path, history_path, monkeypatch, capsys):
+        repo_dir, root, _ = repo
+        args = _make_args(root, tmp_path / "missing-config.json")
+        args.save_history = True
+        assert orchestrator.run(args) == 0
+        (root / "beta" / "scripts").mkdir(exist_ok=True)
+        (root / "beta" / "scripts" / "new.py").write_text("x = 1\n", encoding="utf-8")
+        head = _commit_all(repo_dir, "after snapshot")
+        capsys.readouterr()
+
+        args.save_history = False
+        args.changed_since = head  # 스냅샷은 이전 커밋 기준 — beta 변경이 diff에 안 보인다
+        evaluated = self._track(monkeypatch)
+        assert orchestrator.run(args) == 0
+        assert f"no history snapshot of commit {head[:12]}" in capsys.readouterr().err
+        assert sorted(evaluated) == [("alpha", "L1"), ("beta", "L1")]
+
+    def test_dirty_worktree_snapshot_has_no_source_commit(self, repo, tmp_path, history_path, capsys):
+        _, root, sha = repo
+        args = _make_args(root, tmp_path / "missing-config.json")
+        args.save_history = True
+        assert orchestrator.run(args) == 0
+        (root / "alpha" / "scripts" / "run.py").write_text("x = 2\n", encoding="utf-8")
+        assert orchestrator.run(args) == 0
+        clean, dirty = history.load_history(history_path)
+        assert clean["source_commit"] == sha
+        assert "source_commit" not in dirty
+
+    def test_reused_layers_are_marked_score_only_in_text(self, repo, tmp_path, history_path, capsys):
+        _, root, sha = repo
+        args = _make_args(root, tmp_path / "missing-config.json")
+        args.save_history = True
+        assert orchestrator.run(args) == 0
+        (root / "alpha" / "scripts" / "run.py").write_text("x = 2\n", encoding="utf-8")
+        capsys.readouterr()
+
+        args.save_history = False
+        args.changed_since = sha
+        args.format = "text"
+        assert orchestrator.run(args) == 0
+        out = capsys.readouterr().out
+        beta = out[out.index("[beta]"):]
+        assert "L1: " in beta and "(score only, reused from history snapshot)" in beta
+        assert "reused from history snapshot" not in out[out.index("[alpha]"):out.index("[beta]")]
+
+    def test_without_snapshot_evaluates_everything(self, repo, tmp_path, history_path, monkeypatch, capsys):
+        _, root, sha = repo
+        args = _make_args(root, tmp_path / "missing-config.json")
+        args.changed_since = sha
+        evaluated = self._track(monkeypatch)
+        assert orchestrator.run(args) == 0
+        assert "no history snapshot" in capsys.readouterr().err
+        assert sorted(evaluated) == [("alpha", "L1"), ("beta", "L1")]
+
+    def test_rejects_rev(self, repo, tmp_path, capsys):
+        _, root, sha = repo
+        args = _make_args(root, tmp_path / "missing-config.json")
+        args.changed_since = sha
+        args.rev = sha
+        assert orchestrator.run(args) == 1
+        assert "--changed-since" in capsys.readouterr().err
@@ -2,12 +2,19 @@
 
 import pytest
 
+from helpers import make_skill
+from evaluators.l1_structural import check_yaml_validity
 from discovery import (
     _parse_yaml_frontmatter,
     _extract_triggers_from_description,
     _extract_triggers_from_markdown,
     parse_skill_md,
     discover_skills,
+    build_skill_document,
+    _detect_pipeline_targets,
+    iter_skills,
+    parse_skill_frontmatter,
+    read_frontmatter,
 )
 
 # ──────────────────────────────────────────────
@@ -400,6 +407,47 @@ class TestParseSkillMdUnit:
         assert "helper.py" in result.script_files
 
 
+# ──────────────────────────────────────────────
+# SkillDocument
+# ──────────────────────────────────────────────
+
+class TestSkillDocument:
+
+    def test_build_document_splits_body_and_sections(self):
+        text = "---\nname: doc\n---\n## Usage\nrun it\n```bash\nls\n```\n"
+        doc = build_skill_document(text)
+        assert doc.text == text
+        assert doc.body.startswith("## Usage")
+        assert "Usage" in doc.sections
+        assert doc.code_blocks == [("bash", "ls\n")]
+        assert doc.line_count == len(text.split("\n"))
+
+    def test_parse_attaches_document(self, tmp_path):
+        """parse_skill_md 결과에 SkillDocument가 실려야 한다."""
+        (tmp_path / "SKILL.md").write_text(
+            "---\nname: doc-skill\n---\n## Quick Start\nbody\n", encoding="utf-8",
+        )
+        result = parse_skill_md(tmp_path)
+        assert result.document is not None
+        assert "Quick Start" in result.document.sections
+        assert result.section_headers == list(result.document.sections)
+
+    def test_layers_do_not_reread_skill_md(self, tmp_path):
+        """discovery 이후 SKILL.md가 사라져도 L4/L6는 document로 평가."""
+        from evaluators.l4_workflow import check_workflow_structure
+        from evaluators.l6_validation import check_faithfulness
+
+        (tmp_path / "SKILL.md").write_text(
+            "---\nname: cached\n---\nPhase 1 → Phase 2 → Phase 3\n```json\n{}\n```\n",
+            encoding="utf-8",
+        )
+        skill = parse_skill_md(tmp_path)
+        (tmp_path / "SKILL.md").unlink()
+
+        assert check_workflow_structure(skill).score > 0
+        assert "출력 형식" in check_faithfulness(skill).details
+
+
 # ──────────────────────────────────────────────
 # parse_skill_md - 통합 성격 테스트 (mock skill tree)
 # ──────────────────────────────────────────────
@@ -514,6 +562,43 @@ class TestDiscoverSkillsUnit:
         assert result[1].name == "beta"
         assert result[2].name == "gamma"
 
+    def test_discover_parallel_matches_sequential(self, tmp_path):
+        """workers > 1이어도 결과와 순서가 순차 탐지와 동일."""
+        for name in ["delta", "alpha", "charlie", "bravo"]:
+            d = tmp_path / name
+            d.mkdir()
+            (d / "SKILL.md").write_text(
+                f"---\nname: {name}\ndescription: {name} skill\n---\nsee alpha\n",
+                encoding="utf-8",
+            )
+        (tmp_path / "not-a-skill").mkdir()
+        (tmp_path / "README.md").write_text("# root file")
+
+        seq = discover_skills(tmp_path)
+        par = discover_skills(tmp_path, workers=4)
+        assert [s.name for s in par] == ["alpha", "bravo", "charlie", "delta"]
+        assert par == seq
+        assert [s.pipeline_targets for s in par] == [s.pipeline_targets for s in seq]
+
+    def test_parallel_prefetch_is_bounded(self, tmp_path, monkeypatch):
+        """workers > 1이어도 소비보다 workers * 4개 넘게 앞서 파싱하지 않는다."""
+        import discovery
+        for i in range(40):
+            make_skill(tmp_path, name=f"skill-{i:02d}")
+        parsed = []
+        real = discovery._parse_candidate
+
+        def _counting(child, *args):
+            parsed.append(child.name)
+            return real(child, *args)
+
+        monkeypatch.setattr(discovery, "_parse_candidate", _counting)
+        skills = iter_skills(tmp_path, workers=2)
+        assert next(skills).name == "skill-00"
+        assert len(parsed) <= 2 * 4 + 1
+        assert [s.name for s in skills] == [f"skill-{i:02d}" for i in range(1, 40)]
+        assert len(parsed) == 40
+
     def test_discover_skips_files_at_root(self, tmp_path):
         """root 레벨의 파일은 무시 (디렉토리만 탐색)."""
         (tmp_path / "SKILL.md").write_text("---\nname: root\n---\n", encoding="utf-8")
@@ -570,3 +655,157 @@ class TestDiscoverSkillsIntegration:
         for skill in skills:
             assert skill.name, f"Skill at {skill.skill_path} has empty name"
             # description이 빈 스킬도 있을 수 있지만 name은 필수
+
+
+# ──────────────────────────────────────────────
+# pipeline_targets 탐지
+# ──────────────────────────────────────────────
+
+class TestPipelineTargets:
+
+    def test_detect_preserves_name_order(self):
+        names = ["alpha", "beta", "gamma"]
+        body = "uses GAMMA then Alpha"
+        assert _detect_pipeline_targets(body, names) == ["alpha", "gamma"]
+
+    def test_discover_resolves_targets_excluding_self(self, tmp_path):
+        """다른 스킬 디렉토리명 참조만 pipeline_targets로 남는다."""
+        bodies = {
+            "lint-skill": "Pipeline: lint-skill → report-skill\n",
+            "report-skill": "standalone\n",
+            "cot-skill": "Use with LINT-SKILL and report-skill\n",
+        }
+        for name, body in bodies.items():
+            d = tmp_path / name
+            d.mkdir()
+            (d / "SKILL.md").write_text(f"---\nname: {name}\n---\n{body}", encoding="utf-8")
+
+        by_name = {s.name: s for s in discover_skills(tmp_path)}
+        assert by_name["lint-skill"].pipeline_targets == ["report-skill"]
+        assert by_name["report-skill"].pipeline_targets == []
+        assert by_name["cot-skill"].pipeline_targets == ["lint-skill", "report-skill"]
+
+
+# ──────────────────────────────────────────────
+# 재귀 탐색 + 무시 규칙
+# ──────────────────────────────────────────────
+
+def _write_skill(d, name=None):
+    d.mkdir(parents=True, exist_ok=True)
+    (d / "SKILL.md").write_text(f"---\nname: {name or d.name}\n---\n", encoding="utf-8")
+
+
+class TestRecursiveDiscovery:
+
+    def _make_monorepo(self, root):
+        _write_skill(root / "top-skill")
+        _write_skill(root / "team-a" / "lint")
+        _write_skill(root / "team-b" / "lint")
+        _write_skill(root / "team-b" / "deep" / "nested")
+        _write_skill(root / "node_modules" / "pkg")
+        _write_skill(root / "top-skill" / "inner")  # SKILL.md 찾은 뒤로는 내려가지 않음
+
+    def test_default_depth_is_direct_children(self, tmp_path):
+        self._make_monorepo(tmp_path)
+        assert [s.name for s in discover_skills(tmp_path)] == ["top-skill"]
+
+    def test_recursive_qualifies_nested_names(self, tmp_path):
+        self._make_monorepo(tmp_path)
+        names = [s.name for s in discover_skills(tmp_path, max_depth=0)]
+        assert names == ["team-a/lint", "team-b/deep/nested", "team-b/lint", "top-skill"]
+
+    def test_nested_skill_keeps_frontmatter_name_for_checks(self, tmp_path):
+        _write_skill(tmp_path / "foo")
+        _write_skill(tmp_path / "team-a" / "foo")
+        skills = discover_skills(tmp_path, max_depth=0)
+        assert [(s.name, s.local_name) for s in skills] == [("foo", "foo"), ("team-a/foo", "foo")]
+        flat, nested = (check_yaml_validity(s) for s in skills)
+        assert (nested.score, nested.details) == (flat.score, flat.details)
+
+    def test_max_depth_limits_walk(self, tmp_path):
+        self._make_monorepo(tmp_path)
+        names = [s.name for s in discover_skills(tmp_path, max_depth=2)]
+        assert names == ["team-a/lint", "team-b/lint", "top-skill"]
+
+    def test_ignore_patterns_prune_subtrees(self, tmp_path):
+        self._make_monorepo(tmp_path)
+        names = [s.name for s in discover_skills(tmp_path, max_depth=0, ignore_patterns=["team-b/"])]
+        assert names == ["team-a/lint", "top-skill"]
+
+    def test_negated_default_pattern(self, tmp_path):
+        self._make_monorepo(tmp_path)
+        names = [s.name for s in discover_skills(tmp_path, max_depth=0, ignore_patterns=["!node_modules"])]
+        assert "node_modules/pkg" in names
+
+    def test_skillignore_file(self, tmp_path):
+        self._make_monorepo(tmp_path)
+        (tmp_path / ".skillignore").write_text("# comment\n/team-a\ndeep/\n", encoding="utf-8")
+        names = [s.name for s in discover_skills(tmp_path, max_depth=0)]
+        assert names == ["team-b/lint", "top-skill"]
+
+    def test_parallel_recursive_order_matches_sequential(self, tmp_path):
+        self._make_monorepo(tmp_path)
+        seq = discover_skills(tmp_path, max_depth=0)
+        par = discover_skills(tmp_path, max_depth=0, workers=4)
+        assert [s.name for s in par] == [s.name for s in seq]
+
+
+class TestIgnorePatterns:
+
+    def test_compile_skips_comments_and_blanks(self):
+        from discovery import compile_ignore_patterns
+        assert compile_ignore_patterns(["", "# c", "build/"]) == [(False, False, "build")]
+
+    def test_anchored_vs_name_patterns(self):
+        from discovery import compile_ignore_patterns, _is_ignored
+        rules = compile_ignore_patterns(["/vendor", "**/cache", "*.egg-info"])
+        assert _is_ignored("vendor", "vendor", rules)
+        assert not _is_ignored("team/vendor", "vendor", rules)
+        assert _is_ignored("a/b/cache", "cache", rules)
+        assert _is_ignored("x.egg-info", "x.egg-info", rules)
+
+
+# ──────────────────────────────────────────────
+# metadata_only (frontmatter만 읽는 지연 로드)
+# ──────────────────────────────────────────────
+
+class TestMetadataOnly:
+
+    def test_frontmatter_read_stops_at_closing_marker(self, tmp_path):
+        """본문 뒤쪽의 깨진 바이트까지 읽지 않는다."""
+        skill_md = tmp_path / "SKILL.md"
+        skill_md.write_bytes(
+            b"---\nname: big\ndescription: d\n---\n" + b"line\n" * 50000 + b"\xff\xfe\n"
+        )
+        assert read_frontmatter(skill_md) == "---\nname: big\ndescription: d\n---\n"
+
+    def test_no_frontmatter(self, tmp_path):
+        (tmp_path / "SKILL.md").write_text("# Title\n---\n", encoding="utf-8")
+        assert read_frontmatter(tmp_path / "SKILL.md") == ""
+
+    def test_deferred_fields_load_on_first_access(self, tmp_path):
+        skill = make_skill(
+            tmp_path, name="lazy", triggers=["분석"], create_scripts=True,
+            skill_md_body="## When to Use\n- x\n",
+        )
+        lazy = parse_skill_frontmatter(skill.skill_path)
+        assert (lazy.name, lazy.description) == (skill.name, skill.description)
+        assert lazy.loader is not None
+
+        assert lazy.has_when_to_use is True
+        assert lazy.loader is None
+        assert lazy == parse_skill_md(skill.skill_path)
+        assert lazy.document is not None and lazy.inventory is not None
+
+    def test_not_a_skill(self, tmp_path):
+        assert parse_skill_frontmatter(tmp_path) is None
+
+    def test_only_accessed_skill_is_loaded(self, tmp_path):
+        _write_skill(tmp_path / "alpha")
+        _write_skill(tmp_path / "team" / "beta")
+        lazy = list(iter_skills(tmp_path, max_depth=0, metadata_only=True))
+        assert [s.name for s in lazy] == ["alpha", "team/beta"]
+        assert lazy[1].section_headers is not None
+        assert [s.loader is None for s in lazy] == [False, True]
+        # 로드해도 discovery가 한정한 이름은 유지
+        assert lazy[1].name == "team/beta"
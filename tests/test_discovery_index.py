@@ -0,0 +1,126 @@
+"""discovery_index.py 단위 테스트 — fingerprint 기반 discovery 캐시."""
+
+import json
+import os
+
+from discovery import discover_skills
+from discovery_index import DiscoveryIndex, compute_fingerprint, skill_from_dict, skill_to_dict
+from helpers import make_skill
+
+
+def _touch_later(path):
+    """mtime을 확실히 바꾸기 위해 1초 뒤로 설정."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestSerialization:
+
+    def test_roundtrip_equals_original(self, tmp_path):
+        skill = make_skill(
+            tmp_path, name="round", triggers=["alpha", "beta"],
+            create_scripts=True, create_references=True,
+            skill_md_body="## Quick Start\n```bash\nrun\n```\n",
+        )
+        restored = skill_from_dict(json.loads(json.dumps(skill_to_dict(skill))))
+        assert restored == skill
+        assert restored.document.text == skill.document.text
+        assert restored.document.sections == skill.document.sections
+
+
+class TestFingerprint:
+
+    def test_changes_when_skill_md_edited(self, tmp_path):
+        make_skill(tmp_path, name="fp")
+        before = compute_fingerprint(tmp_path / "fp")
+        (tmp_path / "fp" / "SKILL.md").write_text("---\nname: fp\n---\nlonger body\n", encoding="utf-8")
+        assert compute_fingerprint(tmp_path / "fp") != before
+
+    def test_changes_when_nested_script_added(self, tmp_path):
+        make_skill(tmp_path, name="fp", create_scripts=True)
+        sub = tmp_path / "fp" / "scripts" / "sub"
+        sub.mkdir()
+        before = compute_fingerprint(tmp_path / "fp")
+        (sub / "helper.py").write_text("# helper")
+        _touch_later(sub)
+        assert compute_fingerprint(tmp_path / "fp") != before
+
+
+class TestDiscoveryIndex:
+
+    def _make_root(self, tmp_path):
+        root = tmp_path / "skills"
+        root.mkdir()
+        make_skill(root, name="alpha", triggers=["a1"], create_scripts=True, skill_md_body="uses beta\n")
+        make_skill(root, name="beta", triggers=["b1"], create_references=True)
+        return root
+
+    def test_warm_run_reuses_cached_metadata(self, tmp_path):
+        root = self._make_root(tmp_path)
+        index_path = tmp_path / "index.json"
+
+        cold_index = DiscoveryIndex.load(index_path)
+        cold = discover_skills(root, index=cold_index)
+        cold_index.save()
+        assert cold_index.misses == 2
+
+        warm_index = DiscoveryIndex.load(index_path)
+        warm = discover_skills(root, index=warm_index)
+        assert warm_index.hits == 2
+        assert warm_index.misses == 0
+        assert warm == cold
+        assert warm[0].pipeline_targets == ["beta"]
+
+    def test_only_changed_skill_is_reparsed(self, tmp_path):
+        root = self._make_root(tmp_path)
+        index_path = tmp_path / "index.json"
+        index = DiscoveryIndex.load(index_path)
+        discover_skills(root, index=index)
+        index.save()
+
+        skill_md = root / "beta" / "SKILL.md"
+        skill_md.write_text("---\nname: beta\ndescription: changed\n---\n", encoding="utf-8")
+        _touch_later(skill_md)
+
+        index = DiscoveryIndex.load(index_path)
+        skills = discover_skills(root, index=index)
+        assert (index.hits, index.misses) == (1, 1)
+        assert skills[1].description == "changed"
+
+    def test_removed_skill_pruned_on_save(self, tmp_path):
+        root = self._make_root(tmp_path)
+        index_path = tmp_path / "index.json"
+        index = DiscoveryIndex.load(index_path)
+        discover_skills(root, index=index)
+        index.save()
+
+        for f in (root / "beta" / "references").iterdir():
+            f.unlink()
+        (root / "beta" / "references").rmdir()
+        (root / "beta" / "SKILL.md").unlink()
+        (root / "beta").rmdir()
+
+        index = DiscoveryIndex.load(index_path)
+        discover_skills(root, index=index)
+        index.save()
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+        assert list(data["skills"]) == [str(root / "alpha")]
+
+    def test_evaluator_version_change_invalidates(self, tmp_path):
+        root = self._make_root(tmp_path)
+        index_path = tmp_path / "index.json"
+        index = DiscoveryIndex.load(index_path)
+        discover_skills(root, index=index)
+        index.save()
+
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+        data["evaluator_version"] = "stale"
+        index_path.write_text(json.dumps(data), encoding="utf-8")
+
+        index = DiscoveryIndex.load(index_path)
+        assert index.entries == {}
+
+    def test_corrupt_index_ignored(self, tmp_path):
+        index_path = tmp_path / "index.json"
+        index_path.write_text("{not json", encoding="utf-8")
+        assert DiscoveryIndex.load(index_path).entries == {}
@@ -3,7 +3,7 @@
 import json
 
 from config_loader import load_eval_config
-from eval_config import DEFAULT_LAYER_WEIGHTS, EvalConfig
+from eval_config import DEFAULT_LAYER_WEIGHTS, DEFAULT_SECTION_TAXONOMY, EvalConfig
 
 
 class TestLoadEvalConfig:
@@ -58,3 +58,27 @@ class TestLoadEvalConfig:
             assert False, "Expected ValueError"
         except ValueError as e:
             assert "must be non-negative" in str(e)
+
+    def test_section_taxonomy_extends_defaults(self, tmp_path):
+        fp = tmp_path / "config.json"
+        fp.write_text(
+            json.dumps({"section_taxonomy": {"troubleshooting": ["troubleshoot", "문제\\s*해결"]}}),
+            encoding="utf-8",
+        )
+        cfg = load_eval_config(fp)
+        assert cfg.section_taxonomy["troubleshooting"] == ["troubleshoot", "문제\\s*해결"]
+        assert cfg.section_taxonomy["when_to_use"] == DEFAULT_SECTION_TAXONOMY["when_to_use"]
+
+    def test_invalid_section_pattern_raises(self, tmp_path):
+        fp = tmp_path / "config.json"
+        for taxonomy, message in (
+            ({"bad name": "x"}, "identifier"),
+            ({"broken": "(unclosed"}, "Invalid section pattern"),
+            ({"dup": "(?P<when_to_use>x)"}, "Cannot combine"),
+        ):
+            fp.write_text(json.dumps({"section_taxonomy": taxonomy}), encoding="utf-8")
+            try:
+                load_eval_config(fp)
+                assert False, "Expected ValueError"
+            except ValueError as e:
+                assert message in str(e)
@@ -522,6 +522,28 @@ class TestCLI:
         par_skills = sorted(data_par["skills"], key=lambda x: x["name"])
         assert seq_skills == par_skills
 
+    def test_cli_discovery_workers_results_equivalent(self, tmp_path):
+        """--discovery-workers 값과 무관하게 결과와 순서가 동일해야 한다."""
+        self._make_cli_skills_root(tmp_path)
+        cmd_base = [
+            sys.executable, str(EVALUATE_SCRIPT),
+            "--skills-root", str(tmp_path),
+            "--format", "json",
+        ]
+        seq = subprocess.run(cmd_base, capture_output=True, text=True, timeout=30)
+        par = subprocess.run(
+            cmd_base + ["--discovery-workers", "4"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        assert seq.returncode == 0, f"stderr: {seq.stderr}"
+        assert par.returncode == 0, f"stderr: {par.stderr}"
+        data_seq = json.loads(seq.stdout)
+        data_par = json.loads(par.stdout)
+        assert data_seq["skills"] == data_par["skills"]
+        assert data_seq["summary"] == data_par["summary"]
+
     def test_cli_workers_reproducible_across_runs(self, tmp_path):
         """동일 입력에서 --workers=2 결과가 반복 실행 간 동일해야 한다."""
         make_skill(
@@ -1,8 +1,10 @@
 """L2-L6 evaluator 단위 테스트."""
 
+import json
 import pytest
 from pathlib import Path
 
+from evaluators import base
 from models import MetricResult, LayerResult
 from helpers import make_skill
 
@@ -129,6 +131,38 @@ class TestL2Evaluate:
         assert result.layer == "L2"
         assert len(result.metrics) == 3
 
+    def test_benchmark_file_parsed_once_until_changed(self, tmp_path, monkeypatch):
+        bench_dir = tmp_path / "benchmarks"
+        (bench_dir / "L2_activation").mkdir(parents=True)
+        bench_file = bench_dir / "L2_activation" / "trigger_queries.json"
+        bench_file.write_text(json.dumps({"a": {"positive": ["q"]}}), encoding="utf-8")
+        parses = []
+        monkeypatch.setattr(base.json, "loads", lambda text: parses.append(text) or json.JSONDecoder().decode(text))
+
+        assert base.load_benchmark(bench_dir, "L2_activation/trigger_queries.json") == {"a": {"positive": ["q"]}}
+        base.load_benchmark(bench_dir, "L2_activation/trigger_queries.json")
+        assert len(parses) == 1
+        bench_file.write_text(json.dumps({"a": {}, "b": {}}), encoding="utf-8")
+        assert set(base.load_benchmark(bench_dir, "L2_activation/trigger_queries.json")) == {"a", "b"}
+        assert base.load_benchmark(bench_dir, "missing.json") == {}
+
+    def test_benchmark_entry_prefers_qualified_then_frontmatter_name(self, tmp_path):
+        bench_dir = tmp_path / "benchmarks"
+        (bench_dir / "L2_activation").mkdir(parents=True)
+        (bench_dir / "L2_activation" / "trigger_queries.json").write_text(
+            json.dumps({"lint": {"positive": ["plain"]}, "team-b/lint": {"positive": ["qualified"]}}),
+            encoding="utf-8",
+        )
+        skills = {}
+        for team in ("team-a", "team-b"):
+            (tmp_path / team).mkdir()
+            skill = make_skill(tmp_path / team, name="lint")
+            skill.qualifier, skill.name = team, f"{team}/lint"
+            skills[team] = skill
+        rel = "L2_activation/trigger_queries.json"
+        assert base.benchmark_entry(bench_dir, rel, skills["team-a"]) == {"positive": ["plain"]}
+        assert base.benchmark_entry(bench_dir, rel, skills["team-b"]) == {"positive": ["qualified"]}
+
 
 # ══════════════════════════════════════════════
 # L3: 검색 품질
@@ -0,0 +1,134 @@
+"""file_access.py 단위 테스트 + 평가기 크기 제한/mmap 경로."""
+
+import mmap
+
+import pytest
+
+import file_access
+from evaluators.base import iter_script_buffers, iter_scripts
+from evaluators.l1_structural import check_resource_independence
+from evaluators.l3_retrieval import check_reference_content_validity
+from evaluators.l5_execution import check_cli_interface, check_docstrings, check_shebang
+from evaluators.l6_validation import check_error_handling, check_verification_infra
+from file_access import ScanPattern, contains, head, open_buffer, set_max_file_size
+from helpers import make_skill
+
+
+SCRIPT = '#!/usr/bin/env python3\n"""모듈 설명."""\nimport argparse\nimport sys\n'
+PADDING = "# " + "x" * 78 + "\n"
+
+
+@pytest.fixture
+def small_mmap_threshold(monkeypatch):
+    """mmap 경로를 작은 파일로 검증하도록 임계값을 낮춘다."""
+    monkeypatch.setattr(file_access, "MMAP_THRESHOLD", 64)
+
+
+@pytest.fixture
+def restore_cap():
+    yield
+    set_max_file_size(file_access.DEFAULT_MAX_FILE_SIZE)
+
+
+def _big_script(body: str = "") -> str:
+    return SCRIPT + body + PADDING * 50
+
+
+class TestScanHelpers:
+
+    def test_scan_pattern_str_and_bytes(self):
+        pat = ScanPattern(r"except\s+\w+")
+        assert pat.search("try:\n    x\nexcept ValueError:\n")
+        assert pat.search(b"except KeyError:")
+        assert not pat.search(b"except:")
+
+    def test_contains_uses_find_for_mmap(self, tmp_path):
+        path = tmp_path / "f.py"
+        path.write_bytes(b"import sys\nsys.exit(1)\n")
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            assert contains(mm, "sys.exit")
+            assert not contains(mm, "argparse")
+        assert contains("abc", "bc")
+
+    def test_head_decodes_bytes(self):
+        assert head("#!/bin/sh\n", 2) == "#!"
+        assert head("한글".encode("utf-8")) == "한글"
+
+
+class TestOpenBuffer:
+
+    def test_small_file_is_text(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={"a.py": SCRIPT})
+        inventory = skill.inventory
+        entry = inventory.get("scripts/a.py")
+        with open_buffer(inventory, entry) as buf:
+            assert buf == SCRIPT
+
+    def test_large_file_is_mmap(self, tmp_path, small_mmap_threshold):
+        skill = make_skill(tmp_path, script_contents={"a.py": _big_script()})
+        inventory = skill.inventory
+        with open_buffer(inventory, inventory.get("scripts/a.py")) as buf:
+            assert isinstance(buf, mmap.mmap)
+            assert head(buf).startswith("#!")
+
+
+class TestSizeCap:
+
+    def test_iter_scripts_reports_capped(self, tmp_path, restore_cap):
+        skill = make_skill(tmp_path, script_contents={
+            "small.py": SCRIPT, "huge.py": _big_script(),
+        })
+        set_max_file_size(1024)
+        capped = []
+        names = [p.name for p, _ in iter_scripts(skill, capped=capped)]
+        assert names == ["small.py"]
+        assert [e.name for e in capped] == ["huge.py"]
+
+    def test_zero_means_unlimited(self, tmp_path, restore_cap):
+        skill = make_skill(tmp_path, script_contents={"huge.py": _big_script()})
+        set_max_file_size(0)
+        capped = []
+        assert len(list(iter_script_buffers(skill, capped=capped))) == 1
+        assert capped == []
+
+    def test_capped_files_in_metric_details(self, tmp_path, restore_cap):
+        skill = make_skill(
+            tmp_path,
+            script_contents={"small.py": SCRIPT, "huge.py": _big_script()},
+            reference_contents={"dump.json": "[" + "0," * 2000 + "0]", "guide.md": "# Guide\n"},
+        )
+        set_max_file_size(1024)
+        for check in (check_resource_independence, check_shebang, check_cli_interface,
+                      check_docstrings, check_verification_infra, check_error_handling):
+            result = check(skill)
+            assert "크기 제한" in result.details and "huge.py" in result.details, check.__name__
+
+        shebang = check_shebang(skill)
+        assert "shebang 1/1" in shebang.details
+
+        refs = check_reference_content_validity(skill)
+        assert "dump.json" in refs.details
+        assert "invalid JSON" not in refs.details
+
+
+class TestMmapScan:
+    """mmap 경로의 결과가 문자열 경로와 같아야 한다."""
+
+    def test_checks_match_text_path(self, tmp_path, monkeypatch):
+        body = (
+            'BASE = "/home/someone/data/"\n'
+            "parser = argparse.ArgumentParser()\n"
+            "parser.add_argument('--verify')\n"
+            "try:\n    pass\nexcept OSError:\n    sys.exit(1)\n"
+        )
+        skill = make_skill(tmp_path, script_contents={"check_tool.py": _big_script(body)})
+        checks = (check_resource_independence, check_shebang, check_cli_interface,
+                  check_docstrings, check_verification_infra, check_error_handling)
+        as_text = [check(skill) for check in checks]
+
+        monkeypatch.setattr(file_access, "MMAP_THRESHOLD", 64)
+        as_mmap = [check(skill) for check in checks]
+
+        assert [(r.score, r.details) for r in as_mmap] == [(r.score, r.details) for r in as_text]
+        assert as_text[0].details.count("하드코딩 경로 발견") == 1
+        assert as_text[-1].score == 30
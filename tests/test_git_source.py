@@ -0,0 +1,134 @@
+"""git_source.py + --rev 평가 단위 테스트."""
+
+import json
+import pickle
+import shutil
+import subprocess
+
+import pytest
+
+import orchestrator
+from discovery import discover_skills
+from evaluators import LAYERS
+from git_source import GitSource
+from helpers import make_skill
+from test_orchestrator import _make_args
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+def _commit_all(repo, message):
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+def _evaluate_all(skills):
+    return {
+        (s.name, lid): [(m.name, m.score, m.details) for m in fn(s, all_skills=skills).metrics]
+        for s in skills for lid, fn in LAYERS.items()
+    }
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """skills/ 아래 스킬 2개를 커밋한 저장소 → (repo, skills_root, 첫 커밋 sha)."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    root = repo / "skills"
+    root.mkdir()
+    make_skill(
+        root, name="alpha", triggers=["분석"],
+        script_contents={"run.py": 'import argparse\n"""doc"""\n'},
+        reference_contents={"guide.md": "# Guide\n"},
+    )
+    make_skill(root, name="beta", triggers=["정리"])
+    sha = _commit_all(repo, "init")
+    return repo, root, sha
+
+
+class TestGitSource:
+    def test_listing_is_relative_to_skills_root(self, repo):
+        _, root, sha = repo
+        source = GitSource.open(root, sha)
+        paths = [p for p, _, _ in source.listing()]
+        assert "alpha/SKILL.md" in paths
+        assert "alpha/scripts/run.py" in paths
+        assert source.read_bytes("alpha/scripts/run.py").startswith(b"import argparse")
+
+    def test_single_batch_process_is_reused(self, repo):
+        _, root, sha = repo
+        source = GitSource.open(root, sha)
+        source.read_bytes("alpha/SKILL.md")
+        proc = source._proc
+        source.read_bytes("beta/SKILL.md")
+        assert source._proc is proc
+        source.close()
+        assert proc.poll() is not None
+
+    def test_bad_revision_raises_value_error(self, repo):
+        _, root, _ = repo
+        with pytest.raises(ValueError):
+            GitSource.open(root, "no-such-rev")
+
+    def test_picklable(self, repo):
+        _, root, sha = repo
+        source = GitSource.open(root, sha)
+        source.read_bytes("alpha/SKILL.md")
+        data = pickle.dumps(source)
+        assert b"alpha/SKILL.md" not in data  # 트리 목록은 피클에 실리지 않는다
+        assert pickle.loads(data) is source  # 같은 프로세스에서는 공유 소스로 풀린다
+        expected = source.read_bytes("beta/SKILL.md")
+        source.close()
+
+        clone = pickle.loads(data)  # 워커처럼 트리를 나열하지 않은 새 소스
+        assert clone is not source and not clone.listing()
+        assert clone.read_bytes("beta/SKILL.md") == expected
+        assert pickle.loads(data) is clone
+        with pytest.raises(FileNotFoundError):
+            clone.read_bytes("missing/SKILL.md")
+        clone.close()
+
+
+class TestRevisionDiscovery:
+    def test_historical_state_matches_checkout(self, repo):
+        """작업 트리를 바꾼 뒤에도 --rev 평가는 커밋 당시 디렉토리 평가와 같다."""
+        repo_dir, root, sha = repo
+        before = _evaluate_all(discover_skills(root))
+
+        shutil.rmtree(root / "alpha" / "scripts")
+        make_skill(root, name="gamma")
+        _commit_all(repo_dir, "change")
+
+        source = GitSource.open(root, sha)
+        skills = discover_skills(root, source=source)
+        assert [s.name for s in skills] == ["alpha", "beta"]
+        assert skills[0].script_files == ("run.py",)
+        assert _evaluate_all(skills) == before
+        source.close()
+
+    def test_run_with_rev(self, repo, tmp_path, monkeypatch, capsys):
+        repo_dir, root, sha = repo
+        shutil.rmtree(root / "beta")
+        _commit_all(repo_dir, "drop beta")
+
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"layer_weights": {"L1": 1.0}}), encoding="utf-8")
+        args = _make_args(root, config_path)
+        args.rev = sha
+        assert orchestrator.run(args) == 0
+        data = json.loads(capsys.readouterr().out)
+        assert [s["name"] for s in data["skills"]] == ["alpha", "beta"]
+
+        args.rev = "no-such-rev"
+        assert orchestrator.run(args) == 1
+        assert "Cannot read revision" in capsys.readouterr().err
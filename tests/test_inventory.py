@@ -0,0 +1,99 @@
+"""inventory.py 단위 테스트 — scandir 1회 순회 파일 인벤토리."""
+
+import os
+
+import pytest
+
+from inventory import build_inventory
+from discovery import parse_skill_md
+from evaluators.base import get_inventory, iter_scripts
+
+
+def _make_tree(root):
+    (root / "SKILL.md").write_text("---\nname: inv\n---\n", encoding="utf-8")
+    (root / "DESIGN_DECISION.md").write_text("# d", encoding="utf-8")
+    (root / "scripts" / "sub").mkdir(parents=True)
+    (root / "scripts" / "main.py").write_text("print(1)\n", encoding="utf-8")
+    (root / "scripts" / "bridge_x.py").write_text("# bridge\n", encoding="utf-8")
+    (root / "scripts" / "sub" / "helper.py").write_text("# helper\n", encoding="utf-8")
+    (root / "scripts" / "notes.txt").write_text("n", encoding="utf-8")
+    (root / "references" / "nested").mkdir(parents=True)
+    (root / "references" / "api.md").write_text("# API\n", encoding="utf-8")
+    (root / "references" / "nested" / "deep.md").write_text("# deep\n", encoding="utf-8")
+    (root / "tests").mkdir()
+    (root / "tests" / "test_x.py").write_text("", encoding="utf-8")
+
+
+class TestBuildInventory:
+
+    def test_top_level_presence(self, tmp_path):
+        _make_tree(tmp_path)
+        inv = build_inventory(tmp_path)
+        assert inv.has_file("SKILL.md")
+        assert inv.has_file("DESIGN_DECISION.md")
+        assert inv.has_dir("scripts")
+        assert inv.has_dir("tests")
+        assert not inv.has_dir("bridges")
+        assert not inv.has_file("scripts")
+
+    def test_files_recursive_and_sorted(self, tmp_path):
+        _make_tree(tmp_path)
+        inv = build_inventory(tmp_path)
+        py = [e.rel_path for e in inv.files("scripts", ".py")]
+        assert py == ["scripts/bridge_x.py", "scripts/main.py", "scripts/sub/helper.py"]
+        top_only = [e.name for e in inv.files("scripts", ".py", recursive=False)]
+        assert top_only == ["bridge_x.py", "main.py"]
+
+    def test_non_recursive_references(self, tmp_path):
+        _make_tree(tmp_path)
+        inv = build_inventory(tmp_path)
+        assert [e.name for e in inv.files("references", recursive=False)] == ["api.md"]
+
+    def test_entry_metadata(self, tmp_path):
+        _make_tree(tmp_path)
+        entry = build_inventory(tmp_path).get("scripts/main.py")
+        assert entry.kind == "file"
+        assert entry.size == len("print(1)\n")
+        assert entry.mtime_ns > 0
+        assert entry.stem == "main"
+        assert entry.top == "scripts"
+
+    def test_tests_dir_not_descended(self, tmp_path):
+        _make_tree(tmp_path)
+        assert build_inventory(tmp_path).get("tests/test_x.py") is None
+
+    def test_missing_dir_is_empty(self, tmp_path):
+        inv = build_inventory(tmp_path / "nope")
+        assert inv.entries == ()
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlink unsupported")
+    def test_symlink_loop_not_followed(self, tmp_path):
+        _make_tree(tmp_path)
+        os.symlink(tmp_path / "scripts", tmp_path / "scripts" / "sub" / "loop")
+        inv = build_inventory(tmp_path)
+        assert inv.get("scripts/sub/loop/main.py") is None
+
+
+class TestInventoryConsumers:
+
+    def test_parse_uses_inventory(self, tmp_path):
+        _make_tree(tmp_path)
+        skill = parse_skill_md(tmp_path)
+        assert skill.inventory is not None
+        assert skill.script_files == ("bridge_x.py", "main.py", "helper.py")
+        assert skill.reference_files == ("api.md",)
+        assert skill.has_design_decision is True
+
+    def test_get_inventory_builds_lazily(self, tmp_path):
+        _make_tree(tmp_path)
+        skill = parse_skill_md(tmp_path)
+        skill.inventory = None
+        inv = get_inventory(skill)
+        assert inv.has_dir("scripts")
+        assert skill.inventory is inv
+
+    def test_iter_scripts_reads_from_inventory(self, tmp_path):
+        _make_tree(tmp_path)
+        skill = parse_skill_md(tmp_path)
+        names = [p.name for p, _ in iter_scripts(skill)]
+        assert names == ["bridge_x.py", "main.py", "helper.py"]
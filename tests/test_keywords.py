@@ -0,0 +1,85 @@
+"""keywords.py 단위 테스트."""
+
+import pickle
+
+from discovery import SkillMetadata
+from evaluators.ecosystem import check_trigger_ecosystem_health
+from evaluators.l2_activation import check_trigger_overlap
+from keywords import KEYWORDS, KeywordTable
+from models import TriggerInfo
+
+
+def _skill(name, keywords):
+    return SkillMetadata(
+        name=name, description="", skill_path=f"/s/{name}",
+        triggers=TriggerInfo(keywords=keywords, source="yaml_description"),
+    )
+
+
+class TestKeywordTable:
+
+    def test_ids_are_stable_and_case_insensitive(self):
+        table = KeywordTable()
+        assert table.intern("Deploy") == table.intern("deploy") == 0
+        assert table.intern("배포") == 1
+        assert len(table) == 2
+        assert table.word(0) == "deploy"
+
+    def test_intern_all_sorted_unique(self):
+        table = KeywordTable()
+        table.intern("b")
+        ids, words = table.intern_all(["C", "a", "B", "c"])
+        assert ids == (0, 1, 2)
+        assert words == ("b", "c", "a")
+
+    def test_lookup_does_not_insert(self):
+        table = KeywordTable()
+        table.intern("x")
+        assert table.lookup(["X", "y"]) == frozenset({0})
+        assert len(table) == 1
+
+
+class TestTriggerInfoIds:
+
+    def test_trigger_info_carries_global_ids(self):
+        a = TriggerInfo(keywords=["Lint", "Format"], source="yaml_description")
+        b = TriggerInfo(keywords=["lint"], source="markdown_section")
+        assert set(a.keyword_ids) & set(b.keyword_ids) == {KEYWORDS.intern("lint")}
+        assert list(a.keyword_ids) == sorted(a.keyword_ids)
+
+    def test_ids_survive_pickling(self):
+        info = TriggerInfo(keywords=["pickle-me"], source="both")
+        clone = pickle.loads(pickle.dumps(info))
+        assert clone.keyword_ids == info.keyword_ids
+        assert clone.normalized == ("pickle-me",)
+
+
+class TestConsumers:
+
+    def test_overlap_is_case_insensitive(self):
+        a = _skill("a", ["Deploy", "rollout"])
+        b = _skill("b", ["deploy"])
+        result = check_trigger_overlap(a, [a, b])
+        assert result.details.startswith("중복 1개 (50%)")
+
+    def test_case_variants_within_skill_count_as_overlap(self):
+        """한 스킬 안의 대소문자 변형도 (기존 집계대로) 중복으로 센다."""
+        skills = [_skill("a", ["Sync", "sync"]), _skill("b", ["other"])]
+        metric = check_trigger_ecosystem_health(skills)
+        assert metric.affected_skills == ["sync"]
+
+    def test_ecosystem_reports_normalized_words(self):
+        skills = [_skill("a", ["Cache", "x1"]), _skill("b", ["cache"])]
+        metric = check_trigger_ecosystem_health(skills)
+        assert metric.affected_skills == ["cache"]
+
+    def test_ecosystem_overlap_in_first_seen_order(self):
+        """중복 키워드는 처음 나온 순서로 보고한다 (키워드 id나 문자열 순이 아님)."""
+        skills = [_skill("a", ["zeta-kw", "alpha-kw"]), _skill("b", ["alpha-kw", "zeta-kw"])]
+        metric = check_trigger_ecosystem_health(skills)
+        assert metric.affected_skills == ["zeta-kw", "alpha-kw"]
+
+    def test_keywords_stored_as_tuple(self):
+        info = TriggerInfo(keywords=["a", "b"], source="both")
+        assert info.keywords == ("a", "b")
+        assert hash(info) == hash(TriggerInfo(keywords=("a", "b"), source="both"))
@@ -0,0 +1,100 @@
+"""markdown_scan.py 단위 테스트."""
+
+import time
+
+from markdown_scan import scan_markdown
+
+
+def _sections(text):
+    scan = scan_markdown(text)
+    return {h: text[s:e] for h, s, e in scan.sections}
+
+
+def _blocks(text):
+    scan = scan_markdown(text)
+    return [(lang, text[s:e]) for lang, s, e in scan.code_blocks]
+
+
+class TestFrontmatter:
+    def test_body_starts_after_closing_marker(self):
+        text = "---\nname: a\n---\n## Body\n"
+        scan = scan_markdown(text)
+        assert text[:scan.frontmatter_end] == "---\nname: a\n---\n"
+        assert text[scan.body_start:] == "## Body\n"
+
+    def test_unclosed_frontmatter(self):
+        """닫는 ---가 없으면 YAML 구간은 전체, 본문도 전체."""
+        text = "---\nname: a\n## Body\n"
+        scan = scan_markdown(text)
+        assert scan.frontmatter_end == len(text)
+        assert scan.body_start == 0
+
+    def test_no_frontmatter(self):
+        scan = scan_markdown("# Title\n")
+        assert (scan.frontmatter_end, scan.body_start) == (0, 0)
+
+
+class TestSections:
+    def test_section_spans(self):
+        text = "---\nname: a\n---\n# T\n## 개요\n내용 1\n\n## 사용법\n내용 2\n"
+        assert _sections(text) == {"개요": "내용 1\n", "사용법": "내용 2\n"}
+
+    def test_frontmatter_headers_ignored(self):
+        assert _sections("---\n## 가짜\n---\n## 진짜\nx") == {"진짜": "x"}
+
+    def test_first_line_header_without_frontmatter(self):
+        assert _sections("## A\na\n## B") == {"A": "a", "B": ""}
+
+
+class TestCodeBlocks:
+    def test_lang_and_content(self):
+        text = "```python\nprint(1)\n```\n```\nplain\n```\n"
+        assert _blocks(text) == [("python", "print(1)\n"), ("", "plain\n")]
+
+    def test_closes_mid_line(self):
+        assert _blocks("```sh\nls ```tail\n") == [("sh", "ls ")]
+
+    def test_fence_needs_newline_after_lang(self):
+        assert _blocks("```python code```\n") == []
+
+    def test_unclosed_fence_is_dropped(self):
+        assert _blocks("```python\nx = 1\n") == []
+
+    def test_long_backtick_run_reopens(self):
+        """닫는 run에 ```가 더 남아 있으면 그 자리에서 다시 열린다."""
+        assert _blocks("```a\nx\n``````b\ny\n```") == [("a", "x\n"), ("b", "y\n")]
+
+
+class TestChecklist:
+    def test_offsets_and_state(self):
+        text = "- [ ] 하나\n- [x] 둘\n- [X] 대문자 제외\n"
+        scan = scan_markdown(text)
+        assert scan.checklist == ((0, False), (text.index("- [x]"), True))
+
+
+class TestTriggerSpan:
+    def _span_text(self, text):
+        scan = scan_markdown(text)
+        return text[slice(*scan.trigger_span)] if scan.trigger_span else None
+
+    def test_list_after_header(self):
+        text = "## 트리거\n설명\n- 분석\n- 정리\n\n## 다음\n- 무관\n"
+        assert self._span_text(text) == "- 분석\n- 정리"
+
+    def test_no_list(self):
+        assert self._span_text("## 트리거\n설명만 있음\n") is None
+
+    def test_dash_without_space_fallback(self):
+        assert self._span_text("## 트리거\n-분석\n") == "-분석"
+
+    def test_header_must_end_line(self):
+        assert self._span_text("## 트리거 키워드\n- 분석\n") is None
+
+    def test_repeated_headers_linear(self):
+        """목록 없는 트리거 헤더가 반복돼도 선형 시간."""
+        text = "## 트리거\n설명 줄\n" * 20000
+        start = time.perf_counter()
+        scan = scan_markdown(text)
+        assert time.perf_counter() - start < 1.0
+        assert scan.trigger_span is None
+        assert len(scan.sections) == 20000
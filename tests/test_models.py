@@ -36,6 +36,23 @@ class TestMetricResult:
         m = MetricResult(name="full", score=30.0, max_score=30.0, details="perfect")
         assert m.score == m.max_score
 
+    def test_frozen_slotted_and_interned(self):
+        """인스턴스 dict 없음, 수정 불가, 같은 메트릭명은 같은 객체로 공유."""
+        import dataclasses
+        a = MetricResult(name="".join(["yaml_", "validity"]), score=1.0, max_score=1.0, details="ok")
+        b = MetricResult(name="yaml_validity", score=0.0, max_score=1.0, details="ok")
+        assert not hasattr(a, "__dict__")
+        assert a.name is b.name
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            a.score = 2.0
+
+    def test_pickle_roundtrip(self):
+        import pickle
+        lr = LayerResult(layer="L1", skill_name="s")
+        lr.metrics = [MetricResult(name="m", score=1.0, max_score=2.0, details="d", passed=False)]
+        lr.compute_score()
+        assert pickle.loads(pickle.dumps(lr)) == lr
+
 
 # ──────────────────────────────────────────────
 # LayerResult
@@ -125,15 +142,15 @@ class TestSkillMetadata:
         )
         assert meta.name == "my-skill"
         assert meta.description == "A test skill"
-        assert meta.triggers.keywords == ["test"]
+        assert meta.triggers.keywords == ("test",)
         assert meta.triggers.source == "yaml_description"
         assert meta.has_scripts_dir is False
         assert meta.has_references_dir is False
         assert meta.has_bridges_dir is False
         assert meta.has_tests_dir is False
         assert meta.has_design_decision is False
-        assert meta.script_files == []
-        assert meta.reference_files == []
+        assert meta.script_files == ()
+        assert meta.reference_files == ()
         assert meta.skill_md_lines == 0
 
     def test_create_full(self):
@@ -165,14 +182,12 @@ class TestSkillMetadata:
         assert len(t.keywords) == 3
         assert t.source == "markdown_section"
 
-    def test_default_list_fields_independent(self):
-        """기본 list 필드가 인스턴스 간 공유되지 않는지 확인."""
+    def test_file_lists_are_tuples(self):
+        """파일 목록은 list로 넘겨도 tuple로 보관 (불변이라 인스턴스 간 공유 안전)."""
         trigger = TriggerInfo(keywords=[], source="yaml_description")
-        m1 = SkillMetadata(
+        meta = SkillMetadata(
             name="s1", description="", skill_path=Path("/tmp/s1"), triggers=trigger,
+            script_files=["main.py"], reference_files=["guide.md"],
         )
-        m2 = SkillMetadata(
-            name="s2", description="", skill_path=Path("/tmp/s2"), triggers=trigger,
-        )
-        m1.script_files.append("added.py")
-        assert "added.py" not in m2.script_files
+        assert meta.script_files == ("main.py",)
+        assert meta.reference_files == ("guide.md",)
@@ -1,10 +1,16 @@
 """orchestrator.py 단위 테스트."""
 
 import json
+import threading
+import time
 from argparse import Namespace
 
+import pytest
+
 import orchestrator
+from discovery import discover_skills
 from models import LayerResult, MetricResult
+from result_cache import ResultCache
 
 
 def _make_args(tmp_path, config_path, fail_fast=False):
@@ -23,6 +29,19 @@ def _make_args(tmp_path, config_path, fail_fast=False):
         diff=None,
         show_history=False,
         workers=1,
+        io_workers=None,
+        discovery_workers=1,
+        discovery_index=None,
+        max_depth=1,
+        ignore=None,
+        rev=None,
+        max_file_size=16,
+        analysis_cache=None,
+        result_cache=None,
+        changed_since=None,
+        layer_timings=None,
+        layer_timeout=None,
+        skill_timeout=None,
         fail_fast=fail_fast,
     )
 
@@ -129,3 +148,397 @@ def test_run_fails_when_layer_weights_missing_for_selected_layers(tmp_path, monk
     assert "[ERROR]" in captured.err
     assert "Missing layer weights" in captured.err
     assert "L7" in captured.err
+
+
+def test_run_streams_per_skill_layers_before_discovery_finishes(tmp_path, monkeypatch, capsys):
+    """스킬 단위 레이어는 발견 즉시 평가되고, L2는 discovery 완료 후 실행된다."""
+    _make_skill_dir(tmp_path, "alpha")
+    _make_skill_dir(tmp_path, "beta")
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"layer_weights": {"L1": 1.0, "L2": 1.0}}),
+        encoding="utf-8",
+    )
+
+    events = []
+    real_iter_skills = orchestrator.iter_skills
+
+    def recording_iter_skills(*args, **kwargs):
+        for skill in real_iter_skills(*args, **kwargs):
+            events.append(("discovered", skill.name))
+            yield skill
+
+    def fake_l1(skill, **kwargs):
+        events.append(("L1", skill.name))
+        return _ok_layer_result(skill.name)
+
+    def fake_l2(skill, all_skills=None, **kwargs):
+        events.append(("L2", skill.name, len(all_skills)))
+        lr = _ok_layer_result(skill.name)
+        lr.layer = "L2"
+        return lr
+
+    monkeypatch.setattr(orchestrator, "iter_skills", recording_iter_skills)
+    monkeypatch.setattr(orchestrator, "LAYERS", {"L1": fake_l1, "L2": fake_l2})
+    args = _make_args(tmp_path, config_path)
+    args.layer = "L2,L1"
+
+    rc = orchestrator.run(args)
+    assert rc == 0
+    assert events == [
+        ("discovered", "alpha"), ("L1", "alpha"),
+        ("discovered", "beta"), ("L1", "beta"),
+        ("L2", "alpha", 2), ("L2", "beta", 2),
+    ]
+
+    data = json.loads(capsys.readouterr().out)
+    assert [s["name"] for s in data["skills"]] == ["alpha", "beta"]
+    # 레이어 순서는 요청한 layer_ids 순서를 유지
+    assert list(data["skills"][0]["layers"]) == ["L2", "L1"]
+
+
+def test_run_skill_filter_still_reports_missing_skill(tmp_path, monkeypatch, capsys):
+    _make_skill_dir(tmp_path, "alpha")
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"layer_weights": {"L1": 1.0}}), encoding="utf-8")
+
+    monkeypatch.setattr(orchestrator, "LAYERS", {"L1": lambda skill, **k: _ok_layer_result(skill.name)})
+    args = _make_args(tmp_path, config_path)
+    args.skill = "missing"
+
+    rc = orchestrator.run(args)
+    assert rc == 1
+    assert "Skill 'missing' not found" in capsys.readouterr().err
+
+
+def test_run_skill_filter_loads_only_selected_skill(tmp_path, capsys):
+    """--skill이면 다른 스킬은 frontmatter만 읽는다 (본문이 깨져 있어도 무관)."""
+    _make_skill_dir(tmp_path, "alpha")
+    (tmp_path / "broken").mkdir()
+    (tmp_path / "broken" / "SKILL.md").write_bytes(b"---\nname: broken\n---\n\xff\xfe body\n")
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"layer_weights": {"L1": 1.0}}), encoding="utf-8")
+
+    args = _make_args(tmp_path, config_path)
+    args.skill = "alpha"
+    assert orchestrator.run(args) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert [s["name"] for s in data["skills"]] == ["alpha"]
+    assert data["skills"][0]["layers"]["L1"]["metrics"][0]["name"] != "runtime_error"
+
+
+def test_cross_skill_layer_with_workers_matches_sequential(tmp_path, capsys):
+    """2단계는 공유 컨텍스트(워커당 1회) + 인덱스 작업으로 실행되며 결과는 순차와 같다."""
+    for name in ("alpha", "beta", "gamma"):
+        _make_skill_dir(tmp_path, name)
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"layer_weights": {"L1": 0.5, "L2": 0.5}}), encoding="utf-8")
+    args = _make_args(tmp_path, config_path)
+    args.layer = "L1,L2"
+
+    assert orchestrator.run(args) == 0
+    sequential = json.loads(capsys.readouterr().out)["skills"]
+    args.workers = 2
+    assert orchestrator.run(args) == 0
+    assert json.loads(capsys.readouterr().out)["skills"] == sequential
+
+
+def test_evaluate_shared_resolves_skill_index(tmp_path, monkeypatch):
+    for name in ("alpha", "beta"):
+        _make_skill_dir(tmp_path, name)
+    skills = discover_skills(tmp_path)
+    seen = []
+
+    def _l2(skill, all_skills=None, **kwargs):
+        seen.append((skill.name, [s.name for s in all_skills]))
+        return _ok_layer_result(skill.name)
+
+    monkeypatch.setattr(orchestrator, "LAYERS", {"L2": _l2})
+    monkeypatch.setattr(orchestrator, "_SHARED", (skills, skills, None, False))
+    assert orchestrator._evaluate_shared((1, ["L2"], None))[0] == "beta"
+    assert seen == [("beta", ["alpha", "beta"])]
+
+
+def test_io_layers_run_on_threads_alongside_cpu_layers(tmp_path, monkeypatch):
+    """RESOURCE_IO 레이어는 스레드 풀, 나머지는 (프로세스 풀이 없으면) 메인 스레드에서 평가."""
+    for name in ("alpha", "beta", "gamma"):
+        _make_skill_dir(tmp_path, name)
+    ran_on = []
+
+    def _layer(lid):
+        def _evaluate(skill, **kwargs):
+            ran_on.append((skill.name, lid, threading.current_thread().name.startswith("io-layer")))
+            return _ok_layer_result(skill.name)
+        return _evaluate
+
+    monkeypatch.setattr(orchestrator, "LAYERS", {lid: _layer(lid) for lid in ("L1", "L4", "L5")})
+    skills, results = orchestrator._collect_results_streaming(
+        iter(discover_skills(tmp_path)), ["L1", "L4", "L5"], None, False, 1, io_threads=2,
+    )
+    assert [s.name for s in skills] == ["alpha", "beta", "gamma"]
+    assert all(list(layers) == ["L1", "L4", "L5"] for layers in results.values())
+    assert {(lid, threaded) for _, lid, threaded in ran_on} == {("L1", True), ("L4", True), ("L5", False)}
+
+
+def test_run_workers_auto_matches_sequential(tmp_path, capsys):
+    for name in ("alpha", "beta"):
+        _make_skill_dir(tmp_path, name)
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"layer_weights": {"L1": 0.5, "L5": 0.5}}), encoding="utf-8")
+    args = _make_args(tmp_path, config_path)
+    args.layer = "L1,L5"
+
+    assert orchestrator.run(args) == 0
+    sequential = json.loads(capsys.readouterr().out)["skills"]
+    args.workers = "auto"
+    assert orchestrator.run(args) == 0
+    captured = capsys.readouterr()
+    assert "--workers auto:" in captured.err
+    assert json.loads(captured.out)["skills"] == sequential
+
+
+def test_workers_sets_processes_only_and_io_workers_adds_threads(tmp_path, monkeypatch, capsys):
+    """--workers N은 프로세스 N개뿐이고, I/O 스레드 풀은 --io-workers로만 생긴다."""
+    _make_skill_dir(tmp_path, "alpha")
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"layer_weights": {"L1": 1.0}}), encoding="utf-8")
+    pools = []
+    real = orchestrator.ThreadPoolExecutor
+
+    def _recording(max_workers, **kwargs):
+        pools.append(max_workers)
+        return real(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(orchestrator, "ThreadPoolExecutor", _recording)
+    args = _make_args(tmp_path, config_path)
+    args.workers = 2
+    assert orchestrator.run(args) == 0
+    assert pools == []
+    args.io_workers = 3
+    assert orchestrator.run(args) == 0
+    assert pools == [3]
+    args.io_workers = 0
+    assert orchestrator.run(args) == 1
+    assert "--io-workers must be >= 1" in capsys.readouterr().err
+
+
+def _sleeping_layer(slow, seconds=5.0):
+    def _evaluate(skill, **kwargs):
+        if skill.name in slow:
+            time.sleep(seconds)
+        return _ok_layer_result(skill.name)
+    return _evaluate
+
+
+def test_run_layer_timeout_reports_timeout_and_continues(tmp_path, monkeypatch, capsys):
+    for name in ("hung-skill", "ok-skill"):
+        _make_skill_dir(tmp_path, name)
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"layer_weights": {"L1": 1.0}}), encoding="utf-8")
+    monkeypatch.setattr(orchestrator, "LAYERS", {"L1": _sleeping_layer({"hung-skill"})})
+    args = _make_args(tmp_path, config_path)
+    args.layer_timeout = 0.2
+
+    start = time.perf_counter()
+    assert orchestrator.run(args) == 0
+    assert time.perf_counter() - start < 3
+    captured = capsys.readouterr()
+    data = json.loads(captured.out)
+    by_name = {s["name"]: s["layers"]["L1"] for s in data["skills"]}
+    assert by_name["hung-skill"]["metrics"][0]["name"] == "timeout"
+    assert by_name["hung-skill"]["score"] == 0.0
+    assert by_name["ok-skill"]["score"] == 100.0
+    assert data["summary"]["error_count"] == 1
+    assert "LayerTimeoutError" in captured.err
+
+
+def test_skill_budget_times_out_remaining_layers_on_io_threads(tmp_path, monkeypatch):
+    for name in ("hung-skill", "ok-skill"):
+        _make_skill_dir(tmp_path, name)
+    monkeypatch.setattr(orchestrator, "LAYERS", {
+        "L1": _sleeping_layer({"hung-skill"}),
+        "L3": _sleeping_layer(set()),
+    })
+    monkeypatch.setattr(orchestrator, "_BUDGETS", (None, 0.2))
+
+    _, results = orchestrator._collect_results_streaming(
+        iter(discover_skills(tmp_path)), ["L1", "L3"], None, False, 1, io_threads=2,
+    )
+    hung = results["hung-skill"]
+    assert [hung[lid].metrics[0].name for lid in ("L1", "L3")] == ["timeout", "timeout"]
+    assert "exhausted" in hung["L3"].metrics[0].details
+    assert all(lr.overall_score == 100.0 for lr in results["ok-skill"].values())
+
+
+def test_skill_budget_is_shared_across_phases(tmp_path, monkeypatch):
+    """스킬 예산은 작업마다 새로 시작하지 않는다 — 1단계에서 쓴 시간만큼 2단계 몫이 준다."""
+    for name in ("slow-skill", "ok-skill"):
+        _make_skill_dir(tmp_path, name)
+    monkeypatch.setattr(orchestrator, "LAYERS", {
+        "L1": _sleeping_layer({"slow-skill"}, seconds=0.3),
+        "L2": _sleeping_layer({"slow-skill"}, seconds=0.3),
+    })
+    monkeypatch.setattr(orchestrator, "_BUDGETS", (None, 0.5))
+
+    _, results = orchestrator._collect_results_streaming(
+        iter(discover_skills(tmp_path)), ["L1", "L2"], None, False, 1,
+    )
+    slow = results["slow-skill"]
+    assert slow["L1"].overall_score == 100.0
+    assert slow["L2"].metrics[0].name == "timeout"
+    assert all(lr.overall_score == 100.0 for lr in results["ok-skill"].values())
+
+
+def test_timed_out_skill_is_not_cached(tmp_path, monkeypatch):
+    """시간 초과로 버린 스레드가 남은 스킬은 (같은 작업의 다른 레이어도) result_cache에 쓰지 않는다."""
+    root = tmp_path / "skills"
+    root.mkdir()
+    for name in ("hung-skill", "ok-skill"):
+        _make_skill_dir(root, name)
+    monkeypatch.setattr(orchestrator, "LAYERS", {
+        "L1": _sleeping_layer({"hung-skill"}, seconds=1.0),
+        "L3": _sleeping_layer(set()),
+    })
+    monkeypatch.setattr(orchestrator, "_BUDGETS", (0.1, None))
+    cache = ResultCache.load(tmp_path / "results.json")
+
+    orchestrator._collect_results_streaming(iter(discover_skills(root)), ["L1", "L3"], None, False, 1, cache)
+    skills = {s.name: s for s in discover_skills(root)}
+    assert [lid for lid in ("L1", "L3") if cache.lookup(skills["ok-skill"], lid)] == ["L1", "L3"]
+    assert [lid for lid in ("L1", "L3") if cache.lookup(skills["hung-skill"], lid)] == []
+
+
+def test_fail_fast_cancels_pending_work(tmp_path, monkeypatch):
+    for i in range(40):
+        _make_skill_dir(tmp_path, f"skill-{i:02d}")
+    calls = []
+
+    def _l1(skill, **kwargs):
+        calls.append(skill.name)
+        if skill.name == "skill-00":
+            raise RuntimeError("boom")
+        time.sleep(0.05)
+        return _ok_layer_result(skill.name)
+
+    monkeypatch.setattr(orchestrator, "LAYERS", {"L1": _l1})
+    start = time.perf_counter()
+    with pytest.raises(orchestrator.LayerEvaluationError):
+        orchestrator._collect_results_streaming(
+            iter(discover_skills(tmp_path)), ["L1"], None, True, 1, io_threads=2,
+        )
+    assert time.perf_counter() - start < 0.05 * 40 / 2
+    assert len(calls) < 40
+
+
+def test_sink_receives_results_without_retaining_them(tmp_path):
+    for name in ("alpha", "beta"):
+        _make_skill_dir(tmp_path, name)
+    received = []
+
+    skills, results = orchestrator._collect_results_streaming(
+        iter(discover_skills(tmp_path)), ["L1", "L2"], None, False, 1,
+        sink=lambda name, layers: received.append((name, sorted(layers))),
+    )
+    assert received == [("alpha", ["L1"]), ("beta", ["L1"]), ("alpha", ["L2"]), ("beta", ["L2"])]
+    assert results == {"alpha": {}, "beta": {}}
+    # 스킬 단위 레이어가 끝난 스킬은 문서/코퍼스를 놓는다 (L2와 ecosystem은 필요한 만큼 다시 읽음)
+    assert all(s.document is None and s.corpus is None for s in skills)
+
+
+def test_released_skills_still_resolve_pipeline_targets(tmp_path, monkeypatch, capsys):
+    for name in ("alpha", "beta"):
+        _make_skill_dir(tmp_path, name)
+    (tmp_path / "alpha" / "SKILL.md").write_text(
+        "---\nname: alpha\ndescription: test\n---\n## Pipeline\n\n결과를 beta로 넘긴다.\n", encoding="utf-8",
+    )
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"layer_weights": {"L1": 1.0}}), encoding="utf-8")
+    args = _make_args(tmp_path, config_path)
+    args.format = "jsonl"
+    args.ecosystem = True
+    captured = []
+    real = orchestrator.evaluate_ecosystem
+
+    def _capture(skills):
+        captured.extend((s.name, s.pipeline_targets) for s in skills)
+        return real(skills)
+
+    monkeypatch.setattr(orchestrator, "evaluate_ecosystem", _capture)
+    assert orchestrator.run(args) == 0
+    assert captured == [("alpha", ["beta"]), ("beta", [])]
+
+
+def test_ecosystem_keeps_skill_text_until_it_runs(tmp_path, monkeypatch, capsys):
+    for name in ("alpha", "beta"):
+        _make_skill_dir(tmp_path, name)
+        (tmp_path / name / "scripts").mkdir()
+        (tmp_path / name / "scripts" / "main.py").write_text("import sys\n", encoding="utf-8")
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"layer_weights": {"L1": 0.5, "L6": 0.5}}), encoding="utf-8")
+    args = _make_args(tmp_path, config_path)
+    args.layer = "L1,L6"
+    args.ecosystem = True
+    monkeypatch.setattr(orchestrator, "_RELEASE_TEXT", True)
+    held = []
+    real = orchestrator.evaluate_ecosystem
+
+    def _capture(skills):
+        held.extend(s.document is not None and s.corpus is not None for s in skills)
+        return real(skills)
+
+    monkeypatch.setattr(orchestrator, "evaluate_ecosystem", _capture)
+    assert orchestrator.run(args) == 0
+    # json 리포트 + --ecosystem: 평가가 끝난 뒤에도 문서/코퍼스를 놓지 않아 다시 읽지 않는다
+    assert held == [True, True]
+
+    held.clear()
+    args.format = "jsonl"
+    assert orchestrator.run(args) == 0
+    # jsonl 스트리밍은 놓고 ecosystem에서 다시 읽는다
+    assert held == [False, False]
+
+
+def test_run_jsonl_ci_mode_uses_streamed_weighted_scores(tmp_path, capsys):
+    for name in ("alpha", "beta"):
+        _make_skill_dir(tmp_path, name)
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"layer_weights": {"L1": 1.0}}), encoding="utf-8")
+    args = _make_args(tmp_path, config_path)
+    args.format = "jsonl"
+    args.ci_mode = True
+    args.threshold = 101
+    assert orchestrator.run(args) == 1
+    err = capsys.readouterr().err
+    assert "CI FAILED: 2 skill(s) below 101" in err
+    assert err.index("alpha:") < err.index("beta:")
+
+
+def test_run_jsonl_streams_records_and_matches_json(tmp_path, capsys):
+    for name in ("alpha", "beta"):
+        _make_skill_dir(tmp_path, name)
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"layer_weights": {"L1": 0.5, "L2": 0.5}}), encoding="utf-8")
+    args = _make_args(tmp_path, config_path)
+    args.layer = "L1,L2"
+    args.ecosystem = True
+    assert orchestrator.run(args) == 0
+    expected = json.loads(capsys.readouterr().out)
+
+    args.format = "jsonl"
+    args.output = tmp_path / "out" / "report.jsonl"
+    assert orchestrator.run(args) == 0
+    assert "Saved to" in capsys.readouterr().out
+    records = [json.loads(line) for line in args.output.read_text(encoding="utf-8").splitlines()]
+
+    assert [r["type"] for r in records[-2:]] == ["ecosystem", "summary"]
+    merged = {}
+    for record in records[:-2]:
+        assert record["type"] == "skill"
+        entry = merged.setdefault(record["name"], {"name": record["name"], "layers": {}})
+        entry["layers"].update(record["layers"])
+        if "weighted_score" in record:
+            entry["weighted_score"] = record["weighted_score"]
+    assert [merged[s["name"]] for s in expected["skills"]] == expected["skills"]
+    assert records[-2] == {"type": "ecosystem", **expected["ecosystem"]}
+    assert {k: v for k, v in records[-1].items() if k not in ("type", "timestamp")} == expected["summary"]
@@ -1,10 +1,11 @@
-"""reporter.py 단위 테스트 — format_text, format_json, format_markdown, weighted_score."""
+"""reporter.py 단위 테스트 — format_text, format_json, format_markdown, JsonlWriter, weighted_score."""
 
+import io
 import json
 import pytest
 
 from models import MetricResult, LayerResult, EcosystemMetric, EcosystemResult
-from reporter import format_text, format_json, format_markdown
+from reporter import JsonlWriter, format_text, format_json, format_markdown
 from score_utils import weighted_score
 
 
@@ -242,6 +243,63 @@ class TestFormatJson:
         assert data["summary"]["error_count"] == 1
 
 
+# ──────────────────────────────────────────────
+# JsonlWriter
+# ──────────────────────────────────────────────
+
+class TestJsonlWriter:
+
+    def _records(self, stream):
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    def test_partial_records_then_ecosystem_and_summary(self):
+        results = _make_results_multi_layer()
+        layers = results["alpha"]
+        stream = io.StringIO()
+        writer = JsonlWriter(stream, ["L1", "L4"])
+        writer.write_layers("alpha", {"L4": layers["L4"]})
+        writer.write_layers("alpha", {"L1": layers["L1"]})
+        writer.finish(_make_ecosystem())
+
+        records = self._records(stream)
+        assert [r["type"] for r in records] == ["skill", "skill", "ecosystem", "summary"]
+        assert "weighted_score" not in records[0]
+
+        expected = json.loads(format_json(results, ecosystem_result=_make_ecosystem()))
+        skill = expected["skills"][0]
+        assert records[0]["layers"]["L4"] == skill["layers"]["L4"]
+        assert records[1]["layers"]["L1"] == skill["layers"]["L1"]
+        assert records[1]["weighted_score"] == skill["weighted_score"]
+        assert records[2]["overall_score"] == expected["ecosystem"]["overall_score"]
+        summary = {k: v for k, v in records[3].items() if k not in ("type", "timestamp")}
+        assert summary == expected["summary"]
+
+    def test_keeps_weighted_score_only(self):
+        results = _make_results_multi_layer()
+        writer = JsonlWriter(io.StringIO(), ["L1", "L4"])
+        writer.write_layers("alpha", {"L1": results["alpha"]["L1"]})
+        writer.write_layers("alpha", {"L4": results["alpha"]["L4"]})
+        assert writer.weighted == {"alpha": weighted_score(results["alpha"])}
+        assert writer._partial == {}
+        with pytest.raises(ValueError):
+            writer.score_results()
+
+    def test_keep_scores_for_history(self):
+        writer = JsonlWriter(io.StringIO(), ["L1"], keep_scores=True)
+        writer.write_layers("test-skill", {"L1": _make_layer_result()})
+        kept = writer.score_results()["test-skill"]["L1"]
+        assert kept.overall_score == 75.0
+        assert kept.metrics == []
+
+    def test_finish_scores_incomplete_skills(self):
+        stream = io.StringIO()
+        writer = JsonlWriter(stream, ["L1", "L4"])
+        writer.write_layers("test-skill", {"L1": _make_layer_result()})
+        writer.finish()
+        assert writer.weighted == {"test-skill": 75.0}
+        assert self._records(stream)[-1]["weighted_average"] == 75.0
+
+
 # ──────────────────────────────────────────────
 # format_markdown
 # ──────────────────────────────────────────────
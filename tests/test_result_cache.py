@@ -0,0 +1,166 @@
+"""result_cache.py 단위 테스트."""
+
+import json
+import os
+import shutil
+
+import pytest
+
+import orchestrator
+from discovery import parse_skill_md
+from helpers import make_skill
+from models import LayerResult, MetricResult
+from orchestrator import run
+from result_cache import ResultCache, content_fingerprint, result_from_dict, result_to_dict
+from test_orchestrator import _make_args
+
+
+def _layer_result(skill_name, score=1.0, metric="m"):
+    lr = LayerResult(layer="L1", skill_name=skill_name)
+    lr.metrics = [MetricResult(name=metric, score=score, max_score=1.0, details="상세", passed=True)]
+    lr.compute_score()
+    lr.recommendations.append("권장")
+    return lr
+
+
+class TestSerialization:
+
+    def test_roundtrip(self):
+        lr = _layer_result("s", score=0.3)
+        assert result_from_dict(json.loads(json.dumps(result_to_dict(lr)))) == lr
+
+
+class TestContentFingerprint:
+
+    def test_ignores_mtime_and_parent_path(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        skill = make_skill(tmp_path / "a", name="fp-skill", script_contents={"main.py": "x = 1\n"})
+        copy_dir = tmp_path / "b" / "fp-skill"
+        shutil.copytree(skill.skill_path, copy_dir)
+        os.utime(copy_dir / "scripts" / "main.py", (0, 0))
+        assert content_fingerprint(parse_skill_md(copy_dir)) == content_fingerprint(skill)
+
+    def test_changes_with_content_and_dir_name(self, tmp_path):
+        skill = make_skill(tmp_path, name="fp-skill", script_contents={"main.py": "x = 1\n"})
+        before = content_fingerprint(skill)
+        renamed = tmp_path / "other-name"
+        shutil.copytree(skill.skill_path, renamed)
+        assert content_fingerprint(parse_skill_md(renamed)) != before
+
+        (skill.skill_path / "scripts" / "main.py").write_text("x = 2\n", encoding="utf-8")
+        assert content_fingerprint(parse_skill_md(skill.skill_path)) != before
+
+
+class TestResultCache:
+
+    def test_persists_and_skips_error_results(self, tmp_path):
+        path = tmp_path / "reports" / "result_cache.json"
+        skill = make_skill(tmp_path, name="cache-skill")
+        cache = ResultCache.load(path)
+        assert cache.lookup(skill, "L1") is None
+        assert cache.lookup(skill, "L3") is None
+        cache.store(skill, "L1", _layer_result(skill.name))
+        cache.store(skill, "L3", _layer_result(skill.name, metric="runtime_error"))
+        assert cache.lookup(skill, "L4") is None
+        cache.store(skill, "L4", _layer_result(skill.name, metric="timeout"))
+        cache.save()
+
+        reopened = ResultCache.load(path)
+        assert reopened.lookup(skill, "L1") == _layer_result(skill.name)
+        assert reopened.lookup(skill, "L3") is None
+        assert reopened.lookup(skill, "L4") is None
+
+    def test_settings_and_evaluator_version_change_key(self, tmp_path):
+        skill = make_skill(tmp_path, name="cache-skill")
+        base = ResultCache(tmp_path / "c.json", evaluator_version="v1")
+        assert base.key(skill, "L1") != ResultCache(tmp_path / "c.json", evaluator_version="v2").key(skill, "L1")
+        capped = ResultCache(tmp_path / "c.json", evaluator_version="v1", settings={"max_file_size": 1})
+        assert base.key(skill, "L1") != capped.key(skill, "L1")
+        assert base.key(skill, "L1") != base.key(skill, "L1", context="other skills")
+
+    def test_benchmark_entry_scopes_key(self, tmp_path):
+        bench_dir = tmp_path / "benchmarks"
+        (bench_dir / "L2_activation").mkdir(parents=True)
+        bench_file = bench_dir / "L2_activation" / "trigger_queries.json"
+        bench_file.write_text(json.dumps({"a": {"positive": ["q"]}}), encoding="utf-8")
+        a = make_skill(tmp_path, name="a")
+        b = make_skill(tmp_path, name="b")
+        pairs = [(a, "L1"), (a, "L2"), (b, "L1"), (b, "L2")]
+        before = ResultCache(tmp_path / "c.json")
+        keys = [before.key(s, lid, bench_dir) for s, lid in pairs]
+
+        bench_file.write_text(json.dumps({"a": {"positive": ["q2"]}}), encoding="utf-8")
+        after = ResultCache(tmp_path / "c.json")
+        changed = [after.key(s, lid, bench_dir) != k for (s, lid), k in zip(pairs, keys)]
+        assert changed == [False, True, False, False]
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        path = tmp_path / "c.json"
+        skills = [make_skill(tmp_path, name=f"s{i}") for i in range(3)]
+        cache = ResultCache.load(path)
+        for skill in skills[:2]:
+            cache.lookup(skill, "L1")
+            cache.store(skill, "L1", _layer_result(skill.name))
+        cache.save()
+
+        cache = ResultCache.load(path)
+        cache.max_entries = 2
+        cache.lookup(skills[2], "L1")
+        cache.store(skills[2], "L1", _layer_result(skills[2].name))
+        assert cache.lookup(skills[0], "L1") is not None
+        cache.save()
+
+        reopened = ResultCache.load(path)
+        assert [reopened.lookup(s, "L1") is not None for s in skills] == [True, False, True]
+
+
+class TestOrchestratorResultCache:
+
+    def _setup(self, tmp_path):
+        root = tmp_path / "skills"
+        root.mkdir()
+        make_skill(root, name="alpha", triggers=["배포 자동화", "롤백"])
+        make_skill(root, name="beta", triggers=["모니터링"])
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"layer_weights": {"L1": 0.5, "L2": 0.5}}), encoding="utf-8")
+        args = _make_args(root, config_path)
+        args.layer = "L1,L2"
+        args.result_cache = tmp_path / "reports" / "result_cache.json"
+        return root, args
+
+    def test_unchanged_tree_skips_evaluation(self, tmp_path, monkeypatch, capsys):
+        _, args = self._setup(tmp_path)
+        assert run(args) == 0
+        first = json.loads(capsys.readouterr().out)["skills"]
+
+        def _fail(skill, **kwargs):
+            pytest.fail(f"evaluated {skill.name}")
+
+        monkeypatch.setattr(orchestrator, "LAYERS", {"L1": _fail, "L2": _fail})
+        assert run(args) == 0
+        assert json.loads(capsys.readouterr().out)["skills"] == first
+
+    def test_new_overlapping_skill_invalidates_cross_skill_layer(self, tmp_path, monkeypatch, capsys):
+        root, args = self._setup(tmp_path)
+        assert run(args) == 0
+        capsys.readouterr()
+
+        make_skill(root, name="gamma", triggers=["롤백"])
+        evaluated = []
+        layers = dict(orchestrator.LAYERS)
+
+        def _tracking(lid):
+            def _evaluate(skill, **kwargs):
+                evaluated.append((skill.name, lid))
+                return layers[lid](skill, **kwargs)
+            return _evaluate
+
+        monkeypatch.setattr(orchestrator, "LAYERS", {lid: _tracking(lid) for lid in layers})
+        assert run(args) == 0
+        out = json.loads(capsys.readouterr().out)["skills"]
+        assert sorted(evaluated) == [
+            ("alpha", "L2"), ("beta", "L2"), ("gamma", "L1"), ("gamma", "L2"),
+        ]
+        alpha = next(s for s in out if s["name"] == "alpha")
+        overlap = next(m for m in alpha["layers"]["L2"]["metrics"] if m["name"] == "trigger_overlap")
+        assert "gamma" in overlap["details"]
@@ -0,0 +1,107 @@
+"""scheduler.py 단위 테스트."""
+
+import json
+
+from helpers import make_skill
+from orchestrator import run
+from scheduler import MAX_IO_THREADS, CostModel, auto_workers, plan_units
+from test_orchestrator import _make_args
+
+
+_BIG_SCRIPT = "x = 1\n" * 20_000
+
+
+class TestCostModel:
+
+    def test_heuristic_scales_with_layer_inputs(self, tmp_path):
+        small = make_skill(tmp_path, name="small", script_contents={"a.py": "x = 1\n"})
+        big = make_skill(tmp_path, name="big", script_contents={"a.py": _BIG_SCRIPT})
+        model = CostModel()
+        assert model.predict(big, "L5") > model.predict(small, "L5")
+        assert model.predict(big, "L5") > model.predict(big, "L4")
+
+    def test_recorded_duration_wins_and_persists(self, tmp_path):
+        skill = make_skill(tmp_path, name="timed")
+        path = tmp_path / "reports" / "layer_timings.json"
+        model = CostModel.load(path)
+        model.record("timed", {"L1": 1.5})
+        model.save()
+
+        reloaded = CostModel.load(path)
+        assert reloaded.predict(skill, "L1") == 1.5
+        assert reloaded.predict(skill, "L3") < 1.5
+
+    def test_no_path_keeps_no_per_skill_records(self):
+        model = CostModel()
+        model.record("a", {"L1": 1.0, "L3": 2.0}, {"L1": 0.5, "L3": 1.0})
+        assert model.timings == {}
+        assert model.observed_io_wait() == 0.5
+
+    def test_io_wait_from_io_layer_cpu_times_persists(self, tmp_path):
+        path = tmp_path / "layer_timings.json"
+        model = CostModel.load(path)
+        model.record("a", {"L1": 1.0, "L5": 2.0}, {"L1": 0.25, "L5": 2.0})  # L5(CPU)는 제외
+        model.record("b", {"L3": 1.0}, {"L3": 0.75})
+        assert model.observed_io_wait() == 0.5
+        model.save()
+        assert CostModel.load(path).io_wait == 0.5
+
+    def test_unreadable_file_is_empty(self, tmp_path):
+        path = tmp_path / "layer_timings.json"
+        path.write_text("{broken", encoding="utf-8")
+        assert CostModel.load(path).timings == {}
+
+
+class TestPlanUnits:
+
+    def test_splits_skewed_skill_and_orders_longest_first(self, tmp_path):
+        skills = [make_skill(tmp_path, name=f"s{i}") for i in range(4)]
+        model = CostModel(timings={
+            "s0": {"L1": 0.1, "L5": 0.1},
+            "s1": {"L1": 0.2, "L5": 0.1},
+            "s2": {"L1": 3.0, "L5": 5.0},
+            "s3": {"L1": 0.1, "L5": 0.3},
+        })
+        units = plan_units([(s, ["L1", "L5"]) for s in skills], workers=2, cost_model=model)
+        assert [(s.name, layers) for s, layers in units] == [
+            ("s2", ["L5"]), ("s2", ["L1"]), ("s3", ["L1", "L5"]), ("s1", ["L1", "L5"]), ("s0", ["L1", "L5"]),
+        ]
+
+    def test_single_layer_skill_is_not_split(self, tmp_path):
+        skill = make_skill(tmp_path, name="only")
+        model = CostModel(timings={"only": {"L1": 9.0}})
+        assert [(s.name, l) for s, l in plan_units([(skill, ["L1"])], 4, model)] == [("only", ["L1"])]
+
+
+class TestAutoWorkers:
+
+    def test_threads_scale_with_io_wait(self):
+        assert auto_workers(0.0, cpu_count=4) == (4, 4)
+        assert auto_workers(0.5, cpu_count=4) == (4, 8)
+        assert auto_workers(0.75, cpu_count=4) == (4, 16)
+
+    def test_thread_count_is_capped(self):
+        assert auto_workers(1.0, cpu_count=16) == (16, MAX_IO_THREADS)
+
+
+class TestOrchestratorScheduling:
+
+    def test_records_timings_and_matches_sequential(self, tmp_path, capsys):
+        root = tmp_path / "skills"
+        root.mkdir()
+        make_skill(root, name="huge", script_contents={"main.py": _BIG_SCRIPT})
+        for i in range(5):
+            make_skill(root, name=f"tiny-{i}", script_contents={"main.py": '"""doc."""\n'})
+        args = _make_args(root, tmp_path / "missing-config.json")
+        args.layer = None
+        args.layer_timings = tmp_path / "reports" / "layer_timings.json"
+
+        assert run(args) == 0
+        sequential = json.loads(capsys.readouterr().out)["skills"]
+        timings = json.loads(args.layer_timings.read_text(encoding="utf-8"))["timings"]
+        assert set(timings) == {"huge"} | {f"tiny-{i}" for i in range(5)}
+        assert set(timings["huge"]) == {"L1", "L2", "L3", "L4", "L5", "L6"}
+
+        args.workers = 2
+        assert run(args) == 0
+        assert json.loads(capsys.readouterr().out)["skills"] == sequential
@@ -0,0 +1,123 @@
+"""script_corpus.py 단위 테스트."""
+
+import mmap
+import pickle
+
+import pytest
+
+import file_access
+from evaluators import l1_structural, l5_execution, l6_validation
+from evaluators.base import get_corpus
+from evaluators.ecosystem import check_cli_consistency
+from file_access import set_max_file_size
+from helpers import make_skill
+from inventory import SkillInventory, build_inventory
+from script_corpus import ScriptCorpus
+
+
+SCRIPT = (
+    '#!/usr/bin/env python3\n"""도구."""\nimport argparse\n\n\n'
+    "def main(argv: list) -> int:\n"
+    '    """진입점."""\n'
+    "    parser = argparse.ArgumentParser()\n"
+    "    parser.add_argument('--format')\n"
+    "    return 0\n"
+)
+
+
+@pytest.fixture
+def read_counter(monkeypatch):
+    """SkillInventory.read_bytes 호출을 파일별로 센다."""
+    counts = {}
+    original = SkillInventory.read_bytes
+
+    def counting(self, entry):
+        rel = getattr(entry, "rel_path", entry)
+        counts[rel] = counts.get(rel, 0) + 1
+        return original(self, entry)
+
+    monkeypatch.setattr(SkillInventory, "read_bytes", counting)
+    return counts
+
+
+class TestScriptFile:
+
+    def test_content_line_index_and_features(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={"tool.py": SCRIPT})
+        script = get_corpus(skill).files()[0]
+        assert script.name == "tool.py"
+        assert script.content == SCRIPT
+        assert script.line_of(0) == 1
+        assert script.line_of(SCRIPT.index("def main")) == 6
+        assert script.features is script.features
+        assert [f.name for f in script.features.functions] == ["main"]
+
+    def test_release_drops_content_and_reloads_lazily(self, tmp_path, read_counter):
+        skill = make_skill(tmp_path, script_contents={"tool.py": SCRIPT})
+        corpus = get_corpus(skill)
+        script = corpus.files()[0]
+        assert script.features is not None
+        corpus.release()
+        assert not script.loaded
+        assert script._features is not None  # 지연 로드 표식
+        assert script.content == SCRIPT
+        assert read_counter["scripts/tool.py"] == 2
+
+    def test_syntax_error_has_no_features(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={"bad.py": "def (:\n"})
+        script = get_corpus(skill).files()[0]
+        assert script.content == "def (:\n"
+        assert script.features is None
+
+    def test_undecodable_file_is_skipped(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={"ok.py": SCRIPT})
+        (skill.skill_path / "scripts" / "latin.py").write_bytes(b"# caf\xe9\n")
+        corpus = ScriptCorpus(build_inventory(skill.skill_path))
+        assert [f.name for f in corpus.files()] == ["latin.py", "ok.py"]
+        assert [f.name for f in corpus.texts()] == ["ok.py"]
+
+    def test_skip_init(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={"__init__.py": "", "a.py": "x = 1\n"})
+        corpus = get_corpus(skill)
+        assert [f.name for f in corpus.files()] == ["a.py"]
+        assert [f.name for f in corpus.files(skip_init=False)] == ["__init__.py", "a.py"]
+
+
+class TestScriptCorpus:
+
+    def test_each_file_read_once_across_layers(self, tmp_path, read_counter):
+        skill = make_skill(tmp_path, script_contents={"tool.py": SCRIPT, "util.py": "import sys\n"})
+        l1_structural.evaluate(skill)
+        l5_execution.evaluate(skill)
+        l6_validation.evaluate(skill)
+        check_cli_consistency([skill])
+        script_reads = {rel: n for rel, n in read_counter.items() if rel.startswith("scripts/")}
+        assert script_reads == {"scripts/tool.py": 1, "scripts/util.py": 1}
+
+    def test_pickle_drops_loaded_content(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={"tool.py": SCRIPT})
+        corpus = get_corpus(skill)
+        assert corpus.files()[0].content == SCRIPT
+        restored = pickle.loads(pickle.dumps(skill)).corpus
+        assert not restored.files()[0].loaded
+        assert restored.files()[0].content == SCRIPT
+
+    def test_capped_files_are_not_loaded(self, tmp_path):
+        skill = make_skill(tmp_path, script_contents={"tool.py": SCRIPT, "big.py": "#" * 4096})
+        set_max_file_size(1024)
+        try:
+            corpus = ScriptCorpus(skill.inventory)
+        finally:
+            set_max_file_size(file_access.DEFAULT_MAX_FILE_SIZE)
+        assert [f.name for f in corpus.files()] == ["tool.py"]
+        assert [e.name for e in corpus.capped()] == ["big.py"]
+
+    def test_buffers_mmap_only_unread_large_files(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(file_access, "MMAP_THRESHOLD", 64)
+        skill = make_skill(tmp_path, script_contents={"tool.py": SCRIPT})
+        corpus = get_corpus(skill)
+        kinds = [type(buf) for _, buf in corpus.buffers()]
+        assert kinds == [mmap.mmap]
+        corpus.files()[0].content
+        kinds = [type(buf) for _, buf in corpus.buffers()]
+        assert kinds == [str]
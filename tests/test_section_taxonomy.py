@@ -0,0 +1,50 @@
+"""section_taxonomy.py 단위 테스트."""
+
+import pickle
+
+from discovery import discover_skills
+from eval_config import DEFAULT_SECTION_TAXONOMY
+from helpers import make_skill
+from section_taxonomy import DEFAULT_TAXONOMY, SectionTaxonomy
+
+
+class TestSectionTaxonomy:
+
+    def test_header_can_belong_to_several_categories(self):
+        assert DEFAULT_TAXONOMY.classify("CLI 옵션 및 설치 환경") == ["cli_options", "prerequisites"]
+        assert DEFAULT_TAXONOMY.classify("Overview") == []
+
+    def test_case_insensitive(self):
+        assert DEFAULT_TAXONOMY.classify("QUICK START") == ["quick_start"]
+
+    def test_flags_cover_every_category(self):
+        flags = DEFAULT_TAXONOMY.flags(["보안 주의사항", "Overview"])
+        assert set(flags) == {f"has_{name}" for name in DEFAULT_SECTION_TAXONOMY}
+        assert flags["has_security_notes"] is True
+        assert flags["has_performance_notes"] is False
+
+    def test_pattern_list(self):
+        taxonomy = SectionTaxonomy({"faq": ["faq", "자주\\s*묻는"]})
+        assert taxonomy.flags(["자주 묻는 질문"]) == {"has_faq": True}
+
+    def test_picklable(self):
+        taxonomy = SectionTaxonomy({"faq": "faq"})
+        assert pickle.loads(pickle.dumps(taxonomy)) == taxonomy
+
+
+class TestSectionFlagsInDiscovery:
+
+    def test_custom_category_appears_as_flag(self, tmp_path):
+        make_skill(tmp_path, name="alpha", skill_md_body="## When to Use\n- x\n\n## 문제 해결\n- y\n")
+        taxonomy = SectionTaxonomy({**DEFAULT_SECTION_TAXONOMY, "troubleshooting": "문제\\s*해결"})
+        skill = discover_skills(tmp_path, taxonomy=taxonomy)[0]
+        assert skill.section_flags["has_troubleshooting"] is True
+        assert skill.section_flags["has_when_to_use"] is True
+        assert skill.has_when_to_use is True
+
+    def test_default_taxonomy_matches_builtin_fields(self, tmp_path):
+        make_skill(tmp_path, name="alpha", skill_md_body="## Quick Start\n1. run\n")
+        skill = discover_skills(tmp_path)[0]
+        assert skill.has_quick_start is True
+        assert skill.section_flags["has_quick_start"] is True
+        assert skill.has_when_to_use is False
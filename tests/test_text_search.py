@@ -0,0 +1,34 @@
+"""text_search.py 단위 테스트 — Aho-Corasick 다중 패턴 탐색."""
+
+from text_search import AhoCorasick
+
+
+class TestAhoCorasick:
+
+    def test_finds_all_patterns(self):
+        ac = AhoCorasick(["he", "she", "his", "hers"])
+        assert ac.find_all("ushers") == {0, 1, 3}
+
+    def test_no_match(self):
+        ac = AhoCorasick(["alpha", "beta"])
+        assert ac.find_all("gamma delta") == set()
+
+    def test_overlapping_and_nested_patterns(self):
+        """한 패턴이 다른 패턴의 접미사일 때도 모두 탐지."""
+        ac = AhoCorasick(["skill-a", "a", "ll-a"])
+        assert ac.find_all("my skill-a here") == {0, 1, 2}
+
+    def test_empty_patterns_ignored(self):
+        ac = AhoCorasick(["", "x"])
+        assert ac.find_all("xyz") == {1}
+
+    def test_matches_naive_substring_search(self):
+        """부분 문자열 in 검사와 결과가 동일해야 한다."""
+        patterns = ["depsolve", "depsolve-analyzer", "cot", "troubleshooting-cot", "lint"]
+        text = "pipeline: troubleshooting-cot → depsolve-analyzer"
+        expected = {i for i, p in enumerate(patterns) if p in text}
+        assert AhoCorasick(patterns).find_all(text) == expected
+
+    def test_unicode_patterns(self):
+        ac = AhoCorasick(["트리거", "분석"])
+        assert ac.find_all("의존성 분석 도구") == {1}